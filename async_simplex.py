@@ -0,0 +1,98 @@
+"""
+This file contains an asyncio interface to the simplex method, which allows
+many concurrent solves without blocking the event loop.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from simplex import (
+    Mode,
+    Status,
+    get_solution,
+    is_feasible,
+    iterate_simplex,
+    run_simplex,
+    unbounded_solution,
+)
+
+
+PIVOTS_PER_YIELD = 16
+
+
+async def solve(
+        tableau: list[list[float]],
+        mode = Mode.MAXIMIZATION,
+        deadline: float | None = None,
+        pivots_per_yield: int = PIVOTS_PER_YIELD,
+        executor = None,
+) -> tuple[Status, list[float] | None, float | None]:
+    """
+    Solves the given tableau and returns the final status together with the
+    solution in the same form as `perform_simplex`.
+
+    By default, pivoting runs on the event loop, which is given back every
+    `pivots_per_yield` pivots. If an `executor` is given, pivoting runs there
+    instead. Cancelling the task stops pivoting at the next pivot in either
+    case. The executor has to run the solve in this process (e.g. a
+    `ThreadPoolExecutor`), since the tableau is updated in place and the
+    solve is cancelled through a `threading.Event`; ValueError is raised for
+    a `ProcessPoolExecutor`.
+
+    Once `time.monotonic()` reaches the `deadline`, the solve stops with
+    `Status.TIME_LIMIT` and the vertex reached so far, which is not
+    necessarily optimal. If the deadline passes before a feasible vertex is
+    found (e.g. for a problem with `>=` constraints), None is returned in
+    place of the solution and its value.
+    """
+
+    if isinstance(executor, ProcessPoolExecutor):
+        raise ValueError("The solve cannot run in a process pool executor")
+
+    if executor is None:
+        status = await _solve_cooperatively(tableau, deadline, pivots_per_yield)
+    else:
+        status = await _solve_in_executor(tableau, deadline, executor)
+
+    if status in (Status.UNBOUNDED, Status.INFEASIBLE):
+        return (status, *unbounded_solution(tableau))
+    if not is_feasible(tableau):
+        return status, None, None
+    return (status, *get_solution(tableau, mode))
+
+
+async def _solve_cooperatively(tableau, deadline, pivots_per_yield):
+    # Printing the pivots would block the event loop.
+    steps = iterate_simplex(tableau, trace=False)
+    pivot_count = 0
+
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+        pivot_count += 1
+        if deadline is not None and time.monotonic() >= deadline:
+            return Status.TIME_LIMIT
+        if pivot_count % pivots_per_yield == 0:
+            await asyncio.sleep(0)
+
+
+async def _solve_in_executor(tableau, deadline, executor):
+    loop = asyncio.get_running_loop()
+    cancel = threading.Event()
+
+    try:
+        return await loop.run_in_executor(
+            executor,
+            functools.partial(run_simplex, tableau, deadline, cancel, trace=False),
+        )
+    except asyncio.CancelledError:
+        # The executor cannot interrupt a running call, so stop the pivot
+        # loop itself.
+        cancel.set()
+        raise
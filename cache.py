@@ -0,0 +1,195 @@
+"""
+This file contains a result cache for linear programming problems. Problems
+are keyed by a canonical hash, so that the same problem given with another
+constraint order or with slightly different float formatting is solved only
+once.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+from simplex import Mode, apply_inequalities, solve_problem
+
+
+SIGNIFICANT_DIGITS = 12
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    disk_hits: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def _canonical_float(x: float) -> float:
+    # Adding 0.0 turns -0.0 into 0.0.
+    return float(f"{x:.{SIGNIFICANT_DIGITS}g}") + 0.0
+
+
+def canonical_key(
+        goal_function: list[float],
+        constraints: list[list[float]],
+        inequalities: list[str] | None = None,
+        mode = Mode.MAXIMIZATION,
+) -> str:
+    """
+    Returns a hash of the given problem, which does not depend on the order of
+    the constraints nor on differences beyond `SIGNIFICANT_DIGITS` significant
+    digits of the coefficients. Constraints are compared in their `<=` form,
+    so e.g. `x1 >= 2` and `-x1 <= -2` are the same constraint.
+    """
+
+    if inequalities is not None:
+        constraints = apply_inequalities(constraints, inequalities)
+
+    rows = sorted(
+        tuple(_canonical_float(x) for x in constraint)
+            for constraint in constraints
+    )
+    goal = tuple(_canonical_float(x) for x in goal_function)
+    mode_str = "max" if mode == Mode.MAXIMIZATION else "min"
+
+    return hashlib.sha256(repr((mode_str, goal, rows)).encode()).hexdigest()
+
+
+class SolveCache:
+    """
+    An LRU cache of solutions holding up to `maxsize` entries in memory. If
+    `path` is given, every solution is also stored as a file in that
+    directory, which serves as a second, unbounded tier shared between runs.
+    """
+
+    def __init__(self, maxsize: int = 128, path: str | None = None):
+        self.maxsize = maxsize
+        self.path = path
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._disk_hits = 0
+        self._evictions = 0
+
+
+    def get(self, key: str) -> tuple[list[float], float] | None:
+        """
+        Returns the cached solution for the given key or None if there is no
+        such solution.
+        """
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                solution, value = self._entries[key]
+                return list(solution), value
+
+        result = self._read(key)
+
+        with self._lock:
+            if result is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._disk_hits += 1
+                self._insert(key, result)
+                result = list(result[0]), result[1]
+
+        return result
+
+
+    def put(self, key: str, result: tuple[list[float], float]):
+        with self._lock:
+            self._insert(key, result)
+        self._write(key, result)
+
+
+    def solve(
+            self,
+            goal_function: list[float],
+            constraints: list[list[float]],
+            inequalities: list[str] | None = None,
+            mode = Mode.MAXIMIZATION,
+    ) -> tuple[list[float], float]:
+        """
+        Returns the solution of the given problem in the same form as
+        `solve_problem`, solving it only if it is not cached yet.
+        """
+
+        key = canonical_key(goal_function, constraints, inequalities, mode)
+
+        result = self.get(key)
+        if result is None:
+            result = solve_problem(goal_function, constraints, inequalities, mode)
+            self.put(key, result)
+            # The cached solution must not be shared with the caller.
+            result = list(result[0]), result[1]
+
+        return result
+
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._disk_hits,
+                self._evictions,
+                self.maxsize,
+                len(self._entries),
+            )
+
+
+    def clear(self):
+        """
+        Removes all entries from the memory tier and resets the statistics.
+        The disk tier is left intact.
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._disk_hits = self._evictions = 0
+
+
+    def _insert(self, key, result):
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+
+    def _file_path(self, key):
+        return os.path.join(self.path, key + ".json")
+
+
+    def _read(self, key):
+        if self.path is None: return None
+
+        try:
+            with open(self._file_path(key)) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        return data["solution"], data["value"]
+
+
+    def _write(self, key, result):
+        if self.path is None: return
+
+        # Write to a temporary file first, so that concurrent readers never
+        # see a partially written entry.
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, 'w') as f:
+            json.dump({"solution": result[0], "value": result[1]}, f)
+        os.replace(tmp_path, self._file_path(key))
@@ -0,0 +1,217 @@
+"""
+This file contains checkpointing of long-running solves. The state of the
+simplex method is periodically written to a compact binary file, from which
+an interrupted solve can be resumed.
+
+A checkpoint file consists of a header, the basis (one int64 per constraint
+row, -1 for rows without a basic column) and the tableau as row-major floats
+of the precision of the tableau (doubles for lists of lists). It is written
+through a memory map, so large tableaux are streamed to the file row by row,
+and it replaces the previous checkpoint atomically.
+
+The original tableau is not stored, so a resumed solve checks its residuals
+(see `iterate_simplex`) against the checkpointed tableau. They then only
+guard against the rounding errors accumulated since the checkpoint, and a
+refactorization rebuilds the tableau from the checkpointed one rather than
+from the original problem.
+"""
+
+import mmap
+import os
+import struct
+import time
+from array import array
+from typing import NamedTuple
+
+from simplex import (
+    DEFAULT_TOLERANCES,
+    Status,
+    Tableau,
+    get_basis,
+    is_feasible,
+    iterate_simplex,
+)
+
+
+MAGIC = b'SPXC'
+VERSION = 2
+# magic, version, phase, height, width, pivot count, typecode
+HEADER = struct.Struct('<4sHHIIQc')
+
+# The dual simplex method restores feasibility, the primal one optimality.
+PHASE_DUAL = 1
+PHASE_PRIMAL = 2
+
+# Seconds between checkpoints of `solve_with_checkpoints`.
+CHECKPOINT_INTERVAL = 60.0
+
+
+class Checkpoint(NamedTuple):
+    tableau: Tableau
+    basis: list[int | None]
+    pivots: int
+    phase: int
+
+
+def save_checkpoint(
+        path: str,
+        tableau: list[list[float]],
+        pivots: int = 0,
+        tol = DEFAULT_TOLERANCES,
+        basis: list[int | None] | None = None,
+):
+    """
+    Writes the state of the solve of the given tableau after the given number
+    of pivots to the file at `path`. The `basis` of the solve is read from the
+    tableau unless it is given.
+    """
+
+    height = len(tableau)
+    width = len(tableau[0]) if height > 0 else 0
+    if basis == None:
+        basis = get_basis(tableau, tol) if height > 0 else []
+    phase = PHASE_PRIMAL if height == 0 or is_feasible(tableau, tol) else PHASE_DUAL
+    typecode = tableau.typecode if isinstance(tableau, Tableau) else 'd'
+    row_size = array(typecode).itemsize*width
+
+    basis_offset = HEADER.size
+    tableau_offset = basis_offset + 8*len(basis)
+    size = tableau_offset + row_size*height
+
+    # Write to a temporary file first, so that a crash while writing never
+    # destroys the previous checkpoint.
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w+b') as f:
+        f.truncate(size)
+        with mmap.mmap(f.fileno(), size) as mm:
+            HEADER.pack_into(
+                mm, 0, MAGIC, VERSION, phase, height, width, pivots, typecode.encode(),
+            )
+
+            mm[basis_offset:tableau_offset] = array(
+                'q', [-1 if col_idx == None else col_idx for col_idx in basis],
+            ).tobytes()
+
+            offset = tableau_offset
+            for row in tableau:
+                if isinstance(row, memoryview):
+                    data = row.cast('B')
+                else:
+                    data = array(typecode, row).tobytes()
+                mm[offset:offset + row_size] = data
+                offset += row_size
+
+            mm.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str) -> Checkpoint:
+    """
+    Reads the checkpoint from the file at `path`. Raises ValueError if the
+    file is not a checkpoint.
+    """
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if len(mm) < HEADER.size:
+            raise ValueError(f"{path} is not a checkpoint")
+        magic, version, phase, height, width, pivots, typecode = HEADER.unpack_from(mm, 0)
+        if magic != MAGIC or version != VERSION or typecode not in (b'd', b'f'):
+            raise ValueError(f"{path} is not a checkpoint")
+        typecode = typecode.decode()
+
+        basis_offset = HEADER.size
+        tableau_offset = basis_offset + 8*max(height - 1, 0)
+        if len(mm) != tableau_offset + array(typecode).itemsize*height*width:
+            raise ValueError(f"{path} is truncated")
+
+        basis = array('q')
+        basis.frombytes(mm[basis_offset:tableau_offset])
+        data = array(typecode)
+        data.frombytes(mm[tableau_offset:])
+
+    return Checkpoint(
+        Tableau(height, width, data, typecode),
+        [None if col_idx == -1 else col_idx for col_idx in basis],
+        pivots,
+        phase,
+    )
+
+
+def solve_with_checkpoints(
+        tableau: list[list[float]],
+        path: str,
+        interval: float = CHECKPOINT_INTERVAL,
+        deadline: float | None = None,
+        cancel = None,
+        tol = DEFAULT_TOLERANCES,
+        pivots: int = 0,
+        basis: list[int | None] | None = None,
+        phase: int | None = None,
+) -> Status:
+    """
+    Performs the simplex method on the tableau in place like `run_simplex`
+    and writes a checkpoint to `path` every `interval` seconds and when the
+    solve stops. `pivots` is the number of pivots performed before, which is
+    stored in the checkpoints. The `basis` and the `phase` of a resumed solve
+    are read from the tableau unless they are given.
+
+    The basis is tracked over the pivots and stored as is, since reading it
+    from the tableau again may give a different one, e.g. when a column is
+    only a unit column within the tolerance.
+    """
+
+    basis = get_basis(tableau, tol) if basis == None else list(basis)
+    feasible = None if phase == None else phase == PHASE_PRIMAL
+    steps = iterate_simplex(tableau, tol, basis=basis, feasible=feasible)
+    last_save = time.monotonic()
+    while True:
+        try:
+            pos = next(steps)
+        except StopIteration as stop:
+            status = stop.value
+            break
+        basis[pos[0]] = pos[1]
+        pivots += 1
+
+        now = time.monotonic()
+        if cancel is not None and cancel.is_set():
+            status = Status.CANCELLED
+            break
+        if deadline is not None and now >= deadline:
+            status = Status.TIME_LIMIT
+            break
+        if now - last_save >= interval:
+            save_checkpoint(path, tableau, pivots, tol, basis)
+            last_save = now
+
+    save_checkpoint(path, tableau, pivots, tol, basis)
+    return status
+
+
+def resume(
+        path: str,
+        interval: float = CHECKPOINT_INTERVAL,
+        deadline: float | None = None,
+        cancel = None,
+        tol = DEFAULT_TOLERANCES,
+) -> tuple[Status, Tableau]:
+    """
+    Continues the solve checkpointed in the file at `path` from the vertex it
+    reached, checkpointing to the same file. Returns the final status and the
+    tableau, from which the solution can be read with `get_solution`.
+    """
+
+    checkpoint = load_checkpoint(path)
+    status = solve_with_checkpoints(
+        checkpoint.tableau,
+        path,
+        interval,
+        deadline,
+        cancel,
+        tol,
+        checkpoint.pivots,
+        checkpoint.basis,
+        checkpoint.phase,
+    )
+    return status, checkpoint.tableau
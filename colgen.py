@@ -0,0 +1,168 @@
+"""
+This file contains a column generation driver for problems with too many
+variables to enumerate up front, e.g. the patterns of cutting stock problems.
+Only a restricted master problem with some of the columns is solved, and a
+pricing callback provided by the user looks for columns which improve it.
+"""
+
+from collections.abc import Callable
+from typing import NamedTuple
+
+from simplex import (
+    DEFAULT_TOLERANCES,
+    Mode,
+    SolveResult,
+    Status,
+    apply_inequalities,
+    get_basis,
+    get_residuals,
+    get_var_count,
+    refactor,
+    run_simplex,
+    to_tableau,
+)
+
+
+class Column(NamedTuple):
+    """
+    A variable of the master problem given by its goal function coefficient
+    and its coefficients in the constraints, in the order of the constraints.
+    """
+
+    cost: float
+    coefficients: list[float]
+
+
+def get_reduced_cost(column: Column, duals: list[float]) -> float:
+    return column.cost - sum(a*y for a, y in zip(column.coefficients, duals))
+
+
+def add_column(
+        tableau: list[list[float]],
+        column: list[float],
+        cost: float,
+        mode = Mode.MAXIMIZATION,
+):
+    """
+    Adds a non-basic column with the given coefficients (in the `<=` form) and
+    goal function coefficient to the tableau in place, just before the slack
+    columns. Since the slack columns of a tableau hold the inverse of the
+    basis, the new column is expressed in the current basis directly and the
+    current vertex stays feasible.
+    """
+
+    var_count = get_var_count(tableau)
+    # Minimization is performed as maximization of the negated goal function.
+    bottom = cost if mode == Mode.MINIMIZATION else -cost
+
+    for row_idx, row in enumerate(tableau):
+        value = bottom if row_idx == len(tableau) - 1 else 0
+        for i, a in enumerate(column):
+            value += row[var_count + i]*a
+        row.insert(var_count, value)
+
+
+def solve_column_generation(
+        goal_function: list[float],
+        constraints: list[list[float]],
+        price: Callable[[list[float]], list[Column]],
+        inequalities: list[str] | None = None,
+        mode = Mode.MAXIMIZATION,
+        smoothing: float = 0.0,
+        round_limit: int | None = None,
+        tol = DEFAULT_TOLERANCES,
+) -> tuple[SolveResult, list[Column]]:
+    """
+    Solves the master problem by column generation. The restricted master
+    problem is given in the same form as to `solve_problem` and has to be
+    feasible on its own (e.g. thanks to expensive artificial columns).
+
+    After every solve of the restricted master, `price` is called with the
+    dual values of the constraints and returns candidate columns. The ones
+    with an improving reduced cost are added to the final tableau, which is
+    then reoptimized from the current vertex. Column generation stops when no
+    improving column is returned, which proves the optimality of the master
+    problem, or with `Status.ITERATION_LIMIT` after `round_limit` rounds.
+
+    With `smoothing` between 0 and 1, `price` is given the weighted average of
+    the previous dual values passed to it (with this weight) and the current
+    ones instead, which damps the oscillation of the dual values and the
+    tailing off of the convergence. If no improving column is found at the
+    smoothed dual values, `price` is called again with the current ones.
+
+    Returns the result of the final restricted master and all of its columns,
+    in the order of `result.solution`. The result refers to the `<=` form of
+    the constraints (see `apply_inequalities`).
+    """
+
+    if not 0 <= smoothing < 1:
+        raise ValueError("The smoothing weight must be in [0, 1)")
+
+    if inequalities is None:
+        inequalities = ["<="] * len(constraints)
+    signs = [-1 if inequality == ">=" else 1 for inequality in inequalities]
+    constraints = apply_inequalities(constraints, inequalities)
+
+    columns = [
+        Column(cost, [signs[i]*row[j] for i, row in enumerate(constraints)])
+            for j, cost in enumerate(goal_function)
+    ]
+    tableau = to_tableau(goal_function, constraints, mode)
+    original = [list(row) for row in tableau]
+    # Improving columns increase the goal function when maximizing.
+    direction = 1 if mode == Mode.MAXIMIZATION else -1
+    center = None
+    round_count = 0
+
+    while True:
+        status = run_simplex(tableau, tol=tol)
+        if status == Status.INFEASIBLE:
+            return SolveResult(status, None, mode, tol), columns
+        if status != Status.OPTIMAL:
+            return SolveResult(status, tableau, mode, tol), columns
+
+        result = SolveResult(status, tableau, mode, tol)
+        # The pricing works with the constraints as given.
+        duals = [sign*y for sign, y in zip(signs, result.duals)]
+
+        prices = duals
+        if smoothing > 0 and center != None:
+            prices = [smoothing*c + (1 - smoothing)*y for c, y in zip(center, duals)]
+
+        new_columns = [
+            column for column in price(prices)
+                if direction*get_reduced_cost(column, duals) > tol.dual
+        ]
+        # Mispricing: the smoothed dual values found nothing which improves the
+        # current ones, which does not prove optimality yet.
+        if len(new_columns) == 0 and prices is not duals:
+            prices = duals
+            new_columns = [
+                column for column in price(prices)
+                    if direction*get_reduced_cost(column, duals) > tol.dual
+            ]
+        center = prices
+
+        if len(new_columns) == 0: return result, columns
+        if round_limit != None and round_count >= round_limit:
+            return SolveResult(Status.ITERATION_LIMIT, tableau, mode, tol), columns
+        round_count += 1
+
+        for column in new_columns:
+            coefficients = [sign*a for sign, a in zip(signs, column.coefficients)]
+            add_column(tableau, coefficients, column.cost, mode)
+            add_column(original, coefficients, column.cost, mode)
+            columns.append(column)
+
+        # The new columns are computed with the inverse of the basis held by
+        # the tableau, so its rounding errors are checked like in
+        # `iterate_simplex`.
+        basis = get_basis(tableau, tol)
+        if None in basis: continue
+        if max(get_residuals(original, tableau, basis)) <= tol.residual: continue
+        try:
+            rows = refactor(original, basis, tol)
+        except ValueError:
+            continue
+        for row_idx, row in enumerate(rows):
+            tableau[row_idx] = row
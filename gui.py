@@ -1,18 +1,16 @@
+import csv
+import io
+import queue
+import threading
 import tkinter as tk
+import tkinter.filedialog
 import tkinter.messagebox
 import tkinter.font
 
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import (
-        FigureCanvasTkAgg,
-        NavigationToolbar2Tk
-)
-import matplotlib.colors as mcolors
-
+from planar import is_on_box, region_bound, solve_2d
 from simplex import *
 
 
-# TODO: Add solution's space colorization.
 # TODO: Plot implicit contraint's lines (x=0 and y=0).
 class Plot(tk.Frame):
 
@@ -27,13 +25,27 @@ class Plot(tk.Frame):
 		'tab:olive',
 		'tab:cyan',
     ]
+    VIEW_MARGIN = 1.25
 
     def __init__(self, master):
         super().__init__(master)
 
         self.pack(side="top", expand=True)
 
-        fig = plt.Figure(dpi=100)
+        self.ax = None
+        self.canvas = None
+
+
+    def _create_canvas(self):
+        # Importing matplotlib takes most of the startup time of the GUI, so
+        # the canvas is created only when the first solution is plotted.
+        from matplotlib.backends.backend_tkagg import (
+                FigureCanvasTkAgg,
+                NavigationToolbar2Tk
+        )
+        from matplotlib.figure import Figure
+
+        fig = Figure(dpi=100)
         self.ax = fig.add_subplot()
 
         self.canvas = FigureCanvasTkAgg(fig, master=self)
@@ -51,13 +63,25 @@ class Plot(tk.Frame):
         toolbar.pack(side=tkinter.TOP, fill=tkinter.X)
 
 
-    def plot(self, goal_function, constraints, solution, var_names=[]):
+    def plot(self, goal_function, constraints, solution, var_names=[], region=[]):
         assert len(goal_function) == 2
         assert len(solution[0]) == 2
-        assert len(constraints) < len(self.COLORS)
 
+        import matplotlib.colors as mcolors
+
+        if self.canvas is None:
+            self._create_canvas()
         self.ax.clear()
 
+        # Fill the feasible region
+        if len(region) > 0:
+            self.ax.fill(
+                [x for x, _ in region],
+                [y for _, y in region],
+                color=mcolors.TABLEAU_COLORS[self.COLORS[0]],
+                alpha=0.2,
+            )
+
         # Plot objective function
         point = solution[0]
         obj_fun_color = mcolors.TABLEAU_COLORS[self.COLORS[0]]
@@ -90,7 +114,9 @@ class Plot(tk.Frame):
         # Plot constraints' lines
         constraints_data = []
         for i, constraint in enumerate(constraints):
-            color = mcolors.TABLEAU_COLORS[self.COLORS[i+1]]
+            color = mcolors.TABLEAU_COLORS[
+                self.COLORS[1 + i % (len(self.COLORS) - 1)]
+            ]
             label = f"{constraint[0]}{var_names[0]} + "\
                     f"{constraint[1]}{var_names[1]} = {constraint[2]}"
             if constraint[1] != 0:
@@ -118,34 +144,86 @@ class Plot(tk.Frame):
         if x != float('inf') and y != float('inf'):
             self.ax.plot(x, y, marker='o', color=mcolors.TABLEAU_COLORS['tab:red'])
 
-        self.ax.set_xlim(0)
-        self.ax.set_ylim(0)
+        # Unbounded regions are clipped to a huge box, so limit the view to
+        # the vertices of the region lying close to the origin.
+        x_lim, y_lim = self._get_view_limits(
+            region, solution[0], region_bound(constraints),
+        )
+        self.ax.set_xlim(0, x_lim)
+        self.ax.set_ylim(0, y_lim)
 
-        self.ax.legend()
+        if len(constraints) < len(self.COLORS):
+            self.ax.legend()
 
         self.canvas.draw()
 
 
+    def _get_view_limits(self, region, point, bound):
+        points = [
+            p for p in region + [point]
+                if max(p) != float('inf') and not is_on_box(p, bound)
+        ]
+        x_lim = max([x for x, _ in points], default=0)
+        y_lim = max([y for _, y in points], default=0)
+
+        return (
+            max(1.0, self.VIEW_MARGIN*x_lim),
+            max(1.0, self.VIEW_MARGIN*y_lim),
+        )
+
+
 # TODO: Center plus sign between adjacent goal function terms.
 # TODO: Fix content of focused variable name entry being removed when using
 #       keyboard shortcut.
-# TODO: Fix focus traversal order when using TAB.
 class Controls(tk.Frame):
+    """
+    A spreadsheet-style problem entry grid. Widgets exist only for the
+    `VISIBLE_VAR_COUNT` x `VISIBLE_CONSTRAINT_COUNT` cells in view, the
+    problem itself is kept in plain lists, which the widgets are rebound to
+    whenever the view scrolls.
+    """
 
     BASE_PADDING = 16
     INIT_VAR_COUNT = 2
-    MAX_VAR_COUNT = 4
+    MAX_VAR_COUNT = 1000
     MIN_VAR_COUNT = 2
     INIT_CONSTRAINT_COUNT = 2
-    MAX_CONSTRAINT_COUNT = 4
+    MAX_CONSTRAINT_COUNT = 1000
     MIN_CONSTRAINT_COUNT = 2
+    VISIBLE_VAR_COUNT = 4
+    VISIBLE_CONSTRAINT_COUNT = 4
     VAR_ENTRY_WIDTH = 4
     MAX_VAR_NAME_LEN = 3
+    SOLVE_DELAY_MS = 300
+    POLL_INTERVAL_MS = 50
 
     def __init__(self, master, plot):
         super().__init__(master)
         self.plot = plot
 
+        # Solving runs on a background thread, which posts its results to the
+        # queue polled from the Tk main loop. Only the most recent solve is
+        # kept alive, stale ones are cancelled through their events.
+        self._results = queue.Queue()
+        self._cancel_solve = None
+        self._scheduled_solve = None
+
+        # The problem, in the form accepted by `to_tableau`.
+        self.var_names = [f"x{i+1}" for i in range(self.INIT_VAR_COUNT)]
+        self.goal_function = [1.0] * self.INIT_VAR_COUNT
+        self.constraints = [
+            [1.0] * self.INIT_VAR_COUNT + [0.0]
+                for _ in range(self.INIT_CONSTRAINT_COUNT)
+        ]
+        self.inequalities = ["<="] * self.INIT_CONSTRAINT_COUNT
+
+        # Indices of the first variable and constraint in view.
+        self.first_var = 0
+        self.first_constraint = 0
+        # Set while the widgets are rebound, so that their validation
+        # callbacks do not write the shown values back.
+        self._refreshing = False
+
         self.pack(
             padx=self.BASE_PADDING,
             pady=self.BASE_PADDING,
@@ -154,28 +232,43 @@ class Controls(tk.Frame):
 
         self.font = tkinter.font.Font(self, size=16)
 
-        vars_label = tk.Label(self, text="Variables:", font=self.font)
-        vars_label.grid(row=0, column=0)
+        side_column = self.VISIBLE_VAR_COUNT + 1
 
-        self.var_names = [
-            tk.StringVar(master, "x{}".format(i+1))
-                for i in range(self.MAX_VAR_COUNT)
-        ]
-        self.inequalities = [
-            tk.StringVar(master, "<=") for i in range(self.MAX_VAR_COUNT)
-        ]
-        self.constraints = []
-        self.var_entry_frames = []
-        self.goal_func_terms = []
-        for i in range(self.INIT_VAR_COUNT):
-            self.increment_var_count()
-        for i in range(self.INIT_CONSTRAINT_COUNT):
-            self.increment_constraint_count()
+        tk.Label(self, text="Variables:", font=self.font).grid(row=0, column=0)
+        tk.Label(
+            self, text="Goal function:", font=self.font,
+        ).grid(row=1, column=0)
+
+        # Widgets are created in row-major order, which is also the focus
+        # traversal order.
+        self.var_name_entries = []
+        for col in range(self.VISIBLE_VAR_COUNT):
+            self.var_name_entries.append(self._create_var_name_entry(col))
+
+        self.goal_cells = []
+        for col in range(self.VISIBLE_VAR_COUNT):
+            self.goal_cells.append(self._create_cell(1, None, col))
+
+        self.constraint_labels = []
+        self.constraint_cells = []
+        self.rhs_frames = []
+        self.rhs_entries = []
+        self.inequality_vars = []
+        for row in range(self.VISIBLE_CONSTRAINT_COUNT):
+            label = tk.Label(self, font=self.font)
+            label.grid(row=row+2, column=0)
+            self.constraint_labels.append(label)
+
+            self.constraint_cells.append([
+                self._create_cell(row+2, row, col)
+                    for col in range(self.VISIBLE_VAR_COUNT)
+            ])
+            self._create_rhs(row, side_column)
 
         var_button_frame = tk.Frame(self)
         var_button_frame.grid(
             row=0,
-            column=self.MAX_VAR_COUNT+1,
+            column=side_column,
             padx=(2*self.BASE_PADDING, 0),
         )
 
@@ -183,19 +276,12 @@ class Controls(tk.Frame):
         vars_minus.bind('<Button-1>', self.decrement_var_count)
         master.bind('<Control-h>', self.decrement_var_count)
         vars_minus.pack(side="left", padx=(0.5*self.BASE_PADDING, 0))
-        
+
         vars_plus = tk.Button(var_button_frame, text="+")
         vars_plus.bind('<Button-1>', self.increment_var_count)
         master.bind('<Control-l>', self.increment_var_count)
         vars_plus.pack(side="right", padx=(0.5*self.BASE_PADDING, 0))
 
-        goal_func_label = tk.Label(
-            self,
-            text="Goal function:",
-            font=self.font,
-        )
-        goal_func_label.grid(row=1, column=0)
-
         max_or_min_frame = tk.Frame(self)
         arrow_label = tk.Label(
             max_or_min_frame,
@@ -210,13 +296,39 @@ class Controls(tk.Frame):
         ).pack(side="right")
         max_or_min_frame.grid(
             row=1,
-            column=self.MAX_VAR_COUNT+1,
+            column=side_column,
             padx=(2*self.BASE_PADDING, 0),
         )
 
+        self.var_scrollbar = tk.Scrollbar(
+            self,
+            orient="horizontal",
+            command=self._scroll_vars,
+        )
+        self.var_scrollbar.grid(
+            row=2+self.VISIBLE_CONSTRAINT_COUNT,
+            column=1,
+            columnspan=self.VISIBLE_VAR_COUNT,
+            sticky="ew",
+        )
+        self.constraint_scrollbar = tk.Scrollbar(
+            self,
+            orient="vertical",
+            command=self._scroll_constraints,
+        )
+        self.constraint_scrollbar.grid(
+            row=2,
+            column=side_column+1,
+            rowspan=self.VISIBLE_CONSTRAINT_COUNT,
+            sticky="ns",
+        )
+        self.bind_all('<MouseWheel>', self._on_mouse_wheel)
+        self.bind_all('<Button-4>', self._on_mouse_wheel)
+        self.bind_all('<Button-5>', self._on_mouse_wheel)
+
         constraint_button_frame = tk.Frame(self)
         constraint_button_frame.grid(
-            row=2+self.MAX_CONSTRAINT_COUNT+1,
+            row=2+self.VISIBLE_CONSTRAINT_COUNT+1,
             column=0,
             padx=(2*self.BASE_PADDING, 0),
         )
@@ -229,7 +341,7 @@ class Controls(tk.Frame):
             padx=(0.5*self.BASE_PADDING, 0),
             pady=0.5*self.BASE_PADDING,
         )
-        
+
         constraint_plus = tk.Button(constraint_button_frame, text="+")
         constraint_plus.bind('<Button-1>', self.increment_constraint_count)
         master.bind('<Control-j>', self.increment_constraint_count)
@@ -239,6 +351,13 @@ class Controls(tk.Frame):
             pady=0.5*self.BASE_PADDING,
         )
 
+        open_button = tk.Button(self, text="Open CSV…", command=self.open_csv)
+        open_button.grid(
+            row=2+self.VISIBLE_CONSTRAINT_COUNT+1,
+            column=side_column,
+            padx=(2*self.BASE_PADDING, 0),
+        )
+
         solve_frame = tk.Frame(master)
         solve_frame.pack(side="bottom", pady=self.BASE_PADDING)
 
@@ -267,285 +386,590 @@ class Controls(tk.Frame):
             pady=self.BASE_PADDING,
         )
 
-        self._update_focus_order()
-
-
-    def decrement_var_count(self, _):
-        if len(self.var_entry_frames) <= self.MIN_VAR_COUNT: return
+        self.opt_method.trace_add('write', self.schedule_solve)
 
-        self.var_entry_frames[-1].grid_forget()
-        self.var_entry_frames.pop()
+        self.refresh()
+        self._poll_results()
 
-        self.goal_func_terms[-1].grid_forget()
-        self.goal_func_terms.pop()
 
-        self.remove_constraint_term()
-
-
-    def increment_var_count(self, _=None):
-        if len(self.var_entry_frames) >= self.MAX_VAR_COUNT: return
-
-        var_name_entry_frame = tk.Frame(self)
-        if len(self.var_entry_frames) >= 1:
-            # For alignment purposes only.
-            tk.Label(
-                var_name_entry_frame, width=1, font=self.font,
-            ).pack(side="left")
+    def _create_var_name_entry(self, col):
+        frame = tk.Frame(self)
+        # For alignment purposes only.
+        tk.Label(frame, width=1, font=self.font).pack(side="left")
 
-        var_name_entry = tk.Entry(
-            var_name_entry_frame,
+        entry = tk.Entry(
+            frame,
             width=self.VAR_ENTRY_WIDTH,
-            textvariable=self.var_names[len(self.var_entry_frames)],
             font=self.font,
             validate="key",
         )
-        var_name_entry['validatecommand'] = (
-            var_name_entry.register(self._validate_identifier_input), "%P"
+        entry['validatecommand'] = (
+            entry.register(lambda input: self._on_var_name_edit(col, input)),
+            "%P",
         )
-        var_name_entry.pack(side="left")
+        entry.pack(side="left")
 
         # For alignment purposes only.
         tk.Label(
-            var_name_entry_frame,
+            frame,
             width=self.MAX_VAR_NAME_LEN,
             font=self.font,
         ).pack(side="right")
 
-        var_name_entry_frame.grid(
+        frame.grid(
             row=0,
-            column=len(self.var_entry_frames)+1,
+            column=col+1,
             padx=(2*self.BASE_PADDING, 0),
             pady=0.5*self.BASE_PADDING,
         )
-        self.var_entry_frames.append(var_name_entry_frame)
 
-        term_frame = tk.Frame(self)
-        if (len(self.var_entry_frames) > 1):
-            term_plus_label = tk.Label(
-                term_frame, text="+", font=self.font,
-            ).pack(side="left")
-        term_mul_entry = tk.Entry(
-            term_frame,
+        return entry
+
+
+    def _create_cell(self, grid_row, row, col):
+        """
+        Creates the widgets of the `col`-th visible term of the goal function
+        (if `row` is None) or the `row`-th visible constraint. Returns the
+        frame, the plus sign label, the entry and the variable name label.
+        """
+
+        frame = tk.Frame(self)
+        plus_label = tk.Label(frame, width=1, font=self.font)
+        plus_label.pack(side="left")
+
+        entry = tk.Entry(
+            frame,
             width=self.VAR_ENTRY_WIDTH,
             font=self.font,
             validate="key",
         )
-        term_mul_entry['validatecommand'] = (
-            term_mul_entry.register(self._validate_coefficient_input), "%P"
+        entry['validatecommand'] = (
+            entry.register(
+                lambda input: self._on_coefficient_edit(row, col, input)
+            ),
+            "%P",
         )
-        term_mul_entry.pack(side="left")
-        term_var_label = tk.Label(
-            term_frame,
-            textvariable=self.var_names[len(self.var_entry_frames)-1],
+        entry.bind('<<Paste>>', lambda _: self._on_paste(row, col))
+        entry.pack(side="left")
+
+        name_label = tk.Label(
+            frame,
             width=self.MAX_VAR_NAME_LEN,
             font=self.font,
-        ).pack(side="right")
-        term_frame.grid(
-            row=1,
-            column=len(self.goal_func_terms)+1,
+        )
+        name_label.pack(side="right")
+
+        frame.grid(
+            row=grid_row,
+            column=col+1,
             padx=(2*self.BASE_PADDING, 0),
             pady=0.5*self.BASE_PADDING,
         )
-        self.goal_func_terms.append(term_frame)
 
-        # If this method was called from the constructor, do not add
-        # constraint terms.
-        if len(self.constraints) == 0: return
+        return frame, plus_label, entry, name_label
 
-        for i, constraint in enumerate(self.constraints):
-            _, terms, _ = constraint
-            self.add_constraint_term(terms, i+1)
 
-        self._update_focus_order()
-
-
-    def decrement_constraint_count(self, event=None):
-        if len(self.constraints) <= self.MIN_CONSTRAINT_COUNT: return
-
-        label, terms, rhs = self.constraints.pop()
-        label.grid_forget()
-        rhs.grid_forget()
-        for term in terms:
-            term.grid_forget()
-
-
-    def increment_constraint_count(self, event=None):
-        if len(self.constraints) >= self.MAX_CONSTRAINT_COUNT: return
-
-        new_id = len(self.constraints) + 1
-
-        constraint_label = tk.Label(
-            self,
-            text="Constraint {}:".format(new_id),
-            font=self.font,
-        )
-        constraint_label.grid(
-            row=new_id+2,
-            column=0,
-        )
-
-        constraint_terms = []
-        for _ in range(len(self.var_entry_frames)):
-            self.add_constraint_term(constraint_terms, new_id)
-
-        constraint_rhs_frame = tk.Frame(self)
-        constraint_rhs_frame.grid(
-            row=new_id+2,
-            column=self.MAX_VAR_COUNT+1,
+    def _create_rhs(self, row, column):
+        frame = tk.Frame(self)
+        frame.grid(
+            row=row+2,
+            column=column,
             padx=(2*self.BASE_PADDING, 0),
         )
-        constraint_rhs_entry = tk.Entry(
-            constraint_rhs_frame,
+
+        entry = tk.Entry(
+            frame,
             width=self.VAR_ENTRY_WIDTH,
             font=self.font,
             validate="key",
         )
-        constraint_rhs_entry['validatecommand'] = (
-            constraint_rhs_entry.register(self._validate_coefficient_input),
+        entry['validatecommand'] = (
+            entry.register(
+                lambda input: self._on_coefficient_edit(row, None, input)
+            ),
             "%P",
         )
-        constraint_rhs_entry.insert(0, "0")
-        constraint_rhs_entry.pack(
+        entry.bind('<<Paste>>', lambda _: self._on_paste(row, None))
+        entry.pack(
             side="right",
             padx=(0.5*self.BASE_PADDING, 0),
         )
-        constraint_rhs_inequality_menu = tk.OptionMenu(
-            constraint_rhs_frame,
-            self.inequalities[new_id-1],
+
+        inequality = tk.StringVar(self, "<=")
+        inequality.trace_add(
+            'write',
+            lambda *_: self._on_inequality_edit(row, inequality.get()),
+        )
+        tk.OptionMenu(
+            frame,
+            inequality,
             "<=", ">=",
         ).pack(
             side="left",
             padx=(0.5*self.BASE_PADDING, 0),
         )
 
-        self.constraints.append(
-            (constraint_label, constraint_terms, constraint_rhs_frame)
+        self.rhs_frames.append(frame)
+        self.rhs_entries.append(entry)
+        self.inequality_vars.append(inequality)
+
+
+    def refresh(self):
+        """
+        Rebinds the visible widgets to the part of the problem in view.
+        """
+
+        self._refreshing = True
+
+        var_count = len(self.goal_function)
+        constraint_count = len(self.constraints)
+
+        for col in range(self.VISIBLE_VAR_COUNT):
+            var_idx = self.first_var + col
+            visible = var_idx < var_count
+
+            name_frame = self.var_name_entries[col].master
+            if visible:
+                name_frame.grid()
+                self._set_entry(
+                    self.var_name_entries[col], self.var_names[var_idx],
+                )
+            else:
+                name_frame.grid_remove()
+
+            cells = [self.goal_cells[col]] + [
+                row_cells[col] for row_cells in self.constraint_cells
+            ]
+            for row, cell in enumerate(cells):
+                frame, plus_label, entry, name_label = cell
+                constraint_idx = self.first_constraint + row - 1
+                if not visible or constraint_idx >= constraint_count:
+                    frame.grid_remove()
+                    continue
+
+                frame.grid()
+                plus_label['text'] = "+" if var_idx > 0 else ""
+                name_label['text'] = self.var_names[var_idx]
+                if row == 0:
+                    value = self.goal_function[var_idx]
+                else:
+                    value = self.constraints[constraint_idx][var_idx]
+                self._set_entry(entry, self._value_to_str(value))
+
+        for row in range(self.VISIBLE_CONSTRAINT_COUNT):
+            constraint_idx = self.first_constraint + row
+            if constraint_idx >= constraint_count:
+                self.constraint_labels[row].grid_remove()
+                self.rhs_frames[row].grid_remove()
+                continue
+
+            self.constraint_labels[row].grid()
+            self.constraint_labels[row]['text'] \
+                    = f"Constraint {constraint_idx + 1}:"
+            self.rhs_frames[row].grid()
+            self._set_entry(
+                self.rhs_entries[row],
+                self._value_to_str(self.constraints[constraint_idx][-1]),
+            )
+            self.inequality_vars[row].set(self.inequalities[constraint_idx])
+
+        self.var_scrollbar.set(
+            *self._get_scrollbar_range(
+                self.first_var, self.VISIBLE_VAR_COUNT, var_count,
+            )
+        )
+        self.constraint_scrollbar.set(
+            *self._get_scrollbar_range(
+                self.first_constraint,
+                self.VISIBLE_CONSTRAINT_COUNT,
+                constraint_count,
+            )
         )
 
-        self._update_focus_order()
+        self._refreshing = False
 
 
-    def add_constraint_term(self, constraint_terms, constraint_id):
-        term_frame = tk.Frame(self)
-        if len(constraint_terms) > 0:
-            term_plus_label = tk.Label(
-                term_frame, text="+", font=self.font
-            ).pack(side="left")
-        term_mul_entry = tk.Entry(
-            term_frame,
-            width=self.VAR_ENTRY_WIDTH,
-            font=self.font,
-            validate="key",
+    def _value_to_str(self, value):
+        return f"{value:.10g}"
+
+
+    def _set_entry(self, entry, text):
+        entry.delete(0, "end")
+        entry.insert(0, text)
+
+
+    def _get_scrollbar_range(self, first, visible_count, count):
+        return first / count, min(1.0, (first + visible_count) / count)
+
+
+    def _scroll_vars(self, *args):
+        self.first_var = self._get_scrolled_position(
+            self.first_var,
+            self.VISIBLE_VAR_COUNT,
+            len(self.goal_function),
+            *args,
         )
-        term_mul_entry['validatecommand'] = (
-            term_mul_entry.register(self._validate_coefficient_input), "%P"
+        self.refresh()
+
+
+    def _scroll_constraints(self, *args):
+        self.first_constraint = self._get_scrolled_position(
+            self.first_constraint,
+            self.VISIBLE_CONSTRAINT_COUNT,
+            len(self.constraints),
+            *args,
         )
-        term_mul_entry.pack(side="left")
-        term_var_label = tk.Label(
-            term_frame,
-            textvariable=self.var_names[len(constraint_terms)],
-            width=self.MAX_VAR_NAME_LEN,
-            font=self.font,
-        ).pack(side="right")
-        term_frame.grid(
-            row=constraint_id+2,
-            column=len(constraint_terms)+1,
-            padx=(2*self.BASE_PADDING, 0),
-            pady=0.5*self.BASE_PADDING,
+        self.refresh()
+
+
+    def _get_scrolled_position(self, first, visible_count, count, *args):
+        if args[0] == "moveto":
+            first = round(float(args[1]) * count)
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= visible_count
+            first += step
+
+        return max(0, min(first, count - visible_count))
+
+
+    def _on_mouse_wheel(self, event):
+        if not str(event.widget).startswith(str(self)): return
+
+        if event.num == 4 or event.delta > 0:
+            step = -1
+        else:
+            step = 1
+
+        # Shift scrolls horizontally.
+        if event.state & 0x1:
+            self._scroll_vars("scroll", step, "units")
+        else:
+            self._scroll_constraints("scroll", step, "units")
+
+
+    def decrement_var_count(self, _=None):
+        self.set_var_count(len(self.goal_function) - 1)
+
+
+    def increment_var_count(self, _=None):
+        self.set_var_count(len(self.goal_function) + 1)
+
+
+    def decrement_constraint_count(self, _=None):
+        self.set_constraint_count(len(self.constraints) - 1)
+
+
+    def increment_constraint_count(self, _=None):
+        self.set_constraint_count(len(self.constraints) + 1)
+
+
+    def set_var_count(self, count):
+        count = max(self.MIN_VAR_COUNT, min(count, self.MAX_VAR_COUNT))
+        old_count = len(self.goal_function)
+
+        if count < old_count:
+            del self.var_names[count:]
+            del self.goal_function[count:]
+            for constraint in self.constraints:
+                del constraint[count:old_count]
+        else:
+            new_vars = range(old_count, count)
+            self.var_names += [f"x{i+1}" for i in new_vars]
+            self.goal_function += [1.0 for _ in new_vars]
+            for constraint in self.constraints:
+                constraint[old_count:old_count] = [1.0 for _ in new_vars]
+
+        self.first_var = max(0, min(self.first_var, count - self.VISIBLE_VAR_COUNT))
+        self.refresh()
+
+
+    def set_constraint_count(self, count):
+        count = max(
+            self.MIN_CONSTRAINT_COUNT, min(count, self.MAX_CONSTRAINT_COUNT)
         )
-        constraint_terms.append(term_frame)
 
+        del self.constraints[count:]
+        del self.inequalities[count:]
+        while len(self.constraints) < count:
+            self.constraints.append([1.0] * len(self.goal_function) + [0.0])
+            self.inequalities.append("<=")
 
-    def remove_constraint_term(self):
-        for constraint in self.constraints:
-            _, terms, _ = constraint
-            terms.pop().grid_forget()
+        self.first_constraint = max(
+            0,
+            min(self.first_constraint, count - self.VISIBLE_CONSTRAINT_COUNT),
+        )
+        self.refresh()
 
 
-    def solve(self, event=None):
-        goal_function = self.get_goal_function_coefficients()
-        mode = Mode.MINIMIZATION if self.opt_method.get() == "min" else Mode.MAXIMIZATION
+    def _on_var_name_edit(self, col, input):
+        if not self._validate_identifier_input(input): return False
+        if self._refreshing: return True
 
-        constraints = [
-            [float(x) if x != "-" else -1.0 for x in y]
-                for y in self.get_constraints()
-        ]
+        self.var_names[self.first_var + col] = input
+        for _, _, _, name_label in [self.goal_cells[col]] + [
+            row_cells[col] for row_cells in self.constraint_cells
+        ]:
+            name_label['text'] = input
 
-        inequalities = [x.get() for x in self.inequalities]
+        return True
 
-        print_problem(goal_function, mode, constraints, inequalities)
 
-        for i in range(len(constraints)):
-            if inequalities[i] == ">=":
-                constraints[i] = [-x for x in constraints[i]]
+    def _on_coefficient_edit(self, row, col, input):
+        if not self._validate_coefficient_input(input): return False
+        if self._refreshing: return True
 
-        # TODO: Fix perform_simplex() to always return solution with correct
-        #       number of coefficients. Now, the number of coefficients is
-        #       equal to the number of constraints.
-        tableau = to_tableau(goal_function, constraints, mode)
-        solution = perform_simplex(tableau, mode)
-        solution = (solution[0][:len(goal_function)], solution[1])
+        value = self._coefficient_str_to_float(input)
+        if row is None:
+            self.goal_function[self.first_var + col] = value
+        elif col is None:
+            self.constraints[self.first_constraint + row][-1] = value
+        else:
+            self.constraints[self.first_constraint + row][self.first_var + col] = value
 
-        if len(goal_function) == 2 and len(solution[0]) == 2:
-            self.plot(
-                goal_function,
-                constraints,
-                solution,
-                self._get_var_names_as_strings(),
+        self.schedule_solve()
+        return True
+
+
+    def _on_inequality_edit(self, row, inequality):
+        if self._refreshing: return
+
+        self.inequalities[self.first_constraint + row] = inequality
+        self.schedule_solve()
+
+
+    def _on_paste(self, row, col):
+        """
+        Pastes a block of tab or comma separated values starting at the given
+        cell. Pasting at the first term of the goal function replaces the
+        whole problem and pasting at the first term of a constraint replaces
+        whole constraints (see `parse_problem`), growing the problem as
+        needed.
+        """
+
+        try:
+            text = self.clipboard_get()
+        except tk.TclError:
+            return None
+
+        # Let single values be pasted as usual.
+        if not any(c in text.strip() for c in "\t,\n"): return None
+
+        try:
+            table = parse_table(text)
+            if col is not None and self.first_var + col == 0:
+                self._paste_rows(row, table)
+            else:
+                self._paste_cells(row, col, table)
+        except ValueError as e:
+            tkinter.messagebox.showerror("Invalid data", str(e))
+            return "break"
+
+        self.refresh()
+        self.schedule_solve()
+        return "break"
+
+
+    def _paste_rows(self, row, table):
+        if row is None:
+            # The pasted problem replaces the current one as a whole.
+            self.set_problem(*parse_problem(table))
+            return
+
+        constraints, inequalities = parse_constraints(table)
+        first_constraint = self.first_constraint + row
+
+        self.set_var_count(
+            max([len(self.goal_function)] + [len(c) - 1 for c in constraints])
+        )
+        self.set_constraint_count(
+            max(len(self.constraints), first_constraint + len(constraints))
+        )
+
+        # The pasted constraints replace whole rows, short ones are filled up
+        # with zeros.
+        var_count = len(self.goal_function)
+        for i, constraint in enumerate(constraints):
+            self.constraints[first_constraint + i] = (
+                constraint[:-1]
+                + [0.0] * (var_count - len(constraint) + 1)
+                + constraint[-1:]
             )
+            self.inequalities[first_constraint + i] = inequalities[i]
+
+
+    def _paste_cells(self, row, col, table):
+        var_count = len(self.goal_function)
+        first_row = -1 if row is None else self.first_constraint + row
+        first_col = var_count if col is None else self.first_var + col
+
+        for i, values in enumerate(table):
+            constraint_idx = first_row + i
+            if constraint_idx >= len(self.constraints): break
+            for j, value in enumerate(values):
+                var_idx = first_col + j
+                if var_idx > var_count: break
+                value = self._coefficient_str_to_float(value)
+                if constraint_idx < 0:
+                    if var_idx < var_count:
+                        self.goal_function[var_idx] = value
+                else:
+                    self.constraints[constraint_idx][var_idx] = value
+
+
+    def open_csv(self):
+        path = tkinter.filedialog.askopenfilename(
+            filetypes=[("CSV files", "*.csv"), ("All files", "*")],
+        )
+        if not path: return
 
-        self.solution.set(
-            "("
-            + ", ".join(self._var_val_to_str(x) for x in solution[0])
-            + ")"
-            + " = "
-            + self._var_val_to_str(solution[1])
+        try:
+            with open(path, newline="") as f:
+                table = parse_table(f.read())
+            goal_function, constraints, inequalities = parse_problem(table)
+        except (OSError, ValueError) as e:
+            tkinter.messagebox.showerror("Cannot open problem", str(e))
+            return
+
+        self.set_problem(goal_function, constraints, inequalities)
+
+
+    def set_problem(self, goal_function, constraints, inequalities):
+        """
+        Replaces the problem with the given one. Short rows and the problem
+        itself are filled up to the minimum sizes with zeros, which leave the
+        problem unchanged.
+        """
+
+        var_count = max(
+            [self.MIN_VAR_COUNT, len(goal_function)]
+            + [len(c) - 1 for c in constraints]
+        )
+        self.var_names = [f"x{i+1}" for i in range(var_count)]
+        self.goal_function = goal_function + [0.0] * (var_count - len(goal_function))
+        self.constraints = [
+            c[:-1] + [0.0] * (var_count - len(c) + 1) + [c[-1]]
+                for c in constraints
+        ]
+        self.inequalities = list(inequalities)
+        while len(self.constraints) < self.MIN_CONSTRAINT_COUNT:
+            self.constraints.append([0.0] * (var_count + 1))
+            self.inequalities.append("<=")
+        self.first_var = 0
+        self.first_constraint = 0
+
+        # Clip the problem to the maximum sizes.
+        self.set_var_count(var_count)
+        self.set_constraint_count(len(self.constraints))
+        self.schedule_solve()
+
+
+    def get_problem(self):
+        """
+        Returns copies of the goal function, constraints, inequalities and
+        variable names of the problem.
+        """
+
+        return (
+            list(self.goal_function),
+            [list(c) for c in self.constraints],
+            list(self.inequalities),
+            list(self.var_names),
         )
 
 
-    def _var_val_to_str(self, x):
-        return str(x) if x != float('inf') else "∞"
+    def schedule_solve(self, *_):
+        """
+        Solves the problem once it has not been edited for `SOLVE_DELAY_MS`.
+        """
 
+        if self._scheduled_solve is not None:
+            self.after_cancel(self._scheduled_solve)
+        self._scheduled_solve = self.after(self.SOLVE_DELAY_MS, self.solve)
 
-    def get_goal_function_coefficients(self):
-        coefficients = []
 
-        for term in self.goal_func_terms:
-            for widget in term.winfo_children():
-                if widget.winfo_class() == 'Entry':
-                    coefficients.append(
-                        self._coefficient_str_to_float(widget.get())
-                    )
-                    break
+    def solve(self, event=None):
+        self._scheduled_solve = None
 
-        return coefficients
+        goal_function, constraints, inequalities, var_names = self.get_problem()
+        mode = Mode.MINIMIZATION if self.opt_method.get() == "min" else Mode.MAXIMIZATION
 
+        print_problem(goal_function, mode, constraints, inequalities)
 
-    def get_constraints(self):
-        ret = []
+        constraints = apply_inequalities(constraints, inequalities)
 
-        for constraint in self.constraints:
-            new_row = []
-            _, term_frames, rhs = constraint
+        if self._cancel_solve is not None:
+            self._cancel_solve.set()
+        self._cancel_solve = threading.Event()
 
-            for term_frame in term_frames:
-                for widget in term_frame.winfo_children():
-                    if widget.winfo_class() == 'Entry':
-                        new_row.append(
-                            self._coefficient_str_to_float(widget.get())
-                        )
-                        break
+        threading.Thread(
+            target=self._solve_in_background,
+            args=(
+                goal_function,
+                constraints,
+                mode,
+                var_names,
+                self._cancel_solve,
+            ),
+            daemon=True,
+        ).start()
+
+
+    def _solve_in_background(self, goal_function, constraints, mode, var_names, cancel):
+        region = []
+        if len(goal_function) == 2:
+            *solution, region = solve_2d(goal_function, constraints, mode)
+            status = Status.OPTIMAL if region else Status.INFEASIBLE
+        else:
+            tableau = to_tableau(goal_function, constraints, mode)
+            status = run_simplex(tableau, cancel=cancel)
+            if status == Status.CANCELLED: return
 
-            for widget in rhs.winfo_children():
-                if widget.winfo_class() == 'Entry':
-                    new_row.append(
-                        self._coefficient_str_to_float(widget.get())
-                    )
-                    break
+            if status in (Status.UNBOUNDED, Status.INFEASIBLE):
+                solution = unbounded_solution(tableau)
+            else:
+                solution = get_solution(tableau, mode)
 
-            ret.append(new_row)
+        self._results.put(
+            (cancel, goal_function, constraints, solution, var_names, region, status)
+        )
+
+
+    def _poll_results(self):
+        while not self._results.empty():
+            cancel, goal_function, constraints, solution, var_names, region, \
+                    status = self._results.get()
+            if cancel is self._cancel_solve and not cancel.is_set():
+                self._show_solution(
+                    goal_function, constraints, solution, var_names, region,
+                    status,
+                )
 
-        return ret
+        self.after(self.POLL_INTERVAL_MS, self._poll_results)
+
+
+    def _show_solution(
+            self, goal_function, constraints, solution, var_names, region, status,
+    ):
+        if len(goal_function) == 2 and len(solution[0]) == 2:
+            self.plot(goal_function, constraints, solution, var_names, region)
+
+        if status == Status.INFEASIBLE:
+            self.solution.set("Infeasible")
+            return
+
+        self.solution.set(
+            "("
+            + ", ".join(self._var_val_to_str(x) for x in solution[0])
+            + ")"
+            + " = "
+            + self._var_val_to_str(solution[1])
+        )
+
+
+    def _var_val_to_str(self, x):
+        return str(x) if x != float('inf') else "∞"
 
 
     def _coefficient_str_to_float(self, val):
@@ -581,21 +1005,6 @@ class Controls(tk.Frame):
         return True
 
 
-    def _get_var_names_as_strings(self):
-        return [v.get() for v in self.var_names]
-
-
-    def _update_focus_order(self):
-        for frame in self.var_entry_frames:
-            frame.lift()
-        for term in self.goal_func_terms:
-            term.lift()
-        for constraint in self.constraints:
-            for term in constraint[1]:
-                term.lift()
-            constraint[2].lift()
-
-
 def print_problem(
         goal_function: list[float],
         mode: Mode,
@@ -611,6 +1020,65 @@ def print_problem(
         print(f"{constraint_str} {inequalities[i]} {constraint[-1]}")
 
 
+def parse_table(text: str) -> list[list[str]]:
+    """
+    Returns the cells of the given tab or comma separated text, skipping empty
+    lines.
+    """
+
+    delimiter = "\t" if "\t" in text else ","
+    return [
+        [cell.strip() for cell in row]
+            for row in csv.reader(io.StringIO(text), delimiter=delimiter)
+            if any(cell.strip() for cell in row)
+    ]
+
+
+def parse_constraints(
+        table: list[list[str]],
+) -> tuple[list[list[float]], list[str]]:
+    """
+    Returns the constraints, in the form accepted by `to_tableau`, and the
+    inequalities read from the rows of a table. Every row holds the
+    coefficients and the free term, optionally preceded by the inequality,
+    e.g. ["2", "1", ">=", "12"]. The inequality defaults to "<=".
+    """
+
+    constraints = []
+    inequalities = []
+
+    for row in table:
+        inequality = "<="
+        if len(row) > 2 and row[-2] in ("<=", ">="):
+            inequality = row[-2]
+            row = row[:-2] + row[-1:]
+        if len(row) < 2:
+            raise ValueError(f"Constraint {row} has no coefficients")
+
+        constraints.append([float(x) for x in row])
+        inequalities.append(inequality)
+
+    return constraints, inequalities
+
+
+def parse_problem(
+        table: list[list[str]],
+) -> tuple[list[float], list[list[float]], list[str]]:
+    """
+    Returns the goal function, constraints and inequalities read from the rows
+    of a table. The first row holds the goal function's coefficients, the
+    following ones hold the constraints (see `parse_constraints`).
+    """
+
+    if len(table) == 0:
+        raise ValueError("There is no goal function")
+
+    goal_function = [float(x) for x in table[0]]
+    constraints, inequalities = parse_constraints(table[1:])
+
+    return goal_function, constraints, inequalities
+
+
 if __name__ == '__main__':
     root = tk.Tk()
     root.title("Simplex")
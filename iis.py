@@ -0,0 +1,82 @@
+"""
+This file contains the extraction of an irreducible infeasible subsystem
+(IIS) of the constraints of an infeasible problem, i.e. an infeasible subset
+of them which becomes feasible once any one of its constraints is removed.
+"""
+
+from simplex import (
+    DEFAULT_TOLERANCES,
+    Tableau,
+    get_basis,
+    get_feasibility_pivot_pos,
+    get_leaving_row,
+    get_var_count,
+)
+
+
+def find_iis(
+        tableau: list[list[float]],
+        tol = DEFAULT_TOLERANCES,
+) -> list[int] | None:
+    """
+    Returns the sorted indices of the constraint rows of the given tableau,
+    in the form produced by `to_tableau`, which form an IIS, or None if the
+    constraints are feasible. The goal function is ignored and the given
+    tableau is not modified.
+
+    The IIS is found by the deletion filter: every constraint in turn is
+    removed and, if the remaining ones are still infeasible, it is dropped for
+    good, otherwise it is restored. A constraint is removed by letting its
+    slack variable be negative, so all the feasibility checks run on a single
+    copy of the tableau and each one starts from the basis left by the
+    previous one, which usually takes a few pivots instead of a full solve.
+
+    Whenever the remaining constraints are infeasible, the row proving it is
+    a combination of only some of them, which are infeasible on their own, so
+    all the other ones are dropped at once without any further checks.
+    """
+
+    tableau = Tableau.from_rows([list(row) for row in tableau])
+    basis = get_basis(tableau, tol)
+    var_count = get_var_count(tableau)
+    free_cols = set()
+
+    def get_conflict_row():
+        # Restores feasibility with the dual simplex method (see
+        # `get_feasibility_pivot_pos`) and returns the row which proves that
+        # it is impossible or None.
+        while (row_idx := get_leaving_row(tableau, basis, tol, free_cols)) != None:
+            pos = get_feasibility_pivot_pos(tableau, basis, tol, free_cols)
+            if pos == None: return row_idx
+            tableau.pivot(pos)
+            basis[pos[0]] = pos[1]
+        return None
+
+    def drop_unused(candidates, row_idx):
+        # The coefficients of the proof row in the slack columns are the
+        # multipliers of the constraints combined into it.
+        row = tableau[row_idx]
+        used = []
+        for idx in candidates:
+            if abs(row[var_count + idx]) > tol.pivot:
+                used.append(idx)
+            else:
+                free_cols.add(var_count + idx)
+        return used
+
+    row_idx = get_conflict_row()
+    if row_idx == None: return None
+
+    candidates = drop_unused(range(len(tableau) - 1), row_idx)
+    iis = []
+    while len(candidates) > 0:
+        idx = candidates.pop(0)
+        free_cols.add(var_count + idx)
+        row_idx = get_conflict_row()
+        if row_idx == None:
+            free_cols.remove(var_count + idx)
+            iis.append(idx)
+        else:
+            candidates = drop_unused(candidates, row_idx)
+
+    return iis
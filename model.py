@@ -0,0 +1,367 @@
+"""
+This file contains an algebraic modeling layer on top of the simplex method.
+Problems are written with variables and operators, e.g.
+
+    model = Model()
+    x = model.add_var("x")
+    y = model.add_var("y")
+    model.add_constraint(x + y <= 12)
+    model.add_constraint(2*x + y <= 16)
+    model.maximize(40*x + 30*y)
+    status, values, value = model.solve()
+
+and compiled directly to a tableau. All variables are non-negative.
+"""
+
+from array import array
+
+from iis import find_iis
+from simplex import (
+    Mode,
+    Status,
+    Tableau,
+    get_solution,
+    run_simplex,
+    unbounded_solution,
+)
+
+
+class LinExpr:
+    """
+    A linear expression stored as a sparse mapping from variable indices to
+    coefficients and a constant term.
+    """
+
+    __slots__ = ('coeffs', 'constant')
+
+    # Comparisons build constraints, so expressions cannot be hashed.
+    __hash__ = None
+
+    def __init__(self, coeffs: dict[int, float] | None = None, constant: float = 0.0):
+        self.coeffs = coeffs if coeffs is not None else {}
+        self.constant = constant
+
+
+    def copy(self) -> 'LinExpr':
+        return LinExpr(dict(self.coeffs), self.constant)
+
+
+    def __iadd__(self, other):
+        if isinstance(other, Variable):
+            self.coeffs[other.index] = self.coeffs.get(other.index, 0.0) + 1.0
+        elif isinstance(other, LinExpr):
+            for idx, coeff in other.coeffs.items():
+                self.coeffs[idx] = self.coeffs.get(idx, 0.0) + coeff
+            self.constant += other.constant
+        elif isinstance(other, (int, float)):
+            self.constant += other
+        else:
+            return NotImplemented
+        return self
+
+
+    def __isub__(self, other):
+        if isinstance(other, (Variable, LinExpr)):
+            return self.__iadd__(-other)
+        if isinstance(other, (int, float)):
+            self.constant -= other
+            return self
+        return NotImplemented
+
+
+    def __imul__(self, other):
+        if not isinstance(other, (int, float)): return NotImplemented
+        for idx in self.coeffs:
+            self.coeffs[idx] *= other
+        self.constant *= other
+        return self
+
+
+    def __add__(self, other):
+        return self.copy().__iadd__(other)
+
+
+    def __radd__(self, other):
+        return self.copy().__iadd__(other)
+
+
+    def __sub__(self, other):
+        return self.copy().__isub__(other)
+
+
+    def __rsub__(self, other):
+        return (-self).__iadd__(other)
+
+
+    def __mul__(self, other):
+        return self.copy().__imul__(other)
+
+
+    def __rmul__(self, other):
+        return self.copy().__imul__(other)
+
+
+    def __truediv__(self, other):
+        if not isinstance(other, (int, float)): return NotImplemented
+        return self.copy().__imul__(1/other)
+
+
+    def __neg__(self):
+        return self.copy().__imul__(-1)
+
+
+    def __pos__(self):
+        return self.copy()
+
+
+    def __le__(self, other):
+        return Constraint(self - other, "<=")
+
+
+    def __ge__(self, other):
+        return Constraint(self - other, ">=")
+
+
+    def __eq__(self, other):
+        return Constraint(self - other, "==")
+
+
+    def __repr__(self) -> str:
+        terms = [f"{coeff}*x{idx}" for idx, coeff in self.coeffs.items()]
+        return " + ".join(terms + [str(self.constant)])
+
+
+class Variable:
+    """
+    A non-negative decision variable of a `Model`, created by `add_var`.
+    """
+
+    __slots__ = ('name', 'index')
+
+    # Comparisons build constraints, so variables are hashed by identity.
+    __hash__ = object.__hash__
+
+    def __init__(self, name: str, index: int):
+        self.name = name
+        self.index = index
+
+
+    def to_expr(self) -> LinExpr:
+        return LinExpr({self.index: 1.0})
+
+
+    def __add__(self, other):
+        return self.to_expr().__iadd__(other)
+
+
+    def __radd__(self, other):
+        return self.to_expr().__iadd__(other)
+
+
+    def __sub__(self, other):
+        return self.to_expr().__isub__(other)
+
+
+    def __rsub__(self, other):
+        return (-self).__iadd__(other)
+
+
+    def __mul__(self, other):
+        return self.to_expr().__imul__(other)
+
+
+    def __rmul__(self, other):
+        return self.to_expr().__imul__(other)
+
+
+    def __truediv__(self, other):
+        return self.to_expr() / other
+
+
+    def __neg__(self):
+        return LinExpr({self.index: -1.0})
+
+
+    def __le__(self, other):
+        return self.to_expr() <= other
+
+
+    def __ge__(self, other):
+        return self.to_expr() >= other
+
+
+    def __eq__(self, other):
+        return self.to_expr() == other
+
+
+    def __repr__(self) -> str:
+        return f"Variable({self.name!r})"
+
+
+class Constraint:
+    """
+    The constraint `expr <sense> 0`, where `sense` is "<=", ">=" or "==".
+    """
+
+    __slots__ = ('expr', 'sense')
+
+    def __init__(self, expr: LinExpr, sense: str):
+        self.expr = expr
+        self.sense = sense
+
+
+    def __repr__(self) -> str:
+        return f"Constraint({self.expr!r} {self.sense} 0)"
+
+
+def lin_sum(terms) -> LinExpr:
+    """
+    Returns the sum of the given variables, expressions and numbers. Unlike
+    the builtin `sum`, it accumulates all terms in a single expression
+    instead of creating a new one for every term.
+    """
+
+    result = LinExpr()
+    for term in terms:
+        result += term
+    return result
+
+
+class Model:
+
+    def __init__(self):
+        self.variables = []
+        self.constraints = []
+        self.objective = LinExpr()
+        self.mode = Mode.MAXIMIZATION
+
+
+    def add_var(self, name: str | None = None) -> Variable:
+        if name is None:
+            name = f"x{len(self.variables) + 1}"
+        var = Variable(name, len(self.variables))
+        self.variables.append(var)
+        return var
+
+
+    def add_constraint(self, constraint: Constraint) -> Constraint:
+        if not isinstance(constraint, Constraint):
+            raise TypeError(f"expected a constraint, got {constraint!r}")
+        self.constraints.append(constraint)
+        return constraint
+
+
+    def maximize(self, expr):
+        self.objective = lin_sum([expr])
+        self.mode = Mode.MAXIMIZATION
+
+
+    def minimize(self, expr):
+        self.objective = lin_sum([expr])
+        self.mode = Mode.MINIMIZATION
+
+
+    def _rows(self):
+        # Yields the constraints in the `<=` form as (coefficients, sign, rhs)
+        # triples, where the coefficients are to be multiplied by the sign.
+        # Equality constraints yield a `<=` and a `>=` row.
+        for constraint in self.constraints:
+            rhs = -constraint.expr.constant
+            if constraint.sense in ("<=", "=="):
+                yield constraint.expr.coeffs, 1.0, rhs
+            if constraint.sense in (">=", "=="):
+                yield constraint.expr.coeffs, -1.0, -rhs
+
+
+    def row_count(self) -> int:
+        return sum(2 if c.sense == "==" else 1 for c in self.constraints)
+
+
+    def to_tableau(self) -> Tableau:
+        """
+        Returns the tableau of the model in the form produced by `to_tableau`,
+        written in a single pass straight from the sparse coefficients into a
+        flat `Tableau`.
+        """
+
+        var_count = len(self.variables)
+        height = self.row_count() + 1
+        width = var_count + height + 1
+        tableau = Tableau(height, width)
+
+        for row_idx, (coeffs, sign, rhs) in enumerate(self._rows()):
+            row = tableau[row_idx]
+            for idx, coeff in coeffs.items():
+                row[idx] = sign*coeff
+            row[var_count + row_idx] = 1.0
+            row[-1] = rhs
+
+        # Minimization is performed as maximization of the negated goal
+        # function, like in `to_tableau`.
+        sign = 1.0 if self.mode == Mode.MINIMIZATION else -1.0
+        bottom_row = tableau[-1]
+        for idx, coeff in self.objective.coeffs.items():
+            bottom_row[idx] = sign*coeff
+        bottom_row[-2] = 1.0
+
+        return tableau
+
+
+    def to_csr(self) -> tuple[array, array, array, array]:
+        """
+        Returns the constraint matrix of the model in the `<=` form in the
+        compressed sparse row format, i.e. the `indptr`, `indices` and `data`
+        arrays, followed by the array of free terms.
+        """
+
+        indptr = array('l', [0])
+        indices = array('l')
+        data = array('d')
+        rhs_values = array('d')
+        for coeffs, sign, rhs in self._rows():
+            indices.extend(coeffs.keys())
+            data.extend(sign*coeff for coeff in coeffs.values())
+            indptr.append(len(indices))
+            rhs_values.append(rhs)
+
+        return indptr, indices, data, rhs_values
+
+
+    def solve(self, **kwargs) -> tuple[Status, dict[str, float], float]:
+        """
+        Solves the model and returns the final status, the values of the
+        variables by name and the value of the objective. The keyword
+        arguments are passed to `run_simplex`.
+        """
+
+        tableau = self.to_tableau()
+        status = run_simplex(tableau, **kwargs)
+        if status in (Status.UNBOUNDED, Status.INFEASIBLE):
+            solution, value = unbounded_solution(tableau)
+        else:
+            solution, value = get_solution(tableau, self.mode)
+            value += self.objective.constant
+
+        return (
+            status,
+            {var.name: x for var, x in zip(self.variables, solution)},
+            value,
+        )
+
+
+    def find_iis(self) -> list[Constraint] | None:
+        """
+        Returns an irreducible infeasible subset of the constraints of the
+        model (see `find_iis`) or None if the constraints are feasible.
+        """
+
+        rows = find_iis(self.to_tableau())
+        if rows == None: return None
+
+        # Equality constraints have two rows in the tableau.
+        row_constraints = [
+            constraint
+            for constraint in self.constraints
+            for _ in range(2 if constraint.sense == "==" else 1)
+        ]
+        return list(dict.fromkeys(row_constraints[row] for row in rows))
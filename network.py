@@ -0,0 +1,300 @@
+"""
+This file contains the network simplex method for minimum-cost flow problems,
+i.e. linear programs with a flow conservation constraint for every node and
+a capacity for every arc. Instead of a tableau, its basis is a spanning tree
+of the network, so a pivot only touches the nodes of a single cycle and of a
+single subtree.
+"""
+
+import math
+from array import array
+from typing import NamedTuple
+
+from simplex import DEFAULT_TOLERANCES, Status
+
+
+# The states of the arcs. The flow of an arc out of the tree is either at its
+# lower bound (zero) or at its upper bound (the capacity).
+STATE_UPPER = -1
+STATE_TREE = 0
+STATE_LOWER = 1
+
+
+class Arc(NamedTuple):
+    tail: int
+    head: int
+    cost: float
+    capacity: float = math.inf
+
+
+class _SpanningTree:
+    """
+    The basis of the network simplex method. Every node but the root has a
+    parent and the tree arc connecting them (`pred`), and the children of
+    every node form a doubly linked list, so that moving a subtree takes
+    constant time and walking it takes time linear in its size.
+    """
+
+    __slots__ = (
+        'parent', 'pred', 'depth', 'potential',
+        'first_child', 'next_sibling', 'prev_sibling',
+    )
+
+    def __init__(self, node_count: int):
+        self.parent = array('l', [-1])*node_count
+        self.pred = array('l', [-1])*node_count
+        self.depth = array('l', [0])*node_count
+        self.potential = array('d', [0.0])*node_count
+        self.first_child = array('l', [-1])*node_count
+        self.next_sibling = array('l', [-1])*node_count
+        self.prev_sibling = array('l', [-1])*node_count
+
+
+    def attach(self, node: int, parent: int, arc: int):
+        self.parent[node] = parent
+        self.pred[node] = arc
+        self.prev_sibling[node] = -1
+        self.next_sibling[node] = self.first_child[parent]
+        if self.first_child[parent] != -1:
+            self.prev_sibling[self.first_child[parent]] = node
+        self.first_child[parent] = node
+
+
+    def detach(self, node: int):
+        prev_node = self.prev_sibling[node]
+        next_node = self.next_sibling[node]
+        if prev_node != -1:
+            self.next_sibling[prev_node] = next_node
+        else:
+            self.first_child[self.parent[node]] = next_node
+        if next_node != -1:
+            self.prev_sibling[next_node] = prev_node
+
+
+def solve_min_cost_flow(
+        supplies: list[float],
+        arcs: list[tuple[int, int, float, float]],
+        tol = DEFAULT_TOLERANCES,
+) -> tuple[Status, list[float], float]:
+    """
+    Returns the final status, the flow of every arc and the total cost of
+    the cheapest flow in the network whose nodes are numbered from 0 to
+    `len(supplies) - 1`. A node with a positive supply is a source and one
+    with a negative supply is a sink. Every arc is given as an `Arc`, or as a
+    (tail, head, cost[, capacity]) tuple, and its flow has to be between zero
+    and its capacity, which is unlimited by default.
+
+    The status is `Status.INFEASIBLE` if the supplies cannot be routed and
+    `Status.UNBOUNDED` if there is a cycle of uncapacitated arcs with a
+    negative cost.
+    """
+
+    node_count = len(supplies)
+    root = node_count
+
+    tails = array('l')
+    heads = array('l')
+    costs = array('d')
+    caps = array('d')
+    for arc in arcs:
+        tails.append(arc[0])
+        heads.append(arc[1])
+        costs.append(arc[2])
+        caps.append(arc[3] if len(arc) > 3 and arc[3] != None else math.inf)
+    arc_count = len(tails)
+
+    if abs(sum(supplies)) > tol.primal:
+        return Status.INFEASIBLE, [0.0 for _ in range(arc_count)], math.inf
+
+    # The initial basis consists of an artificial arc between every node and
+    # an artificial root, carrying its supply. The first phase minimizes the
+    # flow of the artificial arcs, which is zero iff the problem is feasible.
+    tree = _SpanningTree(node_count + 1)
+    flows = array('d', [0.0])*(arc_count + node_count)
+    states = array('b', [STATE_LOWER])*(arc_count + node_count)
+    real_costs = costs
+    costs = array('d', [0.0])*arc_count
+    for node, supply in enumerate(supplies):
+        arc = arc_count + node
+        if supply >= 0:
+            tails.append(node)
+            heads.append(root)
+        else:
+            tails.append(root)
+            heads.append(node)
+        costs.append(1.0)
+        caps.append(math.inf)
+        flows[arc] = abs(supply)
+        states[arc] = STATE_TREE
+        tree.attach(node, root, arc)
+
+    potential = tree.potential
+    block_size = max(int(math.sqrt(len(tails))), 10)
+    next_arc = 0
+
+    def update_potentials(node):
+        # Makes the reduced costs of the tree arcs in the subtree zero. This
+        # is the hot loop of a pivot, so it walks the subtree inline.
+        parents, preds, depths = tree.parent, tree.pred, tree.depth
+        first_child, next_sibling = tree.first_child, tree.next_sibling
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            parent = parents[node]
+            if parent != -1:
+                arc = preds[node]
+                if tails[arc] == node:
+                    potential[node] = potential[parent] - costs[arc]
+                else:
+                    potential[node] = potential[parent] + costs[arc]
+                depths[node] = depths[parent] + 1
+            child = first_child[node]
+            while child != -1:
+                stack.append(child)
+                child = next_sibling[child]
+
+    def find_entering_arc(arc_limit):
+        # Block search pricing: returns the most violating arc of the first
+        # block of arcs which contains a violating one.
+        nonlocal next_arc
+
+        best_arc, best_violation = None, -tol.dual
+        arc, scanned = next_arc if next_arc < arc_limit else 0, 0
+        while scanned < arc_limit:
+            stop = min(arc + block_size, arc_limit)
+            for e in range(arc, stop):
+                violation = states[e]*(costs[e] + potential[tails[e]] - potential[heads[e]])
+                if violation < best_violation:
+                    best_arc, best_violation = e, violation
+            scanned += stop - arc
+            arc = stop if stop < arc_limit else 0
+            if best_arc != None:
+                next_arc = arc
+                return best_arc
+        return None
+
+    def residual(arc, increases):
+        return caps[arc] - flows[arc] if increases else flows[arc]
+
+    def pivot(entering) -> bool:
+        # Returns False if the flow around the cycle is unlimited.
+
+        # The flow is sent around the cycle closed by the entering arc, from
+        # `first` to `second` along the entering arc and back to `first`
+        # through the tree.
+        if states[entering] == STATE_LOWER:
+            first, second = tails[entering], heads[entering]
+        else:
+            first, second = heads[entering], tails[entering]
+
+        join_first, join_second = first, second
+        while join_first != join_second:
+            if tree.depth[join_first] >= tree.depth[join_second]:
+                join_first = tree.parent[join_first]
+            else:
+                join_second = tree.parent[join_second]
+        join = join_first
+
+        # Of the arcs limiting the flow, the last one on the cycle starting
+        # from the join node leaves the basis, which keeps the tree strongly
+        # feasible and prevents cycling.
+        delta = residual(entering, states[entering] == STATE_LOWER)
+        leaving_node, leaving_side = None, None
+        node = first
+        while node != join:
+            arc = tree.pred[node]
+            res = residual(arc, tails[arc] == tree.parent[node])
+            if res < delta:
+                delta, leaving_node, leaving_side = res, node, first
+            node = tree.parent[node]
+        node = second
+        while node != join:
+            arc = tree.pred[node]
+            res = residual(arc, tails[arc] == node)
+            if res <= delta:
+                delta, leaving_node, leaving_side = res, node, second
+            node = tree.parent[node]
+
+        if delta == math.inf: return False
+
+        if delta > 0:
+            flows[entering] += states[entering]*delta
+            node = first
+            while node != join:
+                arc = tree.pred[node]
+                flows[arc] += delta if tails[arc] == tree.parent[node] else -delta
+                node = tree.parent[node]
+            node = second
+            while node != join:
+                arc = tree.pred[node]
+                flows[arc] += delta if tails[arc] == node else -delta
+                node = tree.parent[node]
+
+        if leaving_node == None:
+            states[entering] = -states[entering]
+            return True
+
+        leaving = tree.pred[leaving_node]
+        states[leaving] = STATE_LOWER if flows[leaving] <= caps[leaving]/2 else STATE_UPPER
+        states[entering] = STATE_TREE
+
+        # Cut the subtree of the leaving arc off and hang it on the entering
+        # arc, rerooted at the endpoint of the entering arc inside it.
+        new_root = leaving_side
+        new_parent = second if leaving_side == first else first
+        path = [new_root]
+        while path[-1] != leaving_node:
+            path.append(tree.parent[path[-1]])
+        preds = [tree.pred[node] for node in path]
+        for node in path:
+            tree.detach(node)
+        for idx in range(len(path) - 1, 0, -1):
+            tree.attach(path[idx], path[idx - 1], preds[idx - 1])
+        tree.attach(new_root, new_parent, entering)
+
+        update_potentials(new_root)
+        return True
+
+    update_potentials(root)
+    while (entering := find_entering_arc(len(tails))) != None:
+        pivot(entering)
+
+    if any(flows[arc] > tol.primal for arc in range(arc_count, len(tails))):
+        return Status.INFEASIBLE, flows[:arc_count].tolist(), math.inf
+
+    # The second phase keeps the artificial arcs empty and never prices them.
+    costs = real_costs
+    for arc in range(arc_count, len(tails)):
+        flows[arc] = 0.0
+        caps[arc] = 0.0
+        costs.append(0.0)
+    update_potentials(root)
+    while (entering := find_entering_arc(arc_count)) != None:
+        if not pivot(entering):
+            return Status.UNBOUNDED, unbounded_flow(arc_count), math.inf
+
+    solution = flows[:arc_count].tolist()
+    value = math.fsum(flow*cost for flow, cost in zip(solution, costs))
+    return Status.OPTIMAL, solution, value
+
+
+def unbounded_flow(arc_count: int) -> list[float]:
+    return [math.inf for _ in range(arc_count)]
+
+
+def perform_network_simplex(
+        supplies: list[float],
+        arcs: list[tuple[int, int, float, float]],
+        tol = DEFAULT_TOLERANCES,
+) -> tuple[list[float], float]:
+    """
+    Returns the flow of every arc and the total cost of the cheapest flow in
+    the given network in the form returned by `perform_simplex`, i.e. with
+    infinite values if there is no optimal flow. See `solve_min_cost_flow`.
+    """
+
+    status, flows, value = solve_min_cost_flow(supplies, arcs, tol)
+    if status != Status.OPTIMAL:
+        return unbounded_flow(len(flows)), math.inf
+
+    return flows, value
@@ -0,0 +1,149 @@
+"""
+This file contains a tableau which is pivoted by a pool of worker processes.
+The tableau lives in shared memory and every worker updates its own block of
+rows, so a single solve of a very large dense problem scales across cores.
+"""
+
+import multiprocessing
+import os
+import threading
+from multiprocessing import shared_memory
+
+from simplex import Tableau
+
+
+# Tableaux with fewer rows per worker are not worth the synchronization.
+MIN_ROWS_PER_WORKER = 64
+
+# Seconds a pivot waits for the workers before the solve is given up, e.g.
+# because a worker died.
+BARRIER_TIMEOUT = 300.0
+
+
+def _worker_main(name, height, width, start, stop, conn, barrier):
+    shm = shared_memory.SharedMemory(name=name)
+    tableau = Tableau(height, width, shm.buf)
+    try:
+        while True:
+            pos = conn.recv()
+            if pos is None:
+                break
+
+            try:
+                # The pivot row is only read, so it is shared by all workers.
+                tableau.eliminate(pos, tableau[pos[0]], start, stop)
+            except Exception:
+                # Release the waiting processes instead of leaving them
+                # blocked at the barrier.
+                barrier.abort()
+                raise
+            barrier.wait()
+    finally:
+        tableau.close()
+        shm.close()
+
+
+class SharedTableau(Tableau):
+    """
+    A tableau stored in `multiprocessing.shared_memory`, whose rows are split
+    into contiguous blocks among a persistent pool of worker processes. On
+    every pivot, the pivot row is normalized in this process and the workers
+    eliminate the pivot column from their blocks in parallel, meeting at a
+    barrier before the pivot returns. The tableau should be closed with
+    `close` to stop the workers and free the shared memory.
+
+    If a worker fails or does not reach the barrier within `BARRIER_TIMEOUT`
+    seconds, the pivot raises RuntimeError and the tableau can only be
+    closed.
+    """
+
+    __slots__ = ('_shm', '_processes', '_conns', '_barrier')
+
+    def __init__(self, height: int, width: int, workers: int | None = None):
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, 8*height*width))
+        super().__init__(height, width, self._shm.buf)
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, min(workers, height // MIN_ROWS_PER_WORKER))
+
+        # Spawn, since forking a process with threads is unsafe.
+        context = multiprocessing.get_context("spawn")
+        self._barrier = context.Barrier(workers + 1)
+        self._processes = []
+        self._conns = []
+        for i in range(workers):
+            start, stop = i*height // workers, (i + 1)*height // workers
+            conn, child_conn = context.Pipe()
+            process = context.Process(
+                target=_worker_main,
+                args=(
+                    self._shm.name, height, width, start, stop,
+                    child_conn, self._barrier,
+                ),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._processes.append(process)
+            self._conns.append(conn)
+
+
+    @classmethod
+    def from_rows(
+            cls,
+            rows: list[list[float]],
+            workers: int | None = None,
+    ) -> 'SharedTableau':
+        width = len(rows[0]) if len(rows) > 0 else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError("All rows of a tableau must have the same length")
+
+        tableau = cls(len(rows), width, workers)
+        for row_idx, row in enumerate(rows):
+            tableau[row_idx] = row
+        return tableau
+
+
+    @property
+    def workers(self) -> int:
+        return len(self._processes)
+
+
+    @property
+    def traced(self) -> bool:
+        # Printing the tableau in this process would serialize the pivots.
+        return False
+
+
+    def pivot(self, pos: tuple[int, int]):
+        self.normalize(pos)
+
+        try:
+            for conn in self._conns:
+                conn.send(pos)
+            self._barrier.wait(BARRIER_TIMEOUT)
+        except (OSError, threading.BrokenBarrierError) as e:
+            self._barrier.abort()
+            raise RuntimeError("A worker of the shared tableau died or failed") from e
+
+
+    def close(self):
+        for conn in self._conns:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+        for process in self._processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.kill()
+                process.join()
+        for conn in self._conns:
+            conn.close()
+        self._processes = []
+        self._conns = []
+
+        super().close()
+        self._shm.close()
+        self._shm.unlink()
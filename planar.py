@@ -0,0 +1,182 @@
+"""
+This file contains a dedicated solver for linear programming problems with two
+variables. It computes the feasible region as the intersection of half-planes
+in O(n log n) time and finds the optimum among the region's vertices, without
+building a tableau.
+"""
+
+import math
+from collections import deque
+
+from simplex import Mode
+
+
+# The feasible region is clipped to a box this many times larger than the
+# largest distance between the origin and a constraint's line. An optimum
+# lying on the box means that the problem is unbounded.
+BOUND_FACTOR = 1e6
+EPS = 1e-12
+
+
+class _HalfPlane:
+    """
+    The half-plane to the left of the line going through the point `p` in the
+    (unit) direction `d`.
+    """
+
+    __slots__ = ('p', 'd', 'angle')
+
+    def __init__(self, a: float, b: float, c: float):
+        # a*x + b*y <= c
+        norm = math.hypot(a, b)
+        self.d = (-b/norm, a/norm)
+        self.p = (a*c/(norm*norm), b*c/(norm*norm))
+        self.angle = math.atan2(self.d[1], self.d[0])
+
+
+    def side(self, point: tuple[float, float]) -> float:
+        """
+        Returns the signed distance of the point from the line, positive
+        inside the half-plane.
+        """
+
+        return self.d[0]*(point[1] - self.p[1]) - self.d[1]*(point[0] - self.p[0])
+
+
+def _intersect(h1: _HalfPlane, h2: _HalfPlane) -> tuple[float, float]:
+    cross = h1.d[0]*h2.d[1] - h1.d[1]*h2.d[0]
+    t = ((h2.p[0] - h1.p[0])*h2.d[1] - (h2.p[1] - h1.p[1])*h2.d[0]) / cross
+    return (h1.p[0] + t*h1.d[0], h1.p[1] + t*h1.d[1])
+
+
+def region_bound(constraints: list[list[float]]) -> float:
+    """
+    Returns the size of the box unbounded feasible regions are clipped to.
+    """
+
+    bound = 1.0
+    for a, b, c in constraints:
+        norm = math.hypot(a, b)
+        if norm > 0:
+            bound = max(bound, abs(c)/norm)
+    return BOUND_FACTOR * bound
+
+
+def is_on_box(vertex: tuple[float, float], bound: float) -> bool:
+    return max(vertex) >= bound * (1 - 1e-9)
+
+
+def feasible_region(
+        constraints: list[list[float]],
+        bound: float | None = None,
+) -> list[tuple[float, float]]:
+    """
+    Returns the vertices of the feasible region of the given constraints (in
+    the form accepted by `to_tableau`) and the implicit x >= 0, y >= 0
+    constraints in counterclockwise order. Unbounded regions are clipped to
+    the [0, bound] x [0, bound] box. An empty list is returned if the region
+    is empty.
+    """
+
+    if bound is None:
+        bound = region_bound(constraints)
+    eps = EPS * bound
+
+    half_planes = [
+        _HalfPlane(-1, 0, 0),
+        _HalfPlane(0, -1, 0),
+        _HalfPlane(1, 0, bound),
+        _HalfPlane(0, 1, bound),
+    ]
+    for a, b, c in constraints:
+        if a == 0 and b == 0:
+            if c < -eps: return []
+            continue
+        half_planes.append(_HalfPlane(a, b, c))
+
+    half_planes.sort(key=lambda h: h.angle)
+
+    dq = deque()
+    for h in half_planes:
+        while len(dq) >= 2 and h.side(_intersect(dq[-1], dq[-2])) < -eps:
+            dq.pop()
+        while len(dq) >= 2 and h.side(_intersect(dq[0], dq[1])) < -eps:
+            dq.popleft()
+
+        if len(dq) > 0:
+            last = dq[-1]
+            if abs(h.d[0]*last.d[1] - h.d[1]*last.d[0]) < EPS:
+                # Parallel lines: opposite ones can only be adjacent when the
+                # region is empty, of the same direction keep the inner one.
+                if h.d[0]*last.d[0] + h.d[1]*last.d[1] < 0:
+                    return []
+                if h.side(last.p) < 0:
+                    dq.pop()
+                else:
+                    continue
+
+        dq.append(h)
+
+    while len(dq) >= 3 and dq[0].side(_intersect(dq[-1], dq[-2])) < -eps:
+        dq.pop()
+    while len(dq) >= 3 and dq[-1].side(_intersect(dq[0], dq[1])) < -eps:
+        dq.popleft()
+
+    if len(dq) < 3: return []
+
+    vertices = []
+    for i in range(len(dq)):
+        vertex = _intersect(dq[i], dq[(i + 1) % len(dq)])
+        if len(vertices) == 0 or math.dist(vertex, vertices[-1]) > eps:
+            vertices.append(vertex)
+    if len(vertices) > 1 and math.dist(vertices[0], vertices[-1]) <= eps:
+        vertices.pop()
+
+    # An empty intersection may degenerate into vertices lying outside of
+    # some of the half-planes instead of leaving fewer than three of them.
+    if any(h.side(v) < -eps for h in half_planes for v in vertices):
+        return []
+
+    return vertices
+
+
+def solve_2d(
+        goal_function: list[float],
+        constraints: list[list[float]],
+        mode = Mode.MAXIMIZATION,
+) -> tuple[list[float], float, list[tuple[float, float]]]:
+    """
+    Returns the solution of the given two-variable problem in the same form as
+    `solve_problem`, followed by the feasible region (see `feasible_region`).
+    The solution consists of infinities if the problem is unbounded or
+    infeasible.
+    """
+
+    assert len(goal_function) == 2
+
+    bound = region_bound(constraints)
+    region = feasible_region(constraints, bound)
+    no_solution = ([float('inf'), float('inf')], float('inf'))
+    if len(region) == 0:
+        return (*no_solution, region)
+
+    sign = 1 if mode == Mode.MAXIMIZATION else -1
+    values = [
+        sign*(goal_function[0]*x + goal_function[1]*y) for x, y in region
+    ]
+    best = max(values)
+
+    # Among the optimal vertices prefer the ones not lying on the clipping
+    # box, so that an optimal ray is not mistaken for unboundedness.
+    tol = 1e-9 * max(1.0, abs(best))
+    candidates = [
+        v for v, value in zip(region, values)
+            if value >= best - tol and not is_on_box(v, bound)
+    ]
+    if len(candidates) == 0:
+        return (*no_solution, region)
+
+    x, y = candidates[0]
+    # Snap values that are zero up to rounding, e.g. on the axes.
+    x, y = (0.0 if abs(x) <= EPS*bound else x), (0.0 if abs(y) <= EPS*bound else y)
+    return [x, y], goal_function[0]*x + goal_function[1]*y, region
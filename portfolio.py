@@ -0,0 +1,136 @@
+"""
+This file contains a portfolio solver, which races several configurations of
+the simplex method on the same problem in separate processes and takes the
+answer of the first one to finish. No single configuration is the fastest on
+every problem, but the race is about as fast as the best one.
+"""
+
+import logging
+import multiprocessing
+import queue
+import time
+from typing import NamedTuple
+
+from simplex import (
+    DEFAULT_TOLERANCES,
+    Crash,
+    Mode,
+    Pricing,
+    Status,
+    Tableau,
+    get_solution,
+    run_simplex,
+    unbounded_solution,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class Config(NamedTuple):
+    pricing: Pricing = Pricing.DANTZIG
+    crash: Crash = Crash.NONE
+
+
+    def __str__(self) -> str:
+        return f"{self.pricing.name.lower()}/{self.crash.name.lower()}"
+
+
+DEFAULT_PORTFOLIO = (
+    Config(),
+    Config(Pricing.GREATEST_IMPROVEMENT),
+    Config(Pricing.BLAND),
+    Config(Pricing.DANTZIG, Crash.BIXBY),
+)
+
+
+def _worker_main(rows, config, tol, idx, results):
+    try:
+        tableau = Tableau.from_rows(rows)
+        # Tracing would take longer than the pivots, so the race would measure
+        # it instead of the configurations.
+        status = run_simplex(
+            tableau, tol=tol, crash=config.crash, pricing=config.pricing, trace=False,
+        )
+        results.put((idx, status, tableau.tolist()))
+    except Exception:
+        results.put((idx, None, None))
+        raise
+
+
+def solve_portfolio(
+        tableau: list[list[float]],
+        mode = Mode.MAXIMIZATION,
+        configs: tuple[Config, ...] = DEFAULT_PORTFOLIO,
+        time_limit: float | None = None,
+        tol = DEFAULT_TOLERANCES,
+) -> tuple[Status, list[float] | None, float | None, Config | None]:
+    """
+    Solves the given tableau with every configuration in a separate process
+    and returns the final status and the solution, in the same form as
+    `perform_simplex`, of the first one to finish, together with its
+    configuration. The other processes are terminated. The given tableau is
+    replaced with the final tableau of the winner.
+
+    If no configuration finishes within `time_limit` seconds, all of them are
+    terminated and `Status.TIME_LIMIT` is returned with None in place of the
+    solution and the configuration.
+
+    The winner is logged with the size of the tableau, so that the best
+    defaults for a family of problems can be learned from the logs.
+    """
+
+    # Spawn, since forking a process with threads is unsafe.
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    rows = [list(row) for row in tableau]
+    start = time.monotonic()
+    deadline = None if time_limit is None else start + time_limit
+
+    processes = [
+        context.Process(
+            target=_worker_main,
+            args=(rows, config, tol, idx, results),
+            daemon=True,
+        )
+        for idx, config in enumerate(configs)
+    ]
+    for process in processes:
+        process.start()
+
+    try:
+        failures = 0
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                idx, status, rows = results.get(timeout=timeout)
+            except queue.Empty:
+                logger.info(
+                    "no configuration solved a %dx%d tableau within %gs",
+                    len(tableau), len(tableau[-1]), time_limit,
+                )
+                return Status.TIME_LIMIT, None, None, None
+
+            if status != None: break
+            failures += 1
+            if failures == len(configs):
+                raise RuntimeError("Every configuration of the portfolio failed")
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
+
+    winner = configs[idx]
+    logger.info(
+        "%s won on a %dx%d tableau with %s in %.3fs",
+        winner, len(tableau), len(tableau[-1]), status.name,
+        time.monotonic() - start,
+    )
+
+    for row_idx, row in enumerate(rows):
+        tableau[row_idx] = row
+    if status in (Status.UNBOUNDED, Status.INFEASIBLE):
+        return (status, *unbounded_solution(tableau), winner)
+    return (status, *get_solution(tableau, mode, tol), winner)
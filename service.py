@@ -0,0 +1,401 @@
+"""
+This file contains a local solver service. It keeps a pool of warm worker
+processes running the simplex method and serves them over HTTP with a JSON
+protocol, so that callers do not pay the interpreter and import startup cost
+for every solve.
+"""
+
+import argparse
+import contextlib
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from cache import canonical_key
+from simplex import (
+    Mode,
+    Status,
+    apply_inequalities,
+    get_solution,
+    run_simplex,
+    to_tableau,
+    unbounded_solution,
+)
+
+
+def _solve_request(goal_function, constraints, inequalities, mode):
+    if inequalities is None:
+        inequalities = ["<="] * len(constraints)
+    constraints = apply_inequalities(constraints, inequalities)
+    tableau = to_tableau(goal_function, constraints, mode)
+
+    # The console tracing of the solver is of no use in a daemon.
+    status = run_simplex(tableau, trace=False)
+    if status == Status.OPTIMAL:
+        return (status, *get_solution(tableau, mode))
+    return (status, *unbounded_solution(tableau))
+
+
+def _worker_main(conn):
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+
+        try:
+            conn.send((True, _solve_request(*request)))
+        except Exception as e:
+            conn.send((False, repr(e)))
+
+
+class _Worker:
+    """
+    A single warm solver process, restarted whenever it exceeds the time limit
+    of a request or dies.
+    """
+
+    def __init__(self, context):
+        self.context = context
+        self._start()
+
+
+    def _start(self):
+        self.conn, child_conn = self.context.Pipe()
+        self.process = self.context.Process(
+            target=_worker_main,
+            args=(child_conn,),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+
+    def restart(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+        self._start()
+
+
+    def run(self, request, time_limit=None):
+        self.conn.send(request)
+        if not self.conn.poll(time_limit):
+            self.restart()
+            raise TimeoutError(f"time limit of {time_limit}s exceeded")
+        return self.conn.recv()
+
+
+    def stop(self):
+        with contextlib.suppress(OSError):
+            self.conn.send(None)
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+def _to_number(value, name: str) -> float:
+    """
+    Returns the given request field as a finite float, raising ValueError
+    otherwise. Unchecked fields would only fail in a dispatcher thread.
+    """
+
+    try:
+        ret = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name} must be a number, got {value!r}") from None
+    if not math.isfinite(ret):
+        raise ValueError(f"{name} must be finite, got {value!r}")
+    return ret
+
+
+def _percentile(values: list[float], q: float) -> float | None:
+    """
+    Returns the `q`-th percentile (0 <= q <= 100) of the given sorted values
+    using the nearest-rank method, or None if there are no values.
+    """
+
+    if len(values) == 0: return None
+    rank = max(1, -(-len(values)*q // 100))
+    return values[int(rank) - 1]
+
+
+class SolverService:
+    """
+    A pool of warm solver processes fed from a priority queue. Requests with a
+    lower `priority` value are served first, requests with equal priorities
+    are served in the order of submission. If a `cache` (see `cache.py`) is
+    given, repeated problems are answered from it without reaching a worker.
+    """
+
+    LATENCY_WINDOW = 1000
+
+    def __init__(
+            self,
+            workers: int | None = None,
+            time_limit: float | None = None,
+            cache = None,
+    ):
+        self.time_limit = time_limit
+        self.cache = cache
+
+        self._queue = queue.PriorityQueue()
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=self.LATENCY_WINDOW)
+        self._in_flight = 0
+        self._completed = 0
+        self._timed_out = 0
+        self._failed = 0
+
+        # Workers are restarted from the dispatcher threads, where forking is
+        # unsafe.
+        context = multiprocessing.get_context("spawn")
+        self._workers = [
+            _Worker(context) for _ in range(workers or os.cpu_count() or 1)
+        ]
+        self._dispatchers = [
+            threading.Thread(target=self._dispatch, args=(w,), daemon=True)
+                for w in self._workers
+        ]
+        for dispatcher in self._dispatchers:
+            dispatcher.start()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *_):
+        self.close()
+
+
+    def submit(
+            self,
+            goal_function: list[float],
+            constraints: list[list[float]],
+            inequalities: list[str] | None = None,
+            mode = Mode.MAXIMIZATION,
+            priority: int = 0,
+            time_limit: float | None = None,
+    ) -> Future:
+        """
+        Queues the given problem and returns a future of the final status and
+        the solution, in the same form as `perform_simplex`. The future raises
+        TimeoutError if solving takes longer than `time_limit` seconds (or the
+        service's default time limit). Raises ValueError if the `priority` or
+        the `time_limit` is not a finite number (or None for the latter) or
+        the time limit is negative.
+        """
+
+        priority = _to_number(priority, "priority")
+        if time_limit is not None:
+            time_limit = _to_number(time_limit, "time_limit")
+            if time_limit < 0:
+                raise ValueError(f"time_limit must not be negative, got {time_limit!r}")
+
+        future = Future()
+        key = None
+        if self.cache is not None:
+            key = canonical_key(goal_function, constraints, inequalities, mode)
+            result = self.cache.get(key)
+            # Only optimal solutions are cached by the service, since the
+            # cache does not tell infeasible problems from unbounded ones.
+            if result is not None and math.isfinite(result[1]):
+                future.set_result((Status.OPTIMAL, *result))
+                return future
+
+        request = (goal_function, constraints, inequalities, mode)
+        if time_limit is None:
+            time_limit = self.time_limit
+        job = (request, time_limit, future, key, time.monotonic())
+        self._queue.put((priority, next(self._counter), job))
+        return future
+
+
+    def solve(self, *args, **kwargs) -> tuple[Status, list[float], float]:
+        return self.submit(*args, **kwargs).result()
+
+
+    def stats(self) -> dict:
+        """
+        Returns the queue depth, request counters and latency percentiles (in
+        seconds) over the most recent requests.
+        """
+
+        with self._lock:
+            latencies = sorted(self._latencies)
+            ret = {
+                "workers": len(self._workers),
+                "queue_depth": self._queue.qsize(),
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "timed_out": self._timed_out,
+                "failed": self._failed,
+            }
+
+        ret["latency"] = {
+            f"p{q}": _percentile(latencies, q) for q in (50, 90, 99)
+        }
+        return ret
+
+
+    def close(self):
+        for _ in self._dispatchers:
+            self._queue.put((float('inf'), next(self._counter), None))
+        for dispatcher in self._dispatchers:
+            dispatcher.join()
+        for worker in self._workers:
+            worker.stop()
+
+
+    def _dispatch(self, worker):
+        while True:
+            _, _, job = self._queue.get()
+            if job is None: break
+
+            request, time_limit, future, key, submitted_at = job
+            if not future.set_running_or_notify_cancel(): continue
+
+            with self._lock:
+                self._in_flight += 1
+            try:
+                ok, payload = worker.run(request, time_limit)
+            except TimeoutError as e:
+                with self._lock:
+                    self._timed_out += 1
+                future.set_exception(e)
+            except (EOFError, OSError) as e:
+                worker.restart()
+                with self._lock:
+                    self._failed += 1
+                future.set_exception(RuntimeError(f"worker died: {e!r}"))
+            except Exception as e:
+                # The dispatcher must outlive any request, or every later one
+                # would hang. The worker may still answer the request, so it
+                # is restarted to keep its replies in step.
+                with contextlib.suppress(Exception):
+                    worker.restart()
+                with self._lock:
+                    self._failed += 1
+                future.set_exception(e)
+            else:
+                with self._lock:
+                    if ok: self._completed += 1
+                    else: self._failed += 1
+                if ok:
+                    status, solution, value = payload
+                    if key is not None and status == Status.OPTIMAL:
+                        self.cache.put(key, (solution, value))
+                    future.set_result(payload)
+                else:
+                    future.set_exception(RuntimeError(payload))
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+                    self._latencies.append(time.monotonic() - submitted_at)
+
+
+class SolverRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves `POST /solve` and `GET /stats`. A solve request is a JSON object
+    with the `goal_function` and `constraints` fields in the form accepted by
+    `to_tableau` and the optional `inequalities`, `mode` ("max" or "min"),
+    `priority` and `time_limit` fields. The reply holds the `status` of the
+    solve ("optimal", "unbounded" or "infeasible") and the `solution` and
+    `value`, which are null unless the status is optimal.
+    """
+
+    def do_GET(self):
+        if self.path != "/stats":
+            self._reply(404, {"error": "not found"})
+            return
+        self._reply(200, self.server.service.stats())
+
+
+    def do_POST(self):
+        if self.path != "/solve":
+            self._reply(404, {"error": "not found"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length))
+            future = self.server.service.submit(
+                body["goal_function"],
+                body["constraints"],
+                body.get("inequalities"),
+                Mode.MINIMIZATION if body.get("mode") == "min"
+                    else Mode.MAXIMIZATION,
+                body.get("priority", 0),
+                body.get("time_limit"),
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            self._reply(400, {"error": f"invalid request: {e!r}"})
+            return
+
+        try:
+            status, solution, value = future.result()
+        except TimeoutError as e:
+            self._reply(504, {"error": str(e)})
+        except Exception as e:
+            self._reply(500, {"error": str(e)})
+        else:
+            # Infinities are not valid JSON.
+            if status != Status.OPTIMAL:
+                solution, value = None, None
+            self._reply(200, {
+                "status": status.name.lower(), "solution": solution, "value": value,
+            })
+
+
+    def _reply(self, code, payload):
+        data = json.dumps(payload, allow_nan=False).encode()
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class SolverServer(ThreadingHTTPServer):
+
+    daemon_threads = True
+
+    def __init__(self, address, service):
+        super().__init__(address, SolverRequestHandler)
+        self.service = service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local simplex solver service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--time-limit", type=float, default=None)
+    args = parser.parse_args()
+
+    with SolverService(args.workers, args.time_limit) as service:
+        server = SolverServer((args.host, args.port), service)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+
+if __name__ == '__main__':
+    main()
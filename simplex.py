@@ -2,8 +2,15 @@
 This file contains the implementation of the simplex method.
 """
 
+import math
+import mmap
+import time
+from array import array
+from collections import deque
+from collections.abc import Generator
 from enum import Enum, auto
-from termcolor import colored
+from itertools import chain, islice
+from typing import NamedTuple
 
 
 class Mode(Enum):
@@ -11,137 +18,1534 @@ class Mode(Enum):
     MAXIMIZATION = auto(),
 
 
-def get_pivot_pos(tableau: list[list[float]]) -> tuple[int, int] | None:
+class Status(Enum):
+    OPTIMAL = auto()
+    UNBOUNDED = auto()
+    INFEASIBLE = auto()
+    TIME_LIMIT = auto()
+    ITERATION_LIMIT = auto()
+    CANCELLED = auto()
+
+
+class Tolerances(NamedTuple):
+    """
+    Tolerances of the float comparisons made by the solver. `primal` applies
+    to the free terms (feasibility) and to basis detection, `dual` to the
+    bottom row (optimality) and `pivot` is the smallest magnitude of an
+    acceptable pivot element; all three are absolute. Once the relative
+    primal or dual residual of the tableau (see `get_residuals`) exceeds
+    `residual`, it is rebuilt from the original data.
+    """
+
+    primal: float = 1e-9
+    dual: float = 1e-9
+    pivot: float = 1e-9
+    residual: float = 1e-9
+
+
+DEFAULT_TOLERANCES = Tolerances()
+
+# Tolerances of the single precision solve of `run_mixed_precision`, whose
+# rounding errors are around 1e-7.
+SINGLE_PRECISION_TOLERANCES = Tolerances(1e-5, 1e-5, 1e-6, 1e-4)
+
+# Maximum number of iterative refinement steps of `refine`.
+REFINEMENT_STEPS = 3
+
+# Smallest ratio of a pivot element of `get_crash_pivots` to the largest
+# element of its column.
+CRASH_PIVOT_RATIO = 0.01
+
+# Number of pivots between residual checks of `iterate_simplex`.
+REFACTOR_INTERVAL = 50
+
+# Default maximum number of solutions returned by `get_alternative_solutions`.
+ALTERNATIVE_SOLUTIONS_LIMIT = 100
+
+
+class Crash(Enum):
+    """
+    Procedures choosing an initial basis of structural columns before the
+    first iteration of the simplex method (see `get_crash_pivots`).
+    """
+
+    NONE = auto()
+    LTSF = auto()
+    BIXBY = auto()
+
+
+class Pricing(Enum):
+    """
+    Rules choosing the column entering the basis in `get_pivot_pos`. DANTZIG
+    takes the most negative element of the bottom row, BLAND the first
+    negative one and GREATEST_IMPROVEMENT the one whose pivot improves the
+    goal function the most.
+    """
+
+    DANTZIG = auto()
+    BLAND = auto()
+    GREATEST_IMPROVEMENT = auto()
+
+
+class SolveStats:
+    """
+    Counters of a single solve filled in by `iterate_simplex`. `pivots` is the
+    total number of pivots, including the `crash_pivots`.
+    """
+
+    __slots__ = ('pivots', 'crash_pivots', 'refactorizations')
+
+    def __init__(self):
+        self.pivots = 0
+        self.crash_pivots = 0
+        self.refactorizations = 0
+
+
+    def __repr__(self) -> str:
+        return (
+            f"SolveStats(pivots={self.pivots}, "
+            f"crash_pivots={self.crash_pivots}, "
+            f"refactorizations={self.refactorizations})"
+        )
+
+
+class SolveResult:
+    """
+    The outcome of a solve (see `solve_with_budget`). The status and the
+    objective value are known up front, while the values read from the final
+    tableau, i.e. the basis, the solution, the slacks, the dual values and the
+    reduced costs, are only extracted on first access, so callers pay only for
+    what they use. Until then the result refers to the tableau, which should
+    not be modified in the meantime.
+
+    `objective` is the value of the goal function at the final vertex, or
+    None if no feasible vertex was reached, and `bound` is the best possible
+    objective value proven so far. `gap` is the distance between the two
+    relative to the objective (0 if optimal, inf if either is missing).
+    """
+
+    __slots__ = (
+        'status', 'objective', 'bound', 'gap',
+        '_tableau', '_mode', '_tol',
+        '_basis', '_solution', '_slacks', '_duals', '_reduced_costs',
+    )
+
+    def __init__(
+            self,
+            status: Status,
+            tableau: list[list[float]] | None = None,
+            mode = Mode.MAXIMIZATION,
+            tol = DEFAULT_TOLERANCES,
+            bound: float | None = None,
+            gap: float | None = None,
+    ):
+        """
+        Creates the result of a solve which ended with the given status and
+        tableau, or without a feasible vertex if the tableau is None. The
+        bound and the gap of an optimal or unbounded solve default to the
+        objective value and 0.
+        """
+
+        self.status = status
+        self._tableau = tableau
+        self._mode = mode
+        self._tol = tol
+        self._basis = None
+        self._solution = None
+        self._slacks = None
+        self._duals = None
+        self._reduced_costs = None
+
+        # A minimization tableau maximizes the negated goal function.
+        if tableau is None:
+            self.objective = None
+        elif status == Status.UNBOUNDED:
+            self.objective = self._sign*float('inf')
+        elif mode == Mode.MAXIMIZATION:
+            self.objective = tableau[-1][-1]
+        else:
+            self.objective = -tableau[-1][-1]
+
+        solved = status in (Status.OPTIMAL, Status.UNBOUNDED)
+        self.bound = self.objective if bound is None and solved else bound
+        if gap is None:
+            gap = 0.0 if solved else float('inf')
+        self.gap = gap
+
+
+    @property
+    def _sign(self) -> int:
+        return 1 if self._mode == Mode.MAXIMIZATION else -1
+
+
+    @property
+    def basis(self) -> list[int | None] | None:
+        """
+        The basic column of every constraint row (see `get_basis`).
+        """
+
+        if self._basis is None and self._tableau is not None:
+            self._basis = get_basis(self._tableau, self._tol)
+        return self._basis
+
+
+    @property
+    def solution(self) -> list[float] | None:
+        """
+        The values of the non-slack variables, which are infinite if the
+        problem is unbounded.
+        """
+
+        if self._solution is None and self._tableau is not None:
+            var_count = get_var_count(self._tableau)
+            if self.status == Status.UNBOUNDED:
+                self._solution = [float('inf') for _ in range(var_count)]
+            else:
+                self._solution = [0 for _ in range(var_count)]
+                for row_idx, col_idx in enumerate(self.basis):
+                    if col_idx != None and col_idx < var_count:
+                        self._solution[col_idx] = self._tableau[row_idx][-1]
+        return self._solution
+
+
+    @property
+    def slacks(self) -> list[float] | None:
+        """
+        The values of the slack variables, i.e. the free terms minus the left
+        hand sides of the constraints.
+        """
+
+        if self._slacks is None and self._tableau is not None:
+            var_count = get_var_count(self._tableau)
+            self._slacks = [0 for _ in range(len(self._tableau) - 1)]
+            for row_idx, col_idx in enumerate(self.basis):
+                if col_idx != None and var_count <= col_idx < var_count + len(self._slacks):
+                    self._slacks[col_idx - var_count] = self._tableau[row_idx][-1]
+        return self._slacks
+
+
+    @property
+    def duals(self) -> list[float] | None:
+        """
+        The dual values (shadow prices) of the constraints, i.e. the rates of
+        change of the objective value with their free terms.
+        """
+
+        if self._duals is None and self._tableau is not None:
+            var_count = get_var_count(self._tableau)
+            bottom_row = self._tableau[-1]
+            self._duals = [
+                self._sign*bottom_row[var_count + i] for i in range(len(self._tableau) - 1)
+            ]
+        return self._duals
+
+
+    @property
+    def reduced_costs(self) -> list[float] | None:
+        """
+        The reduced costs of the non-slack variables, i.e. the rates of change
+        of the objective value with their values.
+        """
+
+        if self._reduced_costs is None and self._tableau is not None:
+            bottom_row = self._tableau[-1]
+            self._reduced_costs = [
+                -self._sign*bottom_row[col_idx]
+                    for col_idx in range(get_var_count(self._tableau))
+            ]
+        return self._reduced_costs
+
+
+    def __repr__(self) -> str:
+        return (
+            f"SolveResult(status={self.status}, objective={self.objective}, "
+            f"bound={self.bound}, gap={self.gap})"
+        )
+
+
+# Approximate number of bytes of a row block of `Tableau.pivot`.
+PIVOT_BLOCK_BYTES = 1 << 20
+
+
+class Tableau:
+    """
+    A tableau stored in a single flat buffer of doubles instead of a list of
+    lists of boxed floats, which takes about a quarter of the memory. Rows are
+    exposed as memoryviews into the buffer, so a Tableau can be used wherever
+    a list[list[float]] tableau is, and pivoting updates it in place.
+
+    With the 'f' typecode, the buffer holds single precision floats instead,
+    which halves the memory and the bandwidth of pivoting at the cost of
+    precision (see `run_mixed_precision`).
+    """
+
+    __slots__ = ('height', 'width', 'buffer', '_view', '_rows', '_nonzero')
+
+    def __init__(self, height: int, width: int, buffer = None, typecode: str = 'd'):
+        """
+        Creates a tableau of the given size backed by the given writable
+        buffer of at least `height*width` items of the given typecode (a
+        zeroed array by default).
+        """
+
+        if buffer is None:
+            buffer = array(typecode, bytes(array(typecode).itemsize*height*width))
+
+        self.height = height
+        self.width = width
+        self.buffer = buffer
+
+        self._view = memoryview(buffer).cast('B').cast(typecode)
+        self._rows = [
+            self._view[i*width:(i + 1)*width] for i in range(height)
+        ]
+        self._nonzero = None
+
+
+    @classmethod
+    def from_rows(cls, rows: list[list[float]], typecode: str = 'd') -> 'Tableau':
+        width = len(rows[0]) if len(rows) > 0 else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError("All rows of a tableau must have the same length")
+
+        return cls(
+            len(rows), width, array(typecode, chain.from_iterable(rows)), typecode,
+        )
+
+
+    @classmethod
+    def open_file(cls, path: str, height: int, width: int) -> 'Tableau':
+        """
+        Returns a tableau stored in the file at `path`, which is created or
+        resized to hold `height*width` doubles. The file is memory-mapped, so
+        the operating system pages the rows in and out as needed and tableaux
+        larger than the memory can be solved. All changes are written to the
+        file. The tableau should be closed with `close` when no longer needed.
+        """
+
+        size = 8*height*width
+        if size == 0:
+            raise ValueError("A memory-mapped tableau cannot be empty")
+
+        with open(path, 'a+b') as f:
+            f.truncate(size)
+            buffer = mmap.mmap(f.fileno(), size)
+
+        return cls(height, width, buffer)
+
+
+    @property
+    def mapped(self) -> bool:
+        return isinstance(self.buffer, mmap.mmap)
+
+
+    @property
+    def traced(self) -> bool:
+        """
+        Whether `pivot_at` prints the tableau on every pivot, which would take
+        longer than the pivot itself for a memory-mapped tableau.
+        """
+
+        return not self.mapped
+
+
+    @property
+    def typecode(self) -> str:
+        return self._view.format
+
+
+    def close(self):
+        """
+        Releases the rows and closes the underlying buffer if it is
+        memory-mapped, flushing it to its file.
+        """
+
+        for row in self._rows:
+            row.release()
+        self._view.release()
+        self._rows = []
+
+        if self.mapped:
+            self.buffer.flush()
+            self.buffer.close()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *_):
+        self.close()
+
+
+    def __len__(self) -> int:
+        return self.height
+
+
+    def __getitem__(self, idx):
+        return self._rows[idx]
+
+
+    def __setitem__(self, idx: int, values: list[float]):
+        row = self._rows[idx]
+        for col_idx, val in enumerate(values):
+            row[col_idx] = val
+
+
+    def __iter__(self):
+        return iter(self._rows)
+
+
+    def __eq__(self, other) -> bool:
+        if len(self) != len(other): return False
+        return all(list(a) == list(b) for a, b in zip(self, other))
+
+
+    def __repr__(self) -> str:
+        return f"Tableau.from_rows({self.tolist()!r})"
+
+
+    def tolist(self) -> list[list[float]]:
+        return [row.tolist() for row in self._rows]
+
+
+    def copy(self) -> 'Tableau':
+        """
+        Returns a copy of the tableau backed by a new array of the same
+        typecode.
+        """
+
+        data = array(self.typecode)
+        for row in self._rows:
+            data.frombytes(row.cast('B'))
+
+        return Tableau(self.height, self.width, data, self.typecode)
+
+
+    def pivot(self, pos: tuple[int, int]):
+        """
+        Performs pivoting around the element at the given position in place
+        like `pivot_at` (see `eliminate`).
+        """
+
+        self.eliminate(pos, self.normalize(pos), 0, self.height)
+
+
+    def normalize(self, pos: tuple[int, int]) -> memoryview:
+        """
+        Divides the row of the element at the given position by the element in
+        place and returns the row.
+        """
+
+        pivot_row_idx, pivot_col_idx = pos
+
+        row = self._rows[pivot_row_idx]
+        pivot = row[pivot_col_idx]
+        for col_idx in range(self.width):
+            row[col_idx] /= pivot
+        row[pivot_col_idx] = 1.0
+        return row
+
+
+    def eliminate(
+            self,
+            pos: tuple[int, int],
+            pivot_row: list[float],
+            start: int,
+            stop: int,
+    ):
+        """
+        Performs the elimination step of pivoting around the element at the
+        given position on the rows from `start` to `stop`, given the already
+        normalized pivot row (e.g. the row itself, see `normalize`).
+
+        The rows of an in-memory tableau are updated in place, only in the
+        columns where the pivot row is nonzero, whose indices are collected
+        into a buffer kept across pivots. The rows of a memory-mapped tableau
+        are updated in blocks of about `PIVOT_BLOCK_BYTES`, each read from and
+        written back to the file as a single contiguous chunk, so the file is
+        streamed through once per pivot.
+        """
+
+        if self.mapped:
+            self._eliminate_blocks(pos, pivot_row, start, stop)
+            return
+
+        pivot_row_idx, pivot_col_idx = pos
+        if self._nonzero is None:
+            self._nonzero = [None] * self.width
+        nonzero = self._nonzero
+        nonzero_count = 0
+        for col_idx in range(self.width):
+            y = pivot_row[col_idx]
+            if y != 0 and col_idx != pivot_col_idx:
+                nonzero[nonzero_count] = (col_idx, y)
+                nonzero_count += 1
+
+        for row_idx in range(start, stop):
+            row = self._rows[row_idx]
+            if row_idx == pivot_row_idx:
+                if pivot_row is not row:
+                    for col_idx in range(self.width):
+                        row[col_idx] = pivot_row[col_idx]
+                continue
+
+            multiplier = row[pivot_col_idx]
+            if multiplier == 0: continue
+
+            for col_idx, y in islice(nonzero, nonzero_count):
+                row[col_idx] -= multiplier*y
+            row[pivot_col_idx] = 0.0
+
+
+    def _eliminate_blocks(self, pos, pivot_row, start, stop):
+        pivot_row_idx, pivot_col_idx = pos
+        width = self.width
+        typecode = self.typecode
+
+        block_height = max(1, PIVOT_BLOCK_BYTES // (self._view.itemsize*width))
+        for block_start in range(start, stop, block_height):
+            block_stop = min(block_start + block_height, stop)
+            block = self._view[block_start*width:block_stop*width].tolist()
+
+            for row_idx in range(block_start, block_stop):
+                begin = (row_idx - block_start)*width
+                end = begin + width
+                if row_idx == pivot_row_idx:
+                    block[begin:end] = pivot_row
+                    continue
+
+                multiplier = block[begin + pivot_col_idx]
+                if multiplier == 0: continue
+
+                block[begin:end] = [
+                    x - multiplier*y for x, y in zip(block[begin:end], pivot_row)
+                ]
+                block[begin + pivot_col_idx] = 0.0
+
+            self._view[block_start*width:block_stop*width] = array(typecode, block)
+
+
+# Number of pivots between the tableau snapshots of a `PivotLog`.
+SNAPSHOT_INTERVAL = 16
+
+
+class PivotLog:
+    """
+    The pivot sequence of a solve stored compactly as four ints per pivot: the
+    row and column of the pivot element and the indices of the entering and
+    leaving variables (-1 if unknown). Every `snapshot_interval` pivots a
+    copy of the tableau is kept, from which any intermediate tableau is
+    rebuilt on demand (see `tableau_at`).
+    """
+
+    __slots__ = ('pivots', 'snapshot_interval', 'snapshots')
+
+    def __init__(self, snapshot_interval: int = SNAPSHOT_INTERVAL):
+        self.pivots = array('i')
+        self.snapshot_interval = snapshot_interval
+        # Maps the number of pivots to a Tableau holding the tableau after them.
+        self.snapshots = {}
+
+
+    def __len__(self) -> int:
+        return len(self.pivots) // 4
+
+
+    def __getitem__(self, idx: int) -> tuple[int, int, int, int]:
+        if idx < 0: idx += len(self)
+        if not 0 <= idx < len(self): raise IndexError("pivot index out of range")
+        return tuple(self.pivots[4*idx:4*idx + 4])
+
+
+    def record(
+            self,
+            tableau: list[list[float]],
+            pos: tuple[int, int],
+            leaving: int | None,
+    ):
+        """
+        Records the pivot at the given position, which is about to be
+        performed on the tableau.
+        """
+
+        if len(self) % self.snapshot_interval == 0:
+            self.snapshot(tableau)
+        self.pivots.extend((*pos, pos[1], -1 if leaving == None else leaving))
+
+
+    def snapshot(self, tableau: list[list[float]]):
+        """
+        Stores a copy of the tableau as the state after the recorded pivots.
+        """
+
+        width = len(tableau[0]) if len(tableau) > 0 else 0
+        if isinstance(tableau, Tableau):
+            data = tableau.copy().buffer
+        else:
+            data = array('d', chain.from_iterable(tableau))
+        self.snapshots[len(self)] = Tableau(len(tableau), width, data)
+
+
+    def tableau_at(self, step: int) -> Tableau:
+        """
+        Returns the tableau after the first `step` pivots, rebuilt from the
+        nearest preceding snapshot.
+        """
+
+        if not 0 <= step <= len(self): raise IndexError("step out of range")
+
+        start = max(k for k in self.snapshots if k <= step)
+        tableau = self.snapshots[start].copy()
+        for idx in range(start, step):
+            row_idx, col_idx, _, _ = self[idx]
+            tableau.pivot((row_idx, col_idx))
+
+        return tableau
+
+
+def get_pivot_pos(
+        tableau: list[list[float]],
+        tol = DEFAULT_TOLERANCES,
+        pricing = Pricing.DANTZIG,
+        basis: list[int | None] | None = None,
+) -> tuple[int, int] | None:
     """
     Returns the position of the pivot element or None if there is no such
-    element.
+    element. The column is chosen by the given `pricing` rule. Bland's rule
+    also breaks the ties of the ratio test by the smallest index of the basic
+    column, which is read from `basis` (or from the tableau if it is None).
     """
 
+    if pricing == Pricing.GREATEST_IMPROVEMENT:
+        return _get_greatest_improvement_pivot_pos(tableau, tol)
+
     # Find column position
     col_idx = None
-    for idx, val in enumerate(tableau[-1]):
-        if val >= 0: continue
+    for idx, val in enumerate(tableau[-1][:-1]):
+        if val >= -tol.dual: continue
         if col_idx == None or val < tableau[-1][col_idx]:
             col_idx = idx
+        if pricing == Pricing.BLAND: break
 
     if col_idx == None: return None
 
-    # Find row position
-    quotients = [float('inf') for _ in range(len(tableau))]
-    for idx in range(len(tableau)):
-        numerator = tableau[idx][-1]
+    if pricing != Pricing.BLAND:
+        basis = None
+    elif basis == None:
+        basis = get_basis(tableau, tol)
+    row_idx = get_pivot_row(tableau, col_idx, tol, basis)
+    if row_idx == None: return None
+
+    return (row_idx, col_idx)
+
+
+def _get_greatest_improvement_pivot_pos(tableau, tol):
+    # The improvement of a pivot is the product of the element of the bottom
+    # row and the quotient of the pivot row. An unbounded column is returned
+    # immediately, as its improvement is infinite.
+    best_pos, best_improvement = None, -1.0
+    for col_idx, val in enumerate(tableau[-1][:-1]):
+        if val >= -tol.dual: continue
+        row_idx = get_pivot_row(tableau, col_idx, tol)
+        if row_idx == None: return None
+
+        improvement = -val * max(tableau[row_idx][-1], 0.0) / tableau[row_idx][col_idx]
+        if improvement > best_improvement:
+            best_pos, best_improvement = (row_idx, col_idx), improvement
+
+    return best_pos
+
+
+def get_pivot_row(
+        tableau: list[list[float]],
+        col_idx: int,
+        tol = DEFAULT_TOLERANCES,
+        basis: list[int | None] | None = None,
+) -> int | None:
+    """
+    Returns the index of the row leaving the basis when the given column
+    enters it or None if there is no such row, i.e. if the column is
+    unbounded. Ties are broken by the first row or, if the `basis` is given,
+    by the smallest index of the basic column as required by Bland's rule.
+    """
+
+    # Rows with a (nearly) zero or negative element in the pivot column do not
+    # bound the entering variable. A zero free term is a valid, degenerate
+    # quotient.
+    quotients = [float('inf') for _ in range(len(tableau) - 1)]
+    for idx in range(len(tableau) - 1):
+        numerator = max(tableau[idx][-1], 0.0)
         denominator = tableau[idx][col_idx]
-        if denominator == 0.0: continue
-        val = numerator / denominator
-        if val <= 0.0: continue
-        quotients[idx] = val
+        if denominator <= tol.pivot: continue
+        quotients[idx] = numerator / denominator
+    if len(quotients) == 0: return None
     row_idx = 0
     for idx in range(len(quotients)):
         if quotients[idx] < quotients[row_idx]:
             row_idx = idx
 
     if quotients[row_idx] == float('inf'): return None
+    if basis == None: return row_idx
+
+    min_quotient = quotients[row_idx]
+    for idx in range(len(quotients)):
+        if quotients[idx] - min_quotient > tol.primal: continue
+        if _basis_key(basis[idx]) < _basis_key(basis[row_idx]):
+            row_idx = idx
+
+    return row_idx
+
+
+def get_dual_pivot_pos(
+        tableau: list[list[float]],
+        tol = DEFAULT_TOLERANCES,
+) -> tuple[int, int] | None:
+    """
+    Returns the position of the pivot element of the dual simplex method or
+    None if there is no such element, i.e. if the row with the most negative
+    free term has no negative coefficients, which means that the problem is
+    infeasible. It is assumed that some free term is negative.
+    """
+
+    # Find row position
+    row_idx = 0
+    for idx in range(len(tableau) - 1):
+        if tableau[idx][-1] < tableau[row_idx][-1]:
+            row_idx = idx
+
+    # Find column position
+    col_idx = None
+    min_quotient = float('inf')
+    for idx, val in enumerate(tableau[row_idx][:-1]):
+        if val >= -tol.pivot: continue
+        quotient = max(tableau[-1][idx], 0.0) / -val
+        if quotient < min_quotient:
+            col_idx = idx
+            min_quotient = quotient
+
+    if col_idx == None: return None
 
     return (row_idx, col_idx)
 
 
-def perform_pivoting(tableau: list[list[float]]) -> bool:
+def get_leaving_row(
+        tableau: list[list[float]],
+        basis: list[int | None],
+        tol = DEFAULT_TOLERANCES,
+        free_cols = frozenset(),
+) -> int | None:
+    """
+    Returns the infeasible row whose basic column has the smallest index or
+    None if the tableau is feasible. Rows whose basic column is in
+    `free_cols`, i.e. belongs to a variable which may be negative, are never
+    infeasible. Rows without a basic column come last.
+    """
+
+    row_idx = None
+    for idx in range(len(tableau) - 1):
+        if tableau[idx][-1] >= -tol.primal: continue
+        if basis[idx] in free_cols: continue
+        if row_idx == None or _basis_key(basis[idx]) < _basis_key(basis[row_idx]):
+            row_idx = idx
+
+    return row_idx
+
+
+def _basis_key(col_idx):
+    return float('inf') if col_idx == None else col_idx
+
+
+def get_feasibility_pivot_pos(
+        tableau: list[list[float]],
+        basis: list[int | None],
+        tol = DEFAULT_TOLERANCES,
+        free_cols = frozenset(),
+) -> tuple[int, int] | None:
+    """
+    Returns the position of the pivot element of the dual simplex method
+    applied to the tableau with the goal function ignored (i.e. replaced by
+    zero, for which every basis is optimal), or None if the leaving row
+    proves that the tableau is infeasible. It is assumed that the tableau is
+    infeasible (see `get_leaving_row`).
+
+    As all quotients of the ratio test are zero, both the leaving row and the
+    entering column are chosen by Bland's rule, which prevents cycling.
+    Columns in `free_cols` may enter the basis with elements of either sign.
+    """
+
+    row_idx = get_leaving_row(tableau, basis, tol, free_cols)
+
+    for col_idx, val in enumerate(tableau[row_idx][:-2]):
+        if val < -tol.pivot or (col_idx in free_cols and val > tol.pivot):
+            return (row_idx, col_idx)
+
+    return None
+
+
+def perform_pivoting(
+        tableau: list[list[float]],
+        tol = DEFAULT_TOLERANCES,
+) -> bool:
     """
     Performs pivoting on the tableau, i.e. a process of obtaining a 1 in the
     location of the pivot element, and then making all other entries 0 in the
     pivot column. The given tableau is modified in place.
     """
 
-    pos = get_pivot_pos(tableau)
+    pos = get_pivot_pos(tableau, tol)
     if pos == None: return False
+    pivot_at(tableau, pos)
+
+    return True
+
+
+def pivot_at(tableau: list[list[float]], pos: tuple[int, int], trace: bool = True):
+    """
+    Performs pivoting on the tableau around the element at the given
+    position. The given tableau is modified in place. The tableau is printed
+    before and during the pivot unless `trace` is False.
+    """
+
+    if isinstance(tableau, Tableau):
+        if trace and tableau.traced:
+            print(tableau_to_str(tableau, pivot_pos=pos))
+        tableau.pivot(pos)
+        return
+
     pivot_row_idx, pivot_col_idx = pos
 
-    print(tableau_to_str(tableau, pivot_pos=pos))
+    if trace: print(tableau_to_str(tableau, pivot_pos=pos))
 
     # Make the pivot element a 1:
-    pivot = tableau[pivot_row_idx][pivot_col_idx]
-    tableau[pivot_row_idx] = [x/pivot for x in tableau[pivot_row_idx]]
+    pivot_row = tableau[pivot_row_idx]
+    pivot = pivot_row[pivot_col_idx]
+    for col_idx in range(len(pivot_row)):
+        pivot_row[col_idx] /= pivot
 
-    print(tableau_to_str(tableau))
+    if trace: print(tableau_to_str(tableau))
 
     # Make all other entries 0 in the pivot column:
-    for row_idx in range(len(tableau)):
+    for row_idx, row in enumerate(tableau):
         if row_idx == pivot_row_idx: continue
 
-        multiplier = tableau[row_idx][pivot_col_idx]
+        multiplier = row[pivot_col_idx]
+        if multiplier == 0: continue
 
-        for col_idx, col_val in enumerate(tableau[row_idx]):
-            pivot_row_val = tableau[pivot_row_idx][col_idx]
-            tableau[row_idx][col_idx] = col_val - multiplier*pivot_row_val
+        for col_idx in range(len(row)):
+            row[col_idx] -= multiplier*pivot_row[col_idx]
 
-    return True
+    # Store the pivot column exactly, so that rounding errors do not blur the
+    # basis.
+    for row_idx, row in enumerate(tableau):
+        row[pivot_col_idx] = 1.0 if row_idx == pivot_row_idx else 0.0
 
 
-def is_basic(column: list[float]) -> bool:
+def is_basic(column: list[float], tol = DEFAULT_TOLERANCES) -> bool:
     """
-    Checks if the given column consists of all 0, except for a single 1.
+    Checks if the given column consists of all 0, except for a single 1, up to
+    the primal tolerance.
     """
-    return sum(column) == 1 and len([c for c in column if c == 0]) == len(column) - 1
+    ones = len([c for c in column if abs(c - 1) <= tol.primal])
+    zeros = len([c for c in column if abs(c) <= tol.primal])
+    return ones == 1 and zeros == len(column) - 1
+
+
+def get_basis(
+        tableau: list[list[float]],
+        tol = DEFAULT_TOLERANCES,
+) -> list[int | None]:
+    """
+    Returns the index of the basic column of every constraint row of the
+    tableau, or None for rows without one.
+    """
+
+    # The tableau is scanned row by row, so that a memory-mapped one is read
+    # through once. A column is basic if it holds a single 1 and zeros
+    # elsewhere (see `is_basic`).
+    width = len(tableau[-1]) - 2
+    one_rows = [None for _ in range(width)]
+    one_counts = [0 for _ in range(width)]
+    other_counts = [0 for _ in range(width)]
+    for row_idx, row in enumerate(tableau):
+        for col_idx, val in enumerate(row[:width]):
+            if abs(val - 1) <= tol.primal:
+                one_counts[col_idx] += 1
+                one_rows[col_idx] = row_idx
+            elif abs(val) > tol.primal:
+                other_counts[col_idx] += 1
+
+    basis = [None for _ in range(len(tableau) - 1)]
+    for col_idx in range(width):
+        if one_counts[col_idx] != 1 or other_counts[col_idx] != 0: continue
+        row_idx = one_rows[col_idx]
+        if row_idx < len(basis) and basis[row_idx] == None:
+            basis[row_idx] = col_idx
+
+    return basis
 
 
 def get_solution(
         tableau: list[list[float]],
         mode = Mode.MAXIMIZATION,
+        tol = DEFAULT_TOLERANCES,
 ) -> tuple[list[float], float]:
     """
     Returns the solution and it's objective function value in the following
     form: ([x1, x2, ..., xn], v), where x1, x2, ..., xn are values of the
     non-slack variables and v is the value of the objective function in that
-    point. It is assumed that the given tableau is optimal.
+    point. It is assumed that the given tableau is optimal. See `SolveResult`
+    for the other values of the solution.
     """
 
-    solution = []
-    sol_idxs = set()
+    result = SolveResult(Status.OPTIMAL, tableau, mode, tol)
+    return result.solution, result.objective
 
-    if mode == Mode.MINIMIZATION:
-        var_count = len(tableau) - 1
-        var_start_idx = len(tableau[-1]) - var_count - 2
-        sol_idxs.add((var_start_idx, len(tableau) - 1))
-        for i in range(var_count):
-            solution.append(tableau[-1][var_start_idx + i])
-            sol_idxs.add((len(tableau) - 1, var_start_idx + i))
-    else:
-        for col_idx in range(len(tableau[:-1])):
-            column = [tableau[r][col_idx] for r in range(len(tableau))]
-            partial_solution = 0
-            if is_basic(column):
-                one_index = column.index(1)
-                partial_solution = tableau[one_index][-1]
-                sol_idxs.add((one_index, len(tableau[one_index]) - 1))
-            solution.append(partial_solution)
-
-    sol_idxs.add((len(tableau) - 1, len(tableau[-1]) - 1))
-    print(tableau_to_str(tableau, sol_idxs=sol_idxs))
-    print(f"f({", ".join([str(x) for x in solution])}) = {tableau[-1][-1]}\n")
-    return solution, tableau[-1][-1]
-
-
-def can_be_improved(tableau: list[list[float]]) -> bool:
+
+def get_alternative_solutions(
+        tableau: list[list[float]],
+        mode = Mode.MAXIMIZATION,
+        limit: int = ALTERNATIVE_SOLUTIONS_LIMIT,
+        tol = DEFAULT_TOLERANCES,
+) -> list[tuple[list[float], float]]:
+    """
+    Returns up to `limit` distinct optimal solutions of the given optimal
+    tableau in the form returned by `get_solution`, starting with the one of
+    the tableau itself. The given tableau is not modified.
+
+    The other vertices of the optimal face are reached by pivoting on the
+    non-basic columns with zero reduced costs, which keeps the value of the
+    goal function, trying every leaving row the ratio test allows. The bases
+    are searched breadth-first, so the nearest alternatives come first, and
+    every basis is visited once.
+    """
+
+    var_count = get_var_count(tableau)
+    value = tableau[-1][-1] if mode == Mode.MAXIMIZATION else -tableau[-1][-1]
+    digits = max(0, round(-math.log10(tol.primal)))
+
+    start = Tableau.from_rows([list(row) for row in tableau])
+    basis = get_basis(start, tol)
+    seen_bases = {frozenset(basis)}
+    seen_solutions = set()
+    solutions = []
+    queue = deque([(start, basis)])
+
+    while queue and len(solutions) < limit:
+        current, basis = queue.popleft()
+
+        solution = [0.0 for _ in range(var_count)]
+        for row_idx, col_idx in enumerate(basis):
+            if col_idx != None and col_idx < var_count:
+                solution[col_idx] = current[row_idx][-1]
+        key = tuple(round(x, digits) + 0.0 for x in solution)
+        if key not in seen_solutions:
+            seen_solutions.add(key)
+            solutions.append((solution, value))
+
+        for col_idx in range(len(current[-1]) - 2):
+            if col_idx in basis or abs(current[-1][col_idx]) > tol.dual: continue
+
+            # All rows with the smallest quotient may leave the basis.
+            quotients = {}
+            for row_idx in range(len(current) - 1):
+                denominator = current[row_idx][col_idx]
+                if denominator <= tol.pivot: continue
+                quotients[row_idx] = max(current[row_idx][-1], 0) / denominator
+            if len(quotients) == 0: continue
+            min_quotient = min(quotients.values())
+
+            for row_idx, quotient in quotients.items():
+                if quotient > min_quotient + tol.primal: continue
+                next_basis = list(basis)
+                next_basis[row_idx] = col_idx
+                if frozenset(next_basis) in seen_bases: continue
+                seen_bases.add(frozenset(next_basis))
+
+                next_tableau = current.copy()
+                next_tableau.pivot((row_idx, col_idx))
+                queue.append((next_tableau, next_basis))
+
+    return solutions
+
+
+def get_var_count(tableau: list[list[float]]) -> int:
+    """
+    Returns the number of non-slack variables of the given tableau, which has
+    a slack variable for every constraint and a column for the goal function
+    in addition to them.
+    """
+
+    return len(tableau[-1]) - len(tableau) - 1
+
+
+def is_feasible(tableau: list[list[float]], tol = DEFAULT_TOLERANCES) -> bool:
+    return all(tableau[r][-1] >= -tol.primal for r in range(len(tableau) - 1))
+
+
+def can_be_improved(tableau: list[list[float]], tol = DEFAULT_TOLERANCES) -> bool:
     z = tableau[-1]
-    return any(x < 0 for x in z[:-1])
+    return any(x < -tol.dual for x in z[:-1])
+
+
+def get_residuals(
+        original: list[list[float]],
+        tableau: list[list[float]],
+        basis: list[int],
+) -> tuple[float, float]:
+    """
+    Returns the largest primal and dual residuals of the tableau with respect
+    to the original tableau it was obtained from by pivoting. The primal
+    residual measures how well the current vertex satisfies the original
+    constraints, the dual one how well the bottom row matches the original
+    one combined with the dual values read from the slack columns.
+
+    Both are relative to the magnitude of the terms they are computed from,
+    so that they do not grow with the scale of the data.
+    """
+
+    var_count = get_var_count(tableau)
+
+    x = [0.0 for _ in range(len(tableau[-1]) - 2)]
+    for row_idx, col_idx in enumerate(basis):
+        x[col_idx] = tableau[row_idx][-1]
+
+    primal = 0.0
+    for row in original[:-1]:
+        terms = [a*b for a, b in zip(row, x)]
+        scale = 1.0 + abs(row[-1]) + sum(abs(term) for term in terms)
+        primal = max(primal, abs(sum(terms) - row[-1]) / scale)
+
+    y = [tableau[-1][var_count + i] for i in range(len(basis))]
+
+    dual = 0.0
+    for col_idx in chain(range(len(x)), [-1]):
+        terms = [y[row_idx]*original[row_idx][col_idx] for row_idx in range(len(basis))]
+        expected = original[-1][col_idx] + sum(terms)
+        scale = 1.0 + abs(original[-1][col_idx]) + sum(abs(term) for term in terms)
+        dual = max(dual, abs(tableau[-1][col_idx] - expected) / scale)
+
+    return primal, dual
+
+
+def refactor(
+        original: list[list[float]],
+        basis: list[int],
+        tol = DEFAULT_TOLERANCES,
+) -> list[list[float]]:
+    """
+    Returns the tableau obtained from the original one by making the given
+    columns basic, the i-th one in the i-th row. It is computed directly with
+    Gauss-Jordan elimination with partial pivoting, so it carries none of the
+    rounding errors accumulated over the pivots of a long solve. Raises
+    ValueError if the basis is singular.
+    """
+
+    result = [list(row) for row in original]
+    for row_idx, col_idx in enumerate(basis):
+        pivot_row_idx = max(
+            range(row_idx, len(basis)),
+            key=lambda r: abs(result[r][col_idx]),
+        )
+        if abs(result[pivot_row_idx][col_idx]) <= tol.pivot:
+            raise ValueError("The basis of the tableau is singular")
+        result[row_idx], result[pivot_row_idx] = result[pivot_row_idx], result[row_idx]
+
+        pivot_row = result[row_idx]
+        pivot = pivot_row[col_idx]
+        for i in range(len(pivot_row)):
+            pivot_row[i] /= pivot
+
+        for other_idx, row in enumerate(result):
+            if other_idx == row_idx: continue
+            multiplier = row[col_idx]
+            if multiplier == 0: continue
+            for i in range(len(row)):
+                row[i] -= multiplier*pivot_row[i]
+            row[col_idx] = 0.0
+
+    return result
+
+
+def refine(
+        original: list[list[float]],
+        tableau: list[list[float]],
+        basis: list[int],
+        tol = DEFAULT_TOLERANCES,
+        steps: int = REFINEMENT_STEPS,
+) -> bool:
+    """
+    Improves the free terms and the bottom row of the tableau in place with
+    iterative refinement until its residuals (see `get_residuals`) are within
+    the tolerance, and returns whether they are. The inverse of the basis is
+    read from the slack columns, so every step takes a single pass over the
+    tableau.
+    """
+
+    var_count = get_var_count(tableau)
+    row_count = len(basis)
+
+    for _ in range(steps):
+        if max(get_residuals(original, tableau, basis)) <= tol.residual:
+            return True
+
+        # Correct the vertex by the inverse of the basis applied to the
+        # residuals of the original constraints.
+        x = [0.0 for _ in range(len(tableau[-1]) - 2)]
+        for row_idx, col_idx in enumerate(basis):
+            x[col_idx] = tableau[row_idx][-1]
+        residuals = [
+            original[i][-1] - sum(a*b for a, b in zip(original[i], x))
+                for i in range(row_count)
+        ]
+        for row_idx in range(row_count):
+            row = tableau[row_idx]
+            row[-1] += sum(row[var_count + i]*residuals[i] for i in range(row_count))
+
+        # Correct the dual values so that the reduced costs of the basic
+        # columns are zero, and recompute the bottom row from them.
+        y = [tableau[-1][var_count + i] for i in range(row_count)]
+        reduced_costs = [
+            original[-1][col_idx] + sum(y[i]*original[i][col_idx] for i in range(row_count))
+                for col_idx in basis
+        ]
+        for i in range(row_count):
+            y[i] -= sum(
+                reduced_costs[r]*tableau[r][var_count + i] for r in range(row_count)
+            )
+        bottom_row = tableau[-1]
+        for col_idx in chain(range(len(x)), [-1]):
+            bottom_row[col_idx] = original[-1][col_idx] + sum(
+                y[i]*original[i][col_idx] for i in range(row_count)
+            )
+        for col_idx in basis:
+            bottom_row[col_idx] = 0.0
+
+    return max(get_residuals(original, tableau, basis)) <= tol.residual
+
+
+def get_crash_pivots(
+        tableau: list[list[float]],
+        crash = Crash.LTSF,
+        tol = DEFAULT_TOLERANCES,
+) -> list[tuple[int, int]]:
+    """
+    Returns the pivots bringing structural columns into the initial basis of
+    the given feasible tableau, at most one into every row which still has a
+    slack variable in the basis. The basis is chosen from the elements of the
+    tableau alone, before any of the pivots is made.
+
+    A column is only taken if it is zero in the pivot rows of the columns
+    taken before it, so the chosen columns form a triangular basis. Pivoting
+    on them in order then changes neither the later columns nor their bottom
+    row elements, so the basis is factored in a single pass of pivots, each
+    touching only the rows where its column is nonzero. As the bottom row
+    elements of the chosen columns are their reduced costs, only columns
+    which improve the goal function are taken, and their ratio test is made
+    on the running free terms, so the tableau stays feasible. A pivot element
+    smaller than `CRASH_PIVOT_RATIO` times the largest element of its column
+    is rejected.
+
+    The columns are considered in the order of the number of their nonzero
+    elements (`Crash.LTSF`, which favours a sparse basis) or of their bottom
+    row elements scaled by their largest element (`Crash.BIXBY`).
+    """
+
+    if crash == Crash.NONE: return []
+
+    var_count = get_var_count(tableau)
+    rows = range(len(tableau) - 1)
+    nonzeros = {
+        c: [r for r in rows if abs(tableau[r][c]) > tol.pivot]
+            for c in range(var_count) if tableau[-1][c] < -tol.dual
+    }
+    columns = [c for c in nonzeros if len(nonzeros[c]) > 0]
+
+    def get_scale(col_idx):
+        return max(abs(tableau[r][col_idx]) for r in nonzeros[col_idx])
+
+    if crash == Crash.LTSF:
+        columns.sort(key=lambda c: (len(nonzeros[c]), tableau[-1][c]))
+    else:
+        columns.sort(key=lambda c: (tableau[-1][c] / get_scale(c), len(nonzeros[c])))
+
+    slack_rows = set(
+        r for r, c in enumerate(get_basis(tableau, tol))
+            if c != None and c >= var_count
+    )
+    free_terms = [max(tableau[r][-1], 0.0) for r in rows]
+    pivot_rows = set()
+    pivots = []
+    for col_idx in columns:
+        if len(slack_rows) == 0: break
+        col_rows = nonzeros[col_idx]
+        if any(r in pivot_rows for r in col_rows): continue
+
+        row_idx = None
+        for r in col_rows:
+            if tableau[r][col_idx] <= tol.pivot: continue
+            if row_idx == None or free_terms[r]*tableau[row_idx][col_idx] \
+                    < free_terms[row_idx]*tableau[r][col_idx]:
+                row_idx = r
+        if row_idx not in slack_rows: continue
+        pivot = tableau[row_idx][col_idx]
+        if pivot < CRASH_PIVOT_RATIO*get_scale(col_idx): continue
+
+        quotient = free_terms[row_idx] / pivot
+        for r in col_rows:
+            free_terms[r] = max(free_terms[r] - tableau[r][col_idx]*quotient, 0.0)
+        slack_rows.remove(row_idx)
+        pivot_rows.add(row_idx)
+        pivots.append((row_idx, col_idx))
+
+    return pivots
+
+
+def iterate_simplex(
+        tableau: list[list[float]],
+        tol = DEFAULT_TOLERANCES,
+        refactor_interval: int | None = REFACTOR_INTERVAL,
+        crash = Crash.NONE,
+        stats: SolveStats | None = None,
+        log: PivotLog | None = None,
+        pricing = Pricing.DANTZIG,
+        trace: bool = True,
+        basis: list[int | None] | None = None,
+        feasible: bool | None = None,
+) -> Generator[tuple[int, int], None, Status]:
+    """
+    Performs the simplex method on the tableau one pivot at a time. Yields the
+    position of every pivot element and returns the final status, i.e.
+    `Status.OPTIMAL`, `Status.UNBOUNDED` or `Status.INFEASIBLE`. The given
+    tableau is modified in place, so after every step it holds the current
+    vertex.
+
+    Every `refactor_interval` pivots the residuals of the tableau are checked
+    and, if they exceed the tolerance, the tableau is rebuilt from a copy of
+    the original one and the current basis (see `refactor`).
+
+    If a `crash` procedure is given, it chooses the initial basis first (see
+    `get_crash_pivots`). The counters of the solve are accumulated in `stats`
+    and the pivots are recorded in `log` if they are given. The entering
+    columns of the primal simplex method are chosen by the `pricing` rule.
+    The pivots are printed unless `trace` is False (see `pivot_at`).
+
+    The `basis` of the tableau and whether its vertex is `feasible` are read
+    from the tableau unless they are given, e.g. by a resumed solve.
+    """
+
+    basis = get_basis(tableau, tol) if basis == None else list(basis)
+    if feasible == None:
+        feasible = is_feasible(tableau, tol)
+    # The residual checks need a copy of the whole tableau in memory, which a
+    # memory-mapped tableau may not fit into. The copy of a Tableau is kept
+    # flat, so that it does not take several times the memory of the tableau.
+    original = None
+    if refactor_interval != None and None not in basis:
+        if not isinstance(tableau, Tableau):
+            original = [list(row) for row in tableau]
+        elif not tableau.mapped:
+            original = tableau.copy()
+    pivot_count = 0
+
+    def pivot(pos):
+        nonlocal pivot_count
+
+        if log != None: log.record(tableau, pos, basis[pos[0]])
+        pivot_at(tableau, pos, trace)
+        basis[pos[0]] = pos[1]
+        pivot_count += 1
+        if stats != None: stats.pivots += 1
+
+        if original is None or pivot_count % refactor_interval != 0: return
+        if max(get_residuals(original, tableau, basis)) <= tol.residual: return
+        try:
+            rows = refactor(original, basis, tol)
+        except ValueError:
+            return
+        for row_idx, row in enumerate(rows):
+            tableau[row_idx] = row
+        if stats != None: stats.refactorizations += 1
+        # Replaying the pivots would not reproduce the refactorization.
+        if log != None: log.snapshot(tableau)
+
+    if feasible:
+        for pos in get_crash_pivots(tableau, crash, tol):
+            pivot(pos)
+            if stats != None: stats.crash_pivots += 1
+            yield pos
+
+    # Restore feasibility of the current vertex (e.g. of a problem with `>=`
+    # constraints) with the dual simplex method. If the bottom row is already
+    # optimal, its pivot rule keeps it so. Otherwise, the goal function is
+    # ignored until the vertex is feasible.
+    dual_feasible = not can_be_improved(tableau, tol)
+    while not feasible:
+        if dual_feasible:
+            pos = get_dual_pivot_pos(tableau, tol)
+        else:
+            pos = get_feasibility_pivot_pos(tableau, basis, tol)
+        if pos == None: return Status.INFEASIBLE
+        pivot(pos)
+        feasible = is_feasible(tableau, tol)
+        yield pos
+
+    while can_be_improved(tableau, tol):
+        pos = get_pivot_pos(tableau, tol, pricing, basis)
+        if pos == None: return Status.UNBOUNDED
+        pivot(pos)
+        yield pos
+
+    return Status.OPTIMAL
+
+
+def run_simplex(
+        tableau: list[list[float]],
+        deadline: float | None = None,
+        cancel = None,
+        tol = DEFAULT_TOLERANCES,
+        crash = Crash.NONE,
+        stats: SolveStats | None = None,
+        log: PivotLog | None = None,
+        iteration_limit: int | None = None,
+        pricing = Pricing.DANTZIG,
+        trace: bool = True,
+        refactor_interval: int | None = REFACTOR_INTERVAL,
+) -> Status:
+    """
+    Performs the simplex method on the tableau in place and returns the final
+    status. The solve is interrupted between pivots with `Status.TIME_LIMIT`
+    once `time.monotonic()` reaches the `deadline`, with
+    `Status.ITERATION_LIMIT` after `iteration_limit` pivots, or with
+    `Status.CANCELLED` once the `cancel` event (e.g. a `threading.Event`) is
+    set. The tableau then holds the last vertex visited. See `iterate_simplex`
+    for the `crash`, `stats`, `log`, `pricing`, `trace` and
+    `refactor_interval` arguments.
+    """
+
+    steps = iterate_simplex(
+        tableau, tol, refactor_interval, crash=crash, stats=stats, log=log,
+        pricing=pricing, trace=trace,
+    )
+    pivot_count = 0
+    while True:
+        if iteration_limit is not None and pivot_count >= iteration_limit:
+            steps.close()
+            return Status.ITERATION_LIMIT
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+        pivot_count += 1
+
+        if cancel is not None and cancel.is_set():
+            return Status.CANCELLED
+        if deadline is not None and time.monotonic() >= deadline:
+            return Status.TIME_LIMIT
+
+
+def run_mixed_precision(
+        tableau: list[list[float]],
+        tol = DEFAULT_TOLERANCES,
+        working_tol = SINGLE_PRECISION_TOLERANCES,
+        trace: bool = True,
+) -> Status:
+    """
+    Performs the simplex method on the tableau in place like `run_simplex`,
+    but pivots a single precision copy of it (see `Tableau`) with the looser
+    `working_tol` first. The given tableau is then pivoted in place onto the
+    final basis of the copy in double precision and refined (see `refine`)
+    against a compact copy of its original data, which recovers the full
+    precision of the vertex and of the dual values. At no point is more than
+    one extra copy of the tableau kept, and both of them are unboxed.
+
+    If the basis is singular or cannot be refined, the given tableau is
+    solved in double precision from scratch. Otherwise, the double precision
+    solve continues from the refined basis, which takes no pivots if it is
+    optimal. The single precision pivots are never traced, the double
+    precision ones unless `trace` is False.
+    """
+
+    working = Tableau.from_rows(tableau, typecode='f')
+    # The residual checks would need a double precision copy of the tableau.
+    for _ in iterate_simplex(working, working_tol, refactor_interval=None, trace=False):
+        pass
+    basis = get_basis(working, working_tol)
+    # Free the single precision copy before the double precision one is made.
+    working.close()
+    del working
+
+    if None in basis:
+        return run_simplex(tableau, tol=tol, trace=trace)
+
+    source = Tableau.from_rows(tableau)
+
+    # Pivot on the basic columns in turn, each in the remaining row with the
+    # largest element (like `refactor`, but without swapping the rows). The
+    # columns which are already basic, e.g. the slack columns, are taken as
+    # they are, as no pivot in another row changes them.
+    refined_basis = [None for _ in basis]
+    pending = []
+    for col_idx in basis:
+        column = [row[col_idx] for row in tableau]
+        row_idx = max(range(len(column)), key=lambda r: column[r])
+        if is_basic(column, tol) and row_idx < len(basis) \
+                and refined_basis[row_idx] == None:
+            refined_basis[row_idx] = col_idx
+        else:
+            pending.append(col_idx)
+    for col_idx in pending:
+        row_idx = max(
+            (r for r in range(len(basis)) if refined_basis[r] == None),
+            key=lambda r: abs(tableau[r][col_idx]),
+        )
+        if abs(tableau[row_idx][col_idx]) <= tol.pivot: break
+        pivot_at(tableau, (row_idx, col_idx), trace=False)
+        refined_basis[row_idx] = col_idx
+
+    refined = None not in refined_basis and refine(source, tableau, refined_basis, tol)
+    if not refined:
+        for row_idx, row in enumerate(source):
+            tableau[row_idx] = row.tolist()
+    source.close()
+    del source
+
+    # The refined tableau is accurate and takes few pivots, if any, so it is
+    # not worth another copy for the residual checks.
+    return run_simplex(
+        tableau, tol=tol, trace=trace,
+        refactor_interval=None if refined else REFACTOR_INTERVAL,
+    )
+
+
+def unbounded_solution(tableau: list[list[float]]) -> tuple[list[float], float]:
+    return (
+        [float('inf') for _ in range(get_var_count(tableau))],
+        float('inf'),
+    )
 
 
 def perform_simplex(
         tableau: list[list[float]],
         mode = Mode.MAXIMIZATION,
+        tol = DEFAULT_TOLERANCES,
+        log: PivotLog | None = None,
+        mixed_precision: bool = False,
+        refactor_interval: int | None = REFACTOR_INTERVAL,
 ) -> tuple[list[float], float]:
     """
-    Returns the solution for the given tableau.
+    Returns the solution for the given tableau. If a `log` is given, the
+    pivots of the solve are recorded in it. The residuals are checked every
+    `refactor_interval` pivots, or never if it is None (see
+    `iterate_simplex`). If `mixed_precision` is set, the tableau is solved
+    with `run_mixed_precision` instead, whose single precision pivots are not
+    logged and which chooses its own refactorizations.
     """
 
-    while can_be_improved(tableau):
-        if not perform_pivoting(tableau):
-            return (
-                [float('inf') for _ in range(len(tableau[:-1]))],
-                float('inf'),
-            )
+    if mixed_precision:
+        status = run_mixed_precision(tableau, tol)
+    else:
+        status = run_simplex(
+            tableau, tol=tol, log=log, refactor_interval=refactor_interval,
+        )
+    if status in (Status.UNBOUNDED, Status.INFEASIBLE):
+        return unbounded_solution(tableau)
+
+    return get_solution(tableau, mode, tol)
+
+
+def get_dual_bound(
+        original: list[list[float]],
+        tableau: list[list[float]],
+        tol = DEFAULT_TOLERANCES,
+) -> float:
+    """
+    Returns an upper bound on the value of the bottom row of the tableau,
+    which was obtained by pivoting on the `original` one, i.e. on the value
+    of the (maximized) goal function at any feasible point.
+
+    The bottom row holds the dual values of the constraints under the slack
+    columns. Negative ones are replaced by zero, and the columns which are
+    then still not dual feasible are covered by the upper bounds of their
+    variables implied by the constraints with non-negative coefficients. The
+    bound is infinite if some of these variables are not bounded this way.
+    """
 
-    return get_solution(tableau, mode)
+    var_count = get_var_count(tableau)
+    row_count = len(tableau) - 1
+    duals = [max(tableau[-1][var_count + i], 0.0) for i in range(row_count)]
+
+    bound = sum(duals[i]*original[i][-1] for i in range(row_count))
+    for col_idx in range(var_count):
+        reduced_cost = original[-1][col_idx] + sum(
+            duals[i]*original[i][col_idx] for i in range(row_count) if duals[i] != 0
+        )
+        if reduced_cost >= -tol.dual: continue
+
+        upper_bound = float('inf')
+        for row in original[:-1]:
+            if row[col_idx] <= tol.pivot: continue
+            if any(x < 0 for x in row[:var_count]): continue
+            upper_bound = min(upper_bound, max(row[-1], 0.0) / row[col_idx])
+        bound -= reduced_cost*upper_bound
+
+    return bound
+
+
+def solve_with_budget(
+        tableau: list[list[float]],
+        mode = Mode.MAXIMIZATION,
+        time_limit: float | None = None,
+        iteration_limit: int | None = None,
+        tol = DEFAULT_TOLERANCES,
+) -> SolveResult:
+    """
+    Performs the simplex method on the tableau in place for at most
+    `time_limit` seconds and `iteration_limit` pivots and returns a
+    `SolveResult`. If the budget runs out, the result holds the current
+    vertex if it is feasible, together with the bound on the objective value
+    of `get_dual_bound`, so that the caller may settle for it. The pivots are
+    not traced, since printing the tableau would eat up the budget.
+    """
+
+    original = [list(row) for row in tableau]
+    deadline = None if time_limit is None else time.monotonic() + time_limit
+    status = run_simplex(
+        tableau, deadline, tol=tol, iteration_limit=iteration_limit, trace=False,
+    )
+
+    if status == Status.INFEASIBLE:
+        return SolveResult(status, None, mode, tol)
+    if status in (Status.OPTIMAL, Status.UNBOUNDED):
+        return SolveResult(status, tableau, mode, tol)
+
+    # Minimization is performed as maximization of the negated goal function.
+    bound = get_dual_bound(original, tableau, tol)
+    if mode == Mode.MINIMIZATION: bound = -bound
+
+    if not is_feasible(tableau, tol):
+        return SolveResult(status, None, mode, tol, bound)
+
+    result = SolveResult(status, tableau, mode, tol, bound)
+    result.gap = abs(bound - result.objective) / max(abs(result.objective), 1.0)
+    return result
+
+
+def apply_inequalities(
+        constraints: list[list[float]],
+        inequalities: list[str],
+) -> list[list[float]]:
+    """
+    Returns a copy of the given constraints converted to the `<=` form
+    expected by `to_tableau`. `inequalities` holds either "<=" or ">=" for
+    every constraint, e.g. the constraint [2, 1, 12] with the ">=" inequality
+    is returned as [-2, -1, -12].
+    """
+
+    return [
+        [-x for x in constraint] if inequality == ">=" else list(constraint)
+            for constraint, inequality in zip(constraints, inequalities)
+    ]
 
 
 def to_tableau(
@@ -160,68 +1564,44 @@ def to_tableau(
     """
 
     result = []
-    if mode == Mode.MINIMIZATION:
-        for i in range(len(constraints)):
-            # `<=` -> `>=`
-            constraints[i] = [-x for x in constraints[i]]
-        matrix = to_basic_matrix(goal_function, constraints)
-        print(tableau_to_str(matrix))
-        matrix = transpose_basic_matrix(matrix)
-        print(tableau_to_str(matrix))
-        result = basic_matrix_to_tableau(matrix)
-    else:
-        for i, constraint in enumerate(constraints):
-            new_row = constraint[:-1]
+    for i, constraint in enumerate(constraints):
+        new_row = constraint[:-1]
 
-            # Add slack variables
-            new_row += [1 if j == i else 0 for j in range(len(constraints) + 1)]
+        # Add slack variables
+        new_row += [1 if j == i else 0 for j in range(len(constraints) + 1)]
 
-            new_row.append(constraint[-1])
-            result.append(new_row)
+        new_row.append(constraint[-1])
+        result.append(new_row)
 
-        bottom_row =  [-x for x in goal_function]
-        bottom_row += [0 for _ in range(len(constraints))]
-        bottom_row += [1, 0]
-        result.append(bottom_row)
+    # Minimization is performed as maximization of the negated goal function.
+    if mode == Mode.MINIMIZATION:
+        bottom_row = list(goal_function)
+    else:
+        bottom_row = [-x for x in goal_function]
+    bottom_row += [0 for _ in range(len(constraints))]
+    bottom_row += [1, 0]
+    result.append(bottom_row)
 
     return result
 
 
-def to_basic_matrix(
+def solve_problem(
         goal_function: list[float],
         constraints: list[list[float]],
-) -> list[list[float]]:
-    result = []
-
-    for constraint in constraints:
-        result.append(constraint)
-    result.append(goal_function + [0])
-
-    return result
-
-
-def transpose_basic_matrix(matrix: list[list[float]]) -> list[list[float]]:
-    result = [[] for _ in range(len(matrix[0]))]
-
-    for row in matrix:
-        for i, val in enumerate(row):
-            result[i].append(val)
-
-    return result
-
-
-def basic_matrix_to_tableau(
-        matrix: list[list[float]],
-) -> list[list[float]]:
-    result = []
-    height = len(matrix)
+        inequalities: list[str] | None = None,
+        mode = Mode.MAXIMIZATION,
+) -> tuple[list[float], float]:
+    """
+    Returns the solution of the given problem in the same form as
+    `perform_simplex`. The `inequalities` list holds either "<=" or ">=" for
+    every constraint; all constraints are assumed to be `<=` if it is omitted.
+    """
 
-    for i, row in enumerate(matrix):
-        result.append(row[:-1] if i < len(matrix) - 1 else [-x for x in row[:-1]])
-        result[-1] += [1 if j == i else 0 for j in range(height)]
-        result[-1].append(row[-1])
+    if inequalities is None:
+        inequalities = ["<="] * len(constraints)
+    constraints = apply_inequalities(constraints, inequalities)
 
-    return result
+    return perform_simplex(to_tableau(goal_function, constraints, mode), mode)
 
 
 def calc_num_widths(num: float) -> tuple[int, int]:
@@ -252,6 +1632,12 @@ def calc_col_widths(tableau: list[list[float]]) -> list[int]:
 
 
 def tableau_to_str(tableau: list[list[float]], **kwargs):
+    # termcolor is imported only here, so that solving does not depend on it.
+    try:
+        from termcolor import colored
+    except ImportError:
+        colored = lambda text, *args: text
+
     widths = calc_col_widths(tableau)
     total_width = 0
     for w in widths:
@@ -0,0 +1,92 @@
+from async_simplex import *
+from simplex import to_tableau
+
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import pytest
+
+
+def make_tableau():
+    return [
+        [1, 1, 1, 0, 0, 12],
+        [2, 1, 0, 1, 0, 16],
+        [-40, -30, 0, 0, 1, 0],
+    ]
+
+
+def make_large_tableau(size):
+    # max sum(x) s.t. x_i + x_j <= 1 + i + j for every pair of variables.
+    constraints = [
+        [1 if k in (i, j) else 0 for k in range(size)] + [1 + i + j]
+            for i in range(size) for j in range(i + 1, size)
+    ]
+    return to_tableau([1.0] * size, constraints)
+
+
+class TestAsyncSimplex:
+
+    def test_solve_when_feasible_and_bounded(self):
+        assert asyncio.run(solve(make_tableau())) == (Status.OPTIMAL, [4, 8], 400)
+
+
+    def test_solve_when_unbounded(self):
+        tableau = [
+            [ 1,   0, 1, 0, 0, 7],
+            [ 1,  -1, 0, 1, 0, 8],
+            [-5,  -4, 0, 0, 1, 0],
+        ]
+
+        assert asyncio.run(solve(tableau)) \
+                == (Status.UNBOUNDED, [float('inf')] * 2, float('inf'))
+
+
+    def test_solve_when_executor(self):
+        with ThreadPoolExecutor() as executor:
+            result = asyncio.run(solve(make_tableau(), executor=executor))
+
+        assert result == (Status.OPTIMAL, [4, 8], 400)
+
+
+    def test_solve_does_not_trace(self, capsys):
+        asyncio.run(solve(make_tableau()))
+        with ThreadPoolExecutor() as executor:
+            asyncio.run(solve(make_tableau(), executor=executor))
+
+        assert capsys.readouterr().out == ""
+
+
+    def test_solve_if_process_pool_executor_then_raises(self):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            with pytest.raises(ValueError):
+                asyncio.run(solve(make_tableau(), executor=executor))
+
+
+    def test_solve_when_deadline_passed_then_returns_current_vertex(self):
+        status, solution, value = asyncio.run(
+            solve(make_tableau(), deadline=time.monotonic())
+        )
+
+        assert status == Status.TIME_LIMIT
+        assert value == 320
+
+
+    def test_solve_when_deadline_passed_before_feasible_then_returns_none(self):
+        tableau = to_tableau([1, 1], [[-1, 0, -2], [0, -1, -3]], Mode.MINIMIZATION)
+
+        assert asyncio.run(solve(tableau, Mode.MINIMIZATION, deadline=time.monotonic())) \
+                == (Status.TIME_LIMIT, None, None)
+
+
+    def test_solve_when_cancelled_then_raises(self):
+        async def cancel_solve():
+            task = asyncio.create_task(
+                solve(make_large_tableau(12), pivots_per_yield=1)
+            )
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            task.cancel()
+            await task
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(cancel_solve())
@@ -0,0 +1,72 @@
+from cache import *
+
+import pytest
+
+
+GOAL_FUNCTION = [40.0, 30.0]
+CONSTRAINTS = [
+    [1, 1, 12],
+    [2, 1, 16],
+]
+
+
+class TestCache:
+
+    def test_canonical_key_ignores_constraint_order(self):
+        assert canonical_key(GOAL_FUNCTION, CONSTRAINTS) \
+                == canonical_key(GOAL_FUNCTION, CONSTRAINTS[::-1])
+
+
+    def test_canonical_key_ignores_float_noise(self):
+        constraints = [[1, 1, 12.000000000000002], [2.0, 1, 16]]
+
+        assert canonical_key(GOAL_FUNCTION, CONSTRAINTS) \
+                == canonical_key([40, 30.0], constraints)
+
+
+    def test_canonical_key_when_inequalities_then_compares_le_form(self):
+        assert canonical_key([1, 1], [[1, 0, 2]], [">="]) \
+                == canonical_key([1, 1], [[-1, 0, -2]])
+
+
+    def test_canonical_key_depends_on_mode_and_coefficients(self):
+        key = canonical_key(GOAL_FUNCTION, CONSTRAINTS)
+
+        assert key != canonical_key(GOAL_FUNCTION, CONSTRAINTS, mode=Mode.MINIMIZATION)
+        assert key != canonical_key([40.0, 31.0], CONSTRAINTS)
+
+
+    def test_solve_when_repeated_then_hits_cache(self):
+        cache = SolveCache()
+
+        assert cache.solve(GOAL_FUNCTION, CONSTRAINTS) == ([4, 8], 400)
+        assert cache.solve(GOAL_FUNCTION, CONSTRAINTS[::-1]) == ([4, 8], 400)
+        assert cache.cache_info() == CacheInfo(1, 1, 0, 0, 128, 1)
+
+
+    def test_solve_when_result_mutated_then_cache_intact(self):
+        cache = SolveCache()
+
+        solution, _ = cache.solve(GOAL_FUNCTION, CONSTRAINTS)
+        solution[0] = -1
+        assert cache.solve(GOAL_FUNCTION, CONSTRAINTS) == ([4, 8], 400)
+
+
+    def test_put_when_full_then_evicts_least_recently_used(self):
+        cache = SolveCache(maxsize=2)
+        cache.put("a", ([1], 1))
+        cache.put("b", ([2], 2))
+        cache.get("a")
+        cache.put("c", ([3], 3))
+
+        assert cache.get("b") == None
+        assert cache.get("a") == ([1], 1)
+        assert cache.cache_info().evictions == 1
+
+
+    def test_get_when_disk_tier_then_survives_new_cache(self, tmp_path):
+        SolveCache(path=str(tmp_path)).solve(GOAL_FUNCTION, CONSTRAINTS)
+
+        cache = SolveCache(path=str(tmp_path))
+        assert cache.solve(GOAL_FUNCTION, CONSTRAINTS) == ([4, 8], 400)
+        assert cache.cache_info().disk_hits == 1
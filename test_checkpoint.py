@@ -0,0 +1,96 @@
+from checkpoint import *
+from simplex import Mode, Tableau, get_solution, iterate_simplex, to_tableau
+
+import threading
+import pytest
+
+
+GOAL_FUNCTION = [40.0, 30.0]
+CONSTRAINTS = [
+    [1, 1, 12],
+    [2, 1, 16],
+]
+
+
+class TestCheckpoint:
+
+    def test_load_checkpoint_returns_saved_state(self, tmp_path):
+        path = str(tmp_path / "solve.ckpt")
+        tableau = [
+            [0, 0.5, 1, -0.5, 0, 4],
+            [1, 0.5, 0, 0.5, 0, 8],
+            [0, -10, 0, 20, 1, 320],
+        ]
+
+        save_checkpoint(path, tableau, pivots=1)
+        checkpoint = load_checkpoint(path)
+
+        assert checkpoint.tableau == tableau
+        assert checkpoint.basis == [2, 0]
+        assert checkpoint.pivots == 1
+        assert checkpoint.phase == PHASE_PRIMAL
+
+
+    def test_load_checkpoint_when_single_precision(self, tmp_path):
+        path = str(tmp_path / "solve.ckpt")
+        tableau = Tableau.from_rows(to_tableau(GOAL_FUNCTION, CONSTRAINTS), 'f')
+
+        save_checkpoint(path, tableau)
+        checkpoint = load_checkpoint(path)
+
+        assert checkpoint.tableau.typecode == 'f'
+        assert checkpoint.tableau == tableau
+
+        status, tableau = resume(path)
+        assert status == Status.OPTIMAL
+        assert get_solution(tableau) == ([4, 8], 400)
+
+
+    def test_load_checkpoint_if_not_checkpoint_then_raises(self, tmp_path):
+        path = tmp_path / "solve.ckpt"
+        path.write_bytes(b"not a checkpoint at all")
+
+        with pytest.raises(ValueError):
+            load_checkpoint(str(path))
+
+
+    def test_resume_continues_interrupted_solve(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "solve.ckpt")
+        tableau = to_tableau(GOAL_FUNCTION, CONSTRAINTS)
+
+        # Simulate a solve killed after its first pivot.
+        next(iterate_simplex(tableau))
+        save_checkpoint(path, tableau, pivots=1)
+
+        # The stored basis is used and tracked instead of searching the
+        # tableau, also for the checkpoints written by the resumed solve.
+        with monkeypatch.context() as m:
+            m.setattr("simplex.get_basis", lambda *args: pytest.fail("basis searched"))
+            m.setattr("checkpoint.get_basis", lambda *args: pytest.fail("basis searched"))
+            status, tableau = resume(path)
+        assert status == Status.OPTIMAL
+        assert get_solution(tableau) == ([4, 8], 400)
+        assert load_checkpoint(path).pivots == 2
+        assert load_checkpoint(path).basis == [1, 0]
+
+
+    def test_save_checkpoint_when_basis_given_then_stores_it(self, tmp_path):
+        path = str(tmp_path / "solve.ckpt")
+        tableau = to_tableau(GOAL_FUNCTION, CONSTRAINTS)
+
+        save_checkpoint(path, tableau, basis=[None, 3])
+        assert load_checkpoint(path).basis == [None, 3]
+
+
+    def test_solve_with_checkpoints_when_cancelled_then_resumes(self, tmp_path):
+        path = str(tmp_path / "solve.ckpt")
+        tableau = to_tableau([12, 16], [[-1, -2, -40], [-1, -1, -30]], Mode.MINIMIZATION)
+        cancel = threading.Event()
+        cancel.set()
+
+        assert solve_with_checkpoints(tableau, path, cancel=cancel) == Status.CANCELLED
+        assert load_checkpoint(path).phase == PHASE_DUAL
+
+        status, tableau = resume(path, interval=0)
+        assert status == Status.OPTIMAL
+        assert get_solution(tableau, Mode.MINIMIZATION) == ([20, 10], 400)
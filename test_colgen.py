@@ -0,0 +1,72 @@
+from colgen import *
+from simplex import run_simplex, to_tableau
+
+import itertools
+import pytest
+
+
+# Cutting stock: rolls of width 10 are cut into pieces of widths 3, 4 and 5
+# with demands 9, 6 and 4.
+WIDTHS = [3, 4, 5]
+DEMANDS = [9, 6, 4]
+
+
+def price_patterns(duals):
+    patterns = [
+        list(pattern) for pattern in itertools.product(range(4), repeat=3)
+            if sum(a*w for a, w in zip(pattern, WIDTHS)) <= 10
+    ]
+    best = max(patterns, key=lambda p: sum(a*y for a, y in zip(p, duals)))
+    return [Column(1, best)]
+
+
+def solve_cutting_stock(**kwargs):
+    # Start with the patterns cutting a single width.
+    constraints = [
+        [3, 0, 0, 9],
+        [0, 2, 0, 6],
+        [0, 0, 2, 4],
+    ]
+    return solve_column_generation(
+        [1, 1, 1], constraints, price_patterns, [">="]*3, Mode.MINIMIZATION, **kwargs,
+    )
+
+
+class TestColumnGeneration:
+
+    def test_add_column_keeps_vertex(self):
+        tableau = to_tableau([40, 30], [[1, 1, 12], [2, 1, 16]])
+        run_simplex(tableau)
+
+        add_column(tableau, [1, 2], 50)
+        assert [row[2] for row in tableau] == [0, 1, -10]
+        assert [row[-1] for row in tableau] == [8, 4, 400]
+
+
+    def test_solve_column_generation(self):
+        result, columns = solve_cutting_stock()
+
+        assert result.status == Status.OPTIMAL
+        assert result.objective == pytest.approx(7.25)
+        for demand, coefficients in zip(DEMANDS, zip(*(c.coefficients for c in columns))):
+            assert sum(a*x for a, x in zip(coefficients, result.solution)) \
+                == pytest.approx(demand)
+
+
+    def test_solve_column_generation_when_smoothing(self):
+        result, _ = solve_cutting_stock(smoothing=0.5)
+
+        assert result.status == Status.OPTIMAL
+        assert result.objective == pytest.approx(7.25)
+
+
+    def test_solve_column_generation_when_round_limit(self):
+        result, columns = solve_cutting_stock(round_limit=0)
+
+        assert result.status == Status.ITERATION_LIMIT
+        assert (result.objective, len(columns)) == (8, 3)
+
+
+    def test_solve_column_generation_if_invalid_smoothing_then_raises(self):
+        with pytest.raises(ValueError):
+            solve_column_generation([1], [[1, 1]], lambda duals: [], smoothing=1)
@@ -0,0 +1,72 @@
+from gui import *
+
+import pytest
+
+
+@pytest.fixture
+def controls(monkeypatch):
+    # The problem editing of the controls is tested without a display.
+    monkeypatch.setattr(Controls, "refresh", lambda self: None)
+    monkeypatch.setattr(Controls, "schedule_solve", lambda self, *_: None)
+    controls = Controls.__new__(Controls)
+    controls.first_var = 0
+    controls.first_constraint = 0
+    controls.set_problem(
+        [7.0, 7.0, 7.0],
+        [[3.0, 3.0, 3.0, 3.0], [5.0, 5.0, 5.0, 5.0], [6.0, 6.0, 6.0, 6.0]],
+        ["<=", "<=", ">="],
+    )
+    return controls
+
+
+class TestGui:
+
+    def test_parse_table_when_tabs(self):
+        assert parse_table("1\t2\n\n3\t 4 \n") == [["1", "2"], ["3", "4"]]
+
+
+    def test_parse_table_when_commas(self):
+        assert parse_table("1,2,<=,3\n4,5,6") == [["1", "2", "<=", "3"], ["4", "5", "6"]]
+
+
+    def test_parse_constraints_reads_inequalities(self):
+        table = [["2", "1", ">=", "12"], ["1", "3", "8"]]
+
+        assert parse_constraints(table) == ([[2, 1, 12], [1, 3, 8]], [">=", "<="])
+
+
+    def test_parse_constraints_if_no_coefficients_then_raises(self):
+        with pytest.raises(ValueError):
+            parse_constraints([["<=", "4"]])
+
+
+    def test_parse_constraints_if_not_number_then_raises(self):
+        with pytest.raises(ValueError):
+            parse_constraints([["1", "x", "4"]])
+
+
+    def test_parse_problem(self):
+        table = parse_table("40,30\n1,1,12\n2,1,>=,16\n")
+
+        assert parse_problem(table) == ([40, 30], [[1, 1, 12], [2, 1, 16]], ["<=", ">="])
+
+
+    def test_parse_problem_if_empty_then_raises(self):
+        with pytest.raises(ValueError):
+            parse_problem([])
+
+
+    def test_paste_rows_when_goal_function_then_replaces_problem(self, controls):
+        controls._paste_rows(None, parse_table("1,1\n1,2,4"))
+
+        assert controls.goal_function == [1, 1]
+        assert controls.constraints == [[1, 2, 4], [0, 0, 0]]
+        assert controls.inequalities == ["<=", "<="]
+
+
+    def test_paste_rows_when_constraint_then_replaces_whole_rows(self, controls):
+        controls._paste_rows(1, parse_table("1,>=,2"))
+
+        assert controls.goal_function == [7, 7, 7]
+        assert controls.constraints == [[3, 3, 3, 3], [1, 0, 0, 2], [6, 6, 6, 6]]
+        assert controls.inequalities == ["<=", ">=", ">="]
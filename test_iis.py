@@ -0,0 +1,40 @@
+from iis import *
+from simplex import to_tableau
+
+
+class TestIis:
+
+    def test_find_iis_returns_conflicting_constraints(self):
+        tableau = to_tableau([1, 1], [
+            [ 1,  1,  4], # x1 + x2 <= 4
+            [ 1,  0, 10], # x1 <= 10
+            [-1, -1, -6], # x1 + x2 >= 6
+            [ 0,  1,  3], # x2 <= 3
+        ])
+
+        assert find_iis(tableau) == [0, 2]
+
+
+    def test_find_iis_when_feasible_then_returns_none(self):
+        tableau = to_tableau([1, 1], [[1, 1, 4], [-1, 0, -1]])
+
+        assert find_iis(tableau) == None
+
+
+    def test_find_iis_when_several_subsystems_then_returns_one_of_them(self):
+        tableau = to_tableau([1, 1], [
+            [ 1,  0,  2], # x1 <= 2
+            [-1,  1,  0], # x2 <= x1
+            [ 0,  1,  3], # x2 <= 3
+            [-1, -1, -6], # x1 + x2 >= 6
+        ])
+
+        assert find_iis(tableau) in ([0, 1, 3], [0, 2, 3])
+
+
+    def test_find_iis_does_not_modify_tableau(self):
+        tableau = to_tableau([1, 1], [[1, 1, 4], [-1, -1, -6]])
+        rows = [list(row) for row in tableau]
+
+        find_iis(tableau)
+        assert tableau == rows
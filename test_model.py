@@ -0,0 +1,97 @@
+from model import *
+from simplex import to_tableau
+
+import pytest
+
+
+class TestModel:
+
+    def test_lin_expr_accumulates_coefficients(self):
+        model = Model()
+        x, y = model.add_var("x"), model.add_var("y")
+
+        expr = 2*x + y - x + 3 - (y - 1)/2
+        assert expr.coeffs == {0: 1.0, 1: 0.5}
+        assert expr.constant == 3.5
+
+
+    def test_lin_sum_when_many_terms(self):
+        model = Model()
+        xs = [model.add_var() for _ in range(100)]
+
+        expr = lin_sum(i*x for i, x in enumerate(xs))
+        assert len(expr.coeffs) == 100
+        assert expr.coeffs[99] == 99
+
+
+    def test_comparisons_build_constraints(self):
+        model = Model()
+        x = model.add_var("x")
+
+        constraint = 3 <= x
+        assert constraint.sense == ">="
+        assert constraint.expr.coeffs == {0: 1.0}
+        assert constraint.expr.constant == -3
+
+
+    def test_add_constraint_if_not_constraint_then_raises(self):
+        model = Model()
+        x = model.add_var("x")
+
+        with pytest.raises(TypeError):
+            model.add_constraint(x + 1)
+
+
+    def test_to_tableau_equals_to_tableau_of_lists(self):
+        model = Model()
+        x, y = model.add_var("x"), model.add_var("y")
+        model.add_constraint(x + y <= 12)
+        model.add_constraint(2*x + y <= 16)
+        model.maximize(40*x + 30*y)
+
+        assert model.to_tableau() == to_tableau([40, 30], [[1, 1, 12], [2, 1, 16]])
+
+
+    def test_to_csr(self):
+        model = Model()
+        x, y = model.add_var("x"), model.add_var("y")
+        model.add_constraint(x + 2*y >= 40)
+        model.add_constraint(y <= 5)
+
+        indptr, indices, data, rhs = model.to_csr()
+        assert list(indptr) == [0, 2, 3]
+        assert list(indices) == [0, 1, 1]
+        assert list(data) == [-1, -2, 1]
+        assert list(rhs) == [-40, 5]
+
+
+    def test_solve_maps_solution_to_names(self):
+        model = Model()
+        x, y = model.add_var("x"), model.add_var("y")
+        model.add_constraint(x + 2*y >= 40)
+        model.add_constraint(x + y >= 30)
+        model.minimize(12*x + 16*y + 1)
+
+        assert model.solve() == (Status.OPTIMAL, {"x": 20, "y": 10}, 401)
+
+
+    def test_solve_when_equality_constraint(self):
+        model = Model()
+        x, y = model.add_var("x"), model.add_var("y")
+        model.add_constraint(x + y == 10)
+        model.add_constraint(x <= 4)
+        model.minimize(x + 3*y)
+
+        assert model.solve() == (Status.OPTIMAL, {"x": 4, "y": 6}, 22)
+
+
+    def test_find_iis_returns_conflicting_constraints(self):
+        model = Model()
+        x, y = model.add_var("x"), model.add_var("y")
+        budget = model.add_constraint(x + y <= 4)
+        model.add_constraint(y <= 3)
+        demand = model.add_constraint(x + y == 6)
+        model.maximize(x + y)
+
+        assert model.solve()[0] == Status.INFEASIBLE
+        assert model.find_iis() == [budget, demand]
@@ -0,0 +1,63 @@
+from network import *
+from simplex import Mode, perform_simplex, to_tableau
+
+import math
+
+
+class TestNetwork:
+
+    def test_solve_min_cost_flow_when_capacities(self):
+        arcs = [
+            Arc(0, 1, 3, 4),
+            Arc(0, 2, 6, 10),
+            Arc(1, 3, 1, 9),
+            Arc(2, 3, 2, 5),
+        ]
+
+        assert solve_min_cost_flow([5, 0, 0, -5], arcs) == (
+            Status.OPTIMAL, [4, 1, 4, 1], 24,
+        )
+
+
+    def test_perform_network_simplex_equals_perform_simplex(self):
+        # Two sources with supplies 20 and 30 and two sinks with demands 10
+        # and 40.
+        costs = [[12, 16], [15, 11]]
+        arcs = [Arc(i, 2 + j, costs[i][j]) for i in range(2) for j in range(2)]
+
+        tableau = to_tableau([12, 16, 15, 11], [
+            [ 1,  1,  0,  0,  20],
+            [ 0,  0,  1,  1,  30],
+            [-1,  0, -1,  0, -10],
+            [ 0, -1,  0, -1, -40],
+        ], Mode.MINIMIZATION)
+
+        assert perform_network_simplex([20, 30, -10, -40], arcs) \
+            == perform_simplex(tableau, Mode.MINIMIZATION) \
+            == ([10, 10, 0, 30], 610)
+
+
+    def test_solve_min_cost_flow_when_supplies_cannot_be_routed(self):
+        arcs = [Arc(0, 1, 1, 2), Arc(1, 2, 1)]
+
+        assert solve_min_cost_flow([3, 0, -3], arcs)[0] == Status.INFEASIBLE
+        assert solve_min_cost_flow([3, 0, -2], arcs)[0] == Status.INFEASIBLE
+
+
+    def test_solve_min_cost_flow_when_negative_cycle(self):
+        arcs = [Arc(0, 1, 1), Arc(1, 2, -3, 4), Arc(2, 1, 1)]
+
+        assert solve_min_cost_flow([1, 0, -1], arcs) == (
+            Status.OPTIMAL, [1, 4, 3], -8,
+        )
+
+
+    def test_perform_network_simplex_when_unbounded(self):
+        arcs = [Arc(0, 1, 1), Arc(1, 2, -3), Arc(2, 1, 1)]
+
+        assert solve_min_cost_flow([1, 0, -1], arcs)[0] == Status.UNBOUNDED
+        assert perform_network_simplex([1, 0, -1], arcs) == ([math.inf]*3, math.inf)
+
+
+    def test_solve_min_cost_flow_when_no_arcs(self):
+        assert solve_min_cost_flow([0, 0], []) == (Status.OPTIMAL, [], 0)
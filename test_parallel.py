@@ -0,0 +1,63 @@
+from parallel import *
+from simplex import perform_simplex, pivot_at
+
+import pytest
+
+
+TABLEAU = [
+    [1, 1, 1, 0, 0, 0, 12],
+    [2, 1, 0, 1, 0, 0, 16],
+    [0, 2, 0, 0, 1, 0, 11],
+    [-40, -30, 0, 0, 0, 1, 0],
+]
+
+
+class TestParallel:
+
+    def test_pivot_when_multiple_workers_then_equals_pivot_at(self, monkeypatch):
+        monkeypatch.setattr("parallel.MIN_ROWS_PER_WORKER", 1)
+        rows = [list(row) for row in TABLEAU]
+
+        with SharedTableau.from_rows(TABLEAU, workers=3) as tableau:
+            assert tableau.workers == 3
+
+            tableau.pivot((1, 0))
+            pivot_at(rows, (1, 0))
+            assert tableau == rows
+
+
+    def test_perform_simplex_when_shared_tableau(self, monkeypatch, capsys):
+        monkeypatch.setattr("parallel.MIN_ROWS_PER_WORKER", 1)
+
+        with SharedTableau.from_rows(TABLEAU, workers=2) as tableau:
+            assert perform_simplex(tableau) == ([5.25, 5.5], 375)
+        # The pivots are not traced.
+        assert capsys.readouterr().out == ""
+
+
+    def test_shared_tableau_when_few_rows_then_uses_single_worker(self):
+        with SharedTableau.from_rows(TABLEAU, workers=8) as tableau:
+            assert tableau.workers == 1
+
+
+    def test_pivot_if_worker_died_then_raises(self, monkeypatch):
+        monkeypatch.setattr("parallel.MIN_ROWS_PER_WORKER", 1)
+        monkeypatch.setattr("parallel.BARRIER_TIMEOUT", 1.0)
+
+        with SharedTableau.from_rows(TABLEAU, workers=2) as tableau:
+            tableau._processes[0].kill()
+            tableau._processes[0].join()
+
+            with pytest.raises(RuntimeError):
+                tableau.pivot((1, 0))
+
+
+    def test_pivot_if_worker_failed_then_raises(self, monkeypatch):
+        monkeypatch.setattr("parallel.MIN_ROWS_PER_WORKER", 1)
+
+        with SharedTableau.from_rows(TABLEAU, workers=2) as tableau:
+            # A pivot column out of range fails in the workers only.
+            tableau._conns[0].send((1, len(TABLEAU[0])))
+
+            with pytest.raises(RuntimeError):
+                tableau.pivot((1, 0))
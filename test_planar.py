@@ -0,0 +1,72 @@
+from planar import *
+
+import pytest
+
+
+def approx_solution(solution, value):
+    return (pytest.approx(solution), pytest.approx(value))
+
+
+class TestPlanar:
+
+    def test_feasible_region_when_bounded(self):
+        region = feasible_region([[1, 0, 2], [0, 1, 3]])
+
+        assert sorted(region) == [
+            pytest.approx((0, 0)),
+            pytest.approx((0, 3)),
+            pytest.approx((2, 0)),
+            pytest.approx((2, 3)),
+        ]
+
+
+    def test_feasible_region_when_unbounded_then_clipped_to_box(self):
+        region = feasible_region([[1, -1, 1]], bound=100)
+
+        assert sorted(region) == [
+            pytest.approx((0, 0)),
+            pytest.approx((0, 100)),
+            pytest.approx((1, 0)),
+            pytest.approx((100, 99)),
+            pytest.approx((100, 100)),
+        ]
+
+
+    def test_feasible_region_when_infeasible_then_returns_empty_list(self):
+        assert feasible_region([[1, 1, -1]]) == []
+        assert feasible_region([[0, 0, -1]]) == []
+
+
+    def test_solve_2d_when_feasible_and_bounded(self):
+        solution, value, _ = solve_2d([40, 30], [[1, 1, 12], [2, 1, 16]])
+
+        assert (solution, value) == approx_solution([4, 8], 400)
+
+
+    def test_solve_2d_when_minimization(self):
+        solution, value, _ = solve_2d(
+            [12, 16],
+            [[-1, -2, -40], [-1, -1, -30]],
+            Mode.MINIMIZATION,
+        )
+
+        assert (solution, value) == approx_solution([20, 10], 400)
+
+
+    def test_solve_2d_when_unbounded(self):
+        solution, value, _ = solve_2d([5, 4], [[1, 0, 7], [1, -1, 8]])
+
+        assert (solution, value) == ([float('inf')] * 2, float('inf'))
+
+
+    def test_solve_2d_when_optimal_ray_then_returns_its_vertex(self):
+        solution, value, _ = solve_2d([0, 1], [[0, 1, 1]])
+
+        assert (solution, value) == ([0, 1], 1)
+
+
+    def test_solve_2d_when_region_is_single_point(self):
+        solution, value, region = solve_2d([1, 1], [[1, 1, 0]])
+
+        assert (solution, value) == ([0, 0], 0)
+        assert region == [pytest.approx((0, 0))]
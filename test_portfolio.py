@@ -0,0 +1,39 @@
+from portfolio import *
+from simplex import to_tableau
+
+import logging
+
+
+class TestPortfolio:
+
+    def test_solve_portfolio_returns_solution_of_winner(self, caplog):
+        tableau = to_tableau([40, 30], [[1, 1, 12], [2, 1, 16]])
+        configs = (Config(), Config(Pricing.BLAND))
+
+        with caplog.at_level(logging.INFO, logger="portfolio"):
+            status, solution, value, winner = solve_portfolio(tableau, configs=configs)
+
+        assert (status, solution, value) == (Status.OPTIMAL, [4, 8], 400)
+        assert winner in configs
+        assert tableau[-1][-1] == 400
+        assert str(winner) in caplog.text
+
+
+    def test_solve_portfolio_when_minimization(self):
+        tableau = to_tableau([12, 16], [[-1, -2, -40], [-1, -1, -30]], Mode.MINIMIZATION)
+
+        assert solve_portfolio(tableau, Mode.MINIMIZATION, configs=(Config(),)) \
+            == (Status.OPTIMAL, [20, 10], 400, Config())
+
+
+    def test_solve_portfolio_when_time_limit_exceeded(self):
+        tableau = to_tableau([40, 30], [[1, 1, 12], [2, 1, 16]])
+
+        assert solve_portfolio(tableau, time_limit=0) == (Status.TIME_LIMIT, None, None, None)
+
+
+    def test_solve_portfolio_does_not_trace(self, capfd):
+        tableau = to_tableau([40, 30], [[1, 1, 12], [2, 1, 16]])
+
+        solve_portfolio(tableau, configs=(Config(), Config(Pricing.BLAND)))
+        assert capfd.readouterr().out == ""
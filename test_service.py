@@ -0,0 +1,131 @@
+from service import *
+from service import _percentile
+from cache import SolveCache
+
+import json
+import threading
+import urllib.request
+import pytest
+
+
+GOAL_FUNCTION = [40.0, 30.0]
+CONSTRAINTS = [
+    [1, 1, 12],
+    [2, 1, 16],
+]
+
+
+class TestService:
+
+    def test_percentile_when_no_values(self):
+        assert _percentile([], 50) == None
+
+
+    def test_percentile_when_multiple_values(self):
+        values = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+
+        assert _percentile(values, 50) == 5
+        assert _percentile(values, 90) == 9
+        assert _percentile(values, 99) == 10
+
+
+    def test_submit_returns_solution(self):
+        with SolverService(workers=2) as service:
+            futures = [
+                service.submit(GOAL_FUNCTION, CONSTRAINTS) for _ in range(4)
+            ]
+
+            assert [f.result() for f in futures] == [(Status.OPTIMAL, [4, 8], 400)] * 4
+            assert service.stats()["completed"] == 4
+
+
+    def test_submit_when_time_limit_exceeded_then_raises_and_recovers(self):
+        with SolverService(workers=1) as service:
+            with pytest.raises(TimeoutError):
+                service.solve(GOAL_FUNCTION, CONSTRAINTS, time_limit=0)
+
+            assert service.solve(GOAL_FUNCTION, CONSTRAINTS) == (Status.OPTIMAL, [4, 8], 400)
+            assert service.stats()["timed_out"] == 1
+
+
+    def test_http_solve_and_stats(self):
+        with SolverService(workers=1) as service:
+            server = SolverServer(("127.0.0.1", 0), service)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            url = f"http://127.0.0.1:{server.server_address[1]}"
+
+            try:
+                request = urllib.request.Request(
+                    url + "/solve",
+                    data=json.dumps({
+                        "goal_function": [3, 2],
+                        "constraints": [[-2, 1, 2], [1, 2, 8]],
+                        "inequalities": ["<=", "<="],
+                    }).encode(),
+                    method="POST",
+                )
+                with urllib.request.urlopen(request) as response:
+                    assert json.load(response) == {
+                        "status": "optimal", "solution": [8, 0], "value": 24,
+                    }
+
+                request = urllib.request.Request(
+                    url + "/solve",
+                    data=json.dumps({
+                        "goal_function": [1, 1],
+                        "constraints": [[1, 1, 2], [1, 1, 3]],
+                        "inequalities": ["<=", ">="],
+                    }).encode(),
+                    method="POST",
+                )
+                with urllib.request.urlopen(request) as response:
+                    assert json.load(response) == {
+                        "status": "infeasible", "solution": None, "value": None,
+                    }
+
+                with urllib.request.urlopen(url + "/stats") as response:
+                    stats = json.load(response)
+                assert stats["completed"] == 2
+                assert stats["queue_depth"] == 0
+                assert stats["latency"]["p50"] > 0
+            finally:
+                server.shutdown()
+                server.server_close()
+
+
+    def test_submit_when_cached_then_skips_workers(self):
+        cache = SolveCache()
+        with SolverService(workers=1, cache=cache) as service:
+            service.solve(GOAL_FUNCTION, CONSTRAINTS)
+            assert service.solve(GOAL_FUNCTION, CONSTRAINTS) == (Status.OPTIMAL, [4, 8], 400)
+            assert service.stats()["completed"] == 1
+            assert cache.cache_info().hits == 1
+
+
+    def test_submit_when_fields_invalid_then_raises(self):
+        with SolverService(workers=1) as service:
+            with pytest.raises(ValueError):
+                service.submit(GOAL_FUNCTION, CONSTRAINTS, time_limit="soon")
+            with pytest.raises(ValueError):
+                service.submit(GOAL_FUNCTION, CONSTRAINTS, time_limit=-1)
+            with pytest.raises(ValueError):
+                service.submit(GOAL_FUNCTION, CONSTRAINTS, priority="high")
+            with pytest.raises(ValueError):
+                service.submit(GOAL_FUNCTION, CONSTRAINTS, priority=float('nan'))
+
+            # Numeric strings are coerced.
+            assert service.solve(GOAL_FUNCTION, CONSTRAINTS, priority="1", time_limit="5") \
+                == (Status.OPTIMAL, [4, 8], 400)
+
+
+    def test_dispatch_when_request_fails_then_keeps_serving(self):
+        with SolverService(workers=1) as service:
+            future = service.submit(GOAL_FUNCTION, CONSTRAINTS)
+            future.result()
+            # A request the worker cannot even be sent.
+            future = service.submit([threading.Lock()], CONSTRAINTS)
+
+            with pytest.raises(Exception):
+                future.result(timeout=10)
+            assert service.solve(GOAL_FUNCTION, CONSTRAINTS) == (Status.OPTIMAL, [4, 8], 400)
+            assert service.stats()["failed"] == 1
@@ -1,11 +1,217 @@
 from simplex import *
 
 import copy
+import threading
+import tracemalloc
 import pytest
 
 
+def make_pairs_tableau(n: int) -> Tableau:
+    # max sum(x) s.t. x_i + x_j <= 1 + i + j for every pair of variables.
+    constraints = [
+        [1 if k in (i, j) else 0 for k in range(n)] + [1 + i + j]
+            for i in range(n) for j in range(i + 1, n)
+    ]
+    return Tableau.from_rows(to_tableau([1.0] * n, constraints))
+
+
 class TestSimplex:
 
+    def test_tableau_from_rows_equals_rows(self):
+        rows = [
+            [1, 1, 1, 0, 0, 12],
+            [2, 1, 0, 1, 0, 16],
+        ]
+
+        tableau = Tableau.from_rows(rows)
+        assert tableau == rows
+        assert tableau.tolist() == rows
+        assert tableau[1][-1] == 16
+
+
+    def test_tableau_from_rows_if_uneven_rows_then_raises(self):
+        with pytest.raises(ValueError):
+            Tableau.from_rows([[1, 2], [3]])
+
+
+    def test_tableau_copy_is_independent(self):
+        tableau = Tableau.from_rows([[1, 2], [3, 4]])
+        tableau_copy = tableau.copy()
+        tableau[0][0] = 5
+
+        assert tableau_copy == [[1, 2], [3, 4]]
+
+
+    def test_perform_pivoting_when_tableau_then_modifies_it_in_place(self):
+        tableau = Tableau.from_rows([
+            [0, 0.5, 1, -0.5, 0, 4],
+            [1, 0.5, 0, 0.5, 0, 8],
+            [0, -10, 0, 20, 1, 320],
+        ])
+        buffer = tableau.buffer
+
+        expected_tableau = [
+            [0, 1, 2, -1, 0, 8],
+            [1, 0, -1, 1, 0, 4],
+            [0, 0, 20, 10, 1, 400],
+        ]
+
+        perform_pivoting(tableau)
+        assert tableau == expected_tableau
+        assert tableau.buffer is buffer
+
+
+    def test_tableau_pivot_equals_pivot_at(self):
+        rows = [
+            [1, 1, 1, 0, 0, 0, 12],
+            [2, 1, 0, 1, 0, 0, 16],
+            [0, 2, 0, 0, 1, 0, 11],
+            [-40, -30, 0, 0, 0, 1, 0],
+        ]
+        tableau = Tableau.from_rows(rows)
+        row = tableau[2]
+
+        tableau.pivot((1, 0))
+        pivot_at(rows, (1, 0))
+        assert tableau == rows
+        assert tableau[2] is row
+
+
+    def test_tableau_pivot_does_not_allocate_rows(self):
+        width = 1000
+        tableau = Tableau.from_rows([
+            [1.0 + (row_idx + col_idx) % 7 for col_idx in range(width)]
+                for row_idx in range(3)
+        ])
+        tracemalloc.start()
+        # The first pivot allocates the buffer kept across pivots.
+        tableau.pivot((0, 0))
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        tableau.pivot((0, 0))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        assert peak - current < 8*width
+
+
+    def test_tableau_pivot_when_mapped_in_multiple_blocks_then_equals_pivot_at(
+            self, tmp_path, monkeypatch,
+    ):
+        rows = [
+            [1, 1, 1, 0, 0, 0, 12],
+            [2, 1, 0, 1, 0, 0, 16],
+            [0, 2, 0, 0, 1, 0, 11],
+            [-40, -30, 0, 0, 0, 1, 0],
+        ]
+        monkeypatch.setattr("simplex.PIVOT_BLOCK_BYTES", 8*7*3)
+
+        with Tableau.open_file(str(tmp_path / "tableau"), 4, 7) as tableau:
+            for row_idx, row in enumerate(rows):
+                tableau[row_idx] = row
+
+            tableau.pivot((1, 0))
+            pivot_at(rows, (1, 0))
+            assert tableau == rows
+
+
+    def test_tableau_when_single_precision(self):
+        tableau = Tableau.from_rows([[1, 2], [3, 0.1]], typecode='f')
+
+        assert tableau.typecode == 'f'
+        assert tableau.buffer.itemsize == 4
+        assert tableau[1][1] != 0.1
+        assert abs(tableau[1][1] - 0.1) < 1e-7
+        assert tableau.copy().typecode == 'f'
+
+
+    def test_run_mixed_precision_recovers_double_precision(self):
+        goal_function = [0.1, 0.7]
+        constraints = [[0.3, 0.9, 1.1], [0.7, 0.1, 0.3]]
+        tableau = to_tableau(goal_function, constraints)
+        expected = to_tableau(goal_function, constraints)
+        run_simplex(expected)
+
+        assert run_mixed_precision(tableau) == Status.OPTIMAL
+        assert get_solution(tableau) == get_solution(expected)
+
+
+    def test_run_mixed_precision_when_tableau_then_uses_less_memory(self):
+        tableau = make_pairs_tableau(16)
+        size = len(tableau.buffer)*tableau.buffer.itemsize
+
+        tracemalloc.start()
+        assert run_mixed_precision(tableau, trace=False) == Status.OPTIMAL
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        # A single unboxed double precision copy is kept for the refinement.
+        assert peak < 2*size
+
+
+    def test_run_simplex_when_tableau_then_keeps_flat_original(self):
+        peaks = []
+        for refactor_interval in (REFACTOR_INTERVAL, None):
+            tableau = make_pairs_tableau(16)
+            size = len(tableau.buffer)*tableau.buffer.itemsize
+            tracemalloc.start()
+            assert run_simplex(
+                tableau, trace=False, refactor_interval=refactor_interval,
+            ) == Status.OPTIMAL
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+        assert peaks[0] < 2*size
+        assert peaks[1] < size / 4
+
+
+    def test_run_mixed_precision_if_refinement_fails_then_solves_in_double_precision(
+            self, monkeypatch,
+    ):
+        monkeypatch.setattr("simplex.refine", lambda *args: False)
+        tableau = to_tableau([40, 30], [[1, 1, 12], [2, 1, 16]])
+
+        assert perform_simplex(tableau, mixed_precision=True) == ([4, 8], 400)
+
+
+    def test_refine_reduces_residuals(self):
+        original = to_tableau([40, 30], [[1, 1, 12], [2, 1, 16]])
+        tableau = refactor(original, [1, 0])
+        tableau[0][-1] += 1e-6
+        tableau[-1][2] += 1e-6
+
+        assert refine(original, tableau, [1, 0])
+        assert max(get_residuals(original, tableau, [1, 0])) <= 1e-9
+
+
+    def test_perform_simplex_when_memory_mapped_tableau(self, tmp_path):
+        path = str(tmp_path / "tableau.bin")
+        rows = [
+            [1, 1, 1, 0, 0, 12],
+            [2, 1, 0, 1, 0, 16],
+            [-40, -30, 0, 0, 1, 0],
+        ]
+
+        with Tableau.open_file(path, 3, 6) as tableau:
+            for row_idx, row in enumerate(rows):
+                tableau[row_idx] = row
+            assert tableau.mapped
+            assert perform_simplex(tableau) == ([4, 8], 400)
+
+        with Tableau.open_file(path, 3, 6) as tableau:
+            assert tableau[-1][-1] == 400
+
+
+    def test_perform_simplex_when_tableau(self):
+        tableau = Tableau.from_rows([
+            [1, 1, 1, 0, 0, 12],
+            [2, 1, 0, 1, 0, 16],
+            [-40, -30, 0, 0, 1, 0],
+        ])
+
+        assert perform_simplex(tableau) == ([4, 8], 400)
+
+
     def test_get_pivot_pos_if_empty_tableau_then_returns_none(self):
         assert get_pivot_pos([[]]) == None
 
@@ -51,12 +257,66 @@ class TestSimplex:
         assert get_pivot_pos(tableau)[1] == 2
 
 
+    def test_get_pivot_pos_when_bland_pricing_then_returns_first_neg_val(self):
+        tableau = [
+            [0, 0.5, 1, -0.5, 0, 4],
+            [1, 0.5, 0, 0.5, 0, 8],
+            [1, -30, -40, 0, 1, 0],
+        ]
+
+        assert get_pivot_pos(tableau, pricing=Pricing.BLAND) == (0, 1)
+
+
+    def test_get_pivot_pos_when_bland_pricing_then_breaks_ties_by_basis(self):
+        # Both rows are degenerate; the second one holds the basic column with
+        # the smaller index.
+        tableau = [
+            [1, 1, 0, 1, 0, 0],
+            [1, 0, 1, 0, 0, 0],
+            [-1, -1, 0, 0, 1, 0],
+        ]
+
+        assert get_pivot_pos(tableau) == (0, 0)
+        assert get_pivot_pos(tableau, pricing=Pricing.BLAND) == (1, 0)
+
+
+    def test_get_pivot_pos_when_greatest_improvement_pricing(self):
+        tableau = [
+            [1, 1, 1, 0, 0, 12], # 12/1 = 12
+            [4, 1, 0, 1, 0, 16], # 16/4 = 4
+            [-40, -30, 0, 0, 1, 0],
+        ]
+
+        # Column 0 improves the goal function by 40*4, column 1 by 30*12.
+        assert get_pivot_pos(tableau, pricing=Pricing.GREATEST_IMPROVEMENT) == (0, 1)
+
+
     def test_get_pivot_pos_if_all_quotiens_are_ignored_then_returns_none(self):
         tableau = [
-            [0, 0.5,  -1, -0.5, 0, 4], # negative quotient
-            [1, 0.5,   0,  0.5, 0, 8], # zero in numerator
-            [1, 0.5,   1,  0.5, 0, 0], # zero in denominator
-            [1, -30, -40,    0, 1, 0],
+            [0, 0.5,    -1, -0.5, 0, 4], # negative denominator
+            [1, 0.5,     0,  0.5, 0, 8], # zero in denominator
+            [1, 0.5, 1e-12,  0.5, 0, 0], # denominator below pivot tolerance
+            [1, -30,   -40,    0, 1, 0],
+        ]
+
+        assert get_pivot_pos(tableau) == None
+
+
+    def test_get_pivot_pos_if_zero_in_numerator_then_returns_degenerate_row(self):
+        tableau = [
+            [0, 0.5,  1, -0.5, 0, 4],
+            [1, 0.5,  1,  0.5, 0, 0],
+            [1, -30, -40,   0, 1, 0],
+        ]
+
+        assert get_pivot_pos(tableau) == (1, 2)
+
+
+    def test_get_pivot_pos_when_bot_row_within_tolerance_then_returns_none(self):
+        tableau = [
+            [1,     1, 1, 0, 0, 12],
+            [2,     1, 0, 1, 0, 16],
+            [0, -1e-12, 0, 0, 1, 0],
         ]
 
         assert get_pivot_pos(tableau) == None
@@ -129,13 +389,120 @@ class TestSimplex:
         assert get_solution(tableau) == ([8, 0], 24)
 
 
-    def test_get_solution_if_minimization(self):
+    def test_get_solution_when_rounding_errors_then_detects_basis(self):
+        tableau = [
+            [0, 1 + 1e-13, 2, -1, 0, 8],
+            [1, 1e-14, -1, 1, 0, 4],
+            [-1e-15, 0, 20, 10, 1, 400],
+        ]
+
+        assert get_solution(tableau) == ([4, 8], 400)
+
+
+    def test_get_basis(self):
         tableau = [
-            [0, 1,  2, -1, 0,   8],
-            [1, 0, -1,  1, 0,   4],
+            [0, 0.5, 1, -0.5, 0, 4],
+            [1, 0.5, 0, 0.5, 0, 8],
+            [0, -10, 0, 20, 1, 320],
+        ]
+
+        assert get_basis(tableau) == [2, 0]
+
+
+    def test_refactor_rebuilds_tableau_from_basis(self):
+        original = [
+            [1, 1, 1, 0, 0, 12],
+            [2, 1, 0, 1, 0, 16],
+            [-40, -30, 0, 0, 1, 0],
+        ]
+
+        expected = [
+            [0, 1, 2, -1, 0, 8],
+            [1, 0, -1, 1, 0, 4],
             [0, 0, 20, 10, 1, 400],
         ]
 
+        assert refactor(original, [1, 0]) == expected
+
+
+    def test_get_residuals_when_tableau_drifted(self):
+        original = [
+            [1, 1, 1, 0, 0, 12],
+            [2, 1, 0, 1, 0, 16],
+            [-40, -30, 0, 0, 1, 0],
+        ]
+        tableau = [
+            [0, 1, 2, -1, 0, 8.5],
+            [1, 0, -1, 1, 0, 4],
+            [0, 0, 20, 10, 1, 401],
+        ]
+
+        # The errors relative to 12 + 4 + 8.5 and 20*12 + 10*16 + 0.
+        assert get_residuals(original, tableau, [1, 0]) \
+                == pytest.approx((0.5 / 25.5, 1 / 401))
+
+
+    def test_get_residuals_do_not_depend_on_scale(self):
+        residuals = []
+        for scale in (1e3, 1e6):
+            original = to_tableau(
+                [40*scale, 30*scale], [[scale, scale, 12*scale], [2*scale, scale, 16*scale]],
+            )
+            tableau = refactor(original, [1, 0])
+            tableau[0][-1] += 1e-3
+            tableau[-1][-1] += 1e-3*scale
+            residuals.append(get_residuals(original, tableau, [1, 0]))
+
+        assert residuals[0] == pytest.approx(residuals[1], rel=1e-2)
+
+
+    def test_iterate_simplex_when_scaled_data_then_does_not_refactor(self):
+        goal_function = [3, 2, 5, 2, 8, 8, 8, 7]
+        constraints = [
+            [4, 2, 8, 1, 7, 7, 1, 8, 44],
+            [4, 2, 6, 1, 1, 1, 9, 1, 58],
+            [4, 7, 1, 9, 4, 8, 8, 9, 39],
+            [6, 4, 4, 8, 5, 1, 7, 9, 22],
+            [3, 5, 2, 6, 9, 7, 9, 4, 48],
+            [5, 8, 9, 7, 1, 8, 4, 7, 63],
+            [3, 6, 9, 6, 2, 8, 9, 2, 30],
+            [9, 7, 6, 8, 1, 8, 1, 5, 88],
+        ]
+        tableau = to_tableau(
+            [1e6*c for c in goal_function],
+            [[1e6*x for x in row] for row in constraints],
+        )
+        stats = SolveStats()
+
+        for _ in iterate_simplex(tableau, refactor_interval=1, stats=stats): pass
+        assert stats.refactorizations == 0
+
+
+    def test_iterate_simplex_when_drifted_then_refactors(self):
+        tableau = [
+            [1, 1, 1, 0, 0, 12],
+            [2, 1, 0, 1, 0, 16],
+            [-40, -30, 0, 0, 1, 0],
+        ]
+        steps = iterate_simplex(tableau, refactor_interval=1)
+        next(steps)
+        tableau[0][-1] += 1e-3
+        next(steps)
+
+        assert tableau == [
+            [0, 1, 2, -1, 0, 8],
+            [1, 0, -1, 1, 0, 4],
+            [0, 0, 20, 10, 1, 400],
+        ]
+
+
+    def test_get_solution_if_minimization(self):
+        tableau = [
+            [0, 1, -1,  1, 0,   10],
+            [1, 0,  1, -2, 0,   20],
+            [0, 0,  4,  8, 1, -400],
+        ]
+
         assert get_solution(tableau, Mode.MINIMIZATION) == ([20, 10], 400)
 
 
@@ -149,6 +516,32 @@ class TestSimplex:
         assert get_solution(tableau) == ([4, 8], 400)
 
 
+    def test_get_alternative_solutions_when_optimal_edge(self):
+        tableau = to_tableau([1, 1], [[1, 1, 4], [1, 0, 3], [0, 1, 3]])
+        run_simplex(tableau)
+        rows = [list(row) for row in tableau]
+
+        solutions = get_alternative_solutions(tableau)
+        assert sorted(solutions) == [([1, 3], 4), ([3, 1], 4)]
+        assert solutions[0] == get_solution(tableau)
+        assert tableau == rows
+
+
+    def test_get_alternative_solutions_when_unique_optimum(self):
+        tableau = to_tableau([40, 30], [[1, 1, 12], [2, 1, 16]])
+        run_simplex(tableau)
+
+        assert get_alternative_solutions(tableau) == [([4, 8], 400)]
+
+
+    def test_get_alternative_solutions_when_limit(self):
+        # Every vertex of the cube is optimal.
+        tableau = to_tableau([0, 0, 0], [[1, 0, 0, 1], [0, 1, 0, 1], [0, 0, 1, 1]])
+
+        assert len(get_alternative_solutions(tableau)) == 8
+        assert len(get_alternative_solutions(tableau, limit=3)) == 3
+
+
     def test_perform_simplex_when_feasible_and_bounded(self):
         # Problem I:
         tableau = [
@@ -181,14 +574,264 @@ class TestSimplex:
 
     def test_perform_simplex_when_minimization(self):
         tableau = [
-            [  1,   1, 1, 0, 0, 12],
-            [  2,   1, 0, 1, 0, 16],
-            [-40, -30, 0, 0, 1,  0],
+            [-1, -2, 1, 0, 0, -40], # x1 + 2x2 >= 40
+            [-1, -1, 0, 1, 0, -30], # x1 +  x2 >= 30
+            [12, 16, 0, 0, 1,   0], # Z = 12x1 + 16x2
         ]
 
         assert perform_simplex(tableau, Mode.MINIMIZATION) == ([20, 10], 400)
 
 
+    def test_perform_simplex_when_infeasible(self):
+        tableau = [
+            [1, 1, 1, 0, 0,  4], # x1 + x2 <= 4
+            [1, 1, 0, 1, 0, -6], # x1 + x2 >= 6
+            [1, 1, 0, 0, 1,  0], # Z = x1 + x2
+        ]
+
+        assert run_simplex(tableau) == Status.INFEASIBLE
+
+
+    def test_run_simplex_when_maximization_with_infeasible_start(self):
+        tableau = [
+            [ 1,  1, 1, 0, 0,  4], # x1 + x2 <= 4
+            [-1,  0, 0, 1, 0, -1], # x1 >= 1
+            [-1, -2, 0, 0, 1,  0], # Z = x1 + 2x2
+        ]
+
+        assert run_simplex(tableau) == Status.OPTIMAL
+        assert get_solution(tableau) == ([1, 3], 7)
+
+
+    def test_get_feasibility_pivot_pos_uses_blands_rule(self):
+        tableau = [
+            [-1, -2, 1, 0, 0, -4],
+            [-3, -1, 0, 1, 0, -6],
+            [-1, -1, 0, 0, 1,  0],
+        ]
+
+        assert get_feasibility_pivot_pos(tableau, [2, 3]) == (0, 0)
+
+
+    def test_get_feasibility_pivot_pos_if_row_proves_infeasibility(self):
+        tableau = [
+            [1, 1, 1, 0, 0,  4],
+            [1, 1, 0, 1, 0, -6],
+            [1, 1, 0, 0, 1,  0],
+        ]
+
+        assert get_feasibility_pivot_pos(tableau, [2, 3]) == None
+
+
+    def test_get_feasibility_pivot_pos_when_free_cols(self):
+        tableau = [
+            [1, 1, 1, 0, 0,   4],
+            [0, 0, 1, 1, 0, -10],
+            [1, 1, 0, 0, 1,   0],
+        ]
+
+        assert get_feasibility_pivot_pos(tableau, [0, 3]) == None
+        assert get_feasibility_pivot_pos(tableau, [0, 3], free_cols={2}) == (1, 2)
+        assert get_leaving_row(tableau, [0, 3], free_cols={3}) == None
+
+
+    def test_run_simplex_when_feasible_and_bounded(self):
+        tableau = [
+            [1, 1, 1, 0, 0, 12],
+            [2, 1, 0, 1, 0, 16],
+            [-40, -30, 0, 0, 1, 0],
+        ]
+
+        assert run_simplex(tableau) == Status.OPTIMAL
+        assert tableau[-1][-1] == 400
+
+
+    def test_run_simplex_when_iteration_limit(self):
+        tableau = to_tableau([40, 30], [[1, 1, 12], [2, 1, 16]])
+
+        assert run_simplex(tableau, iteration_limit=1) == Status.ITERATION_LIMIT
+        assert tableau[-1][-1] == 320
+
+
+    def test_solve_with_budget_when_budget_exhausted_then_reports_gap(self):
+        tableau = to_tableau([40, 30], [[1, 1, 12], [2, 1, 16]])
+
+        result = solve_with_budget(tableau, iteration_limit=1)
+        assert result.status == Status.ITERATION_LIMIT
+        assert (result.solution, result.objective) == ([8, 0], 320)
+        assert (result.bound, result.gap) == (440, 0.375)
+
+
+    def test_solve_with_budget_when_optimal(self):
+        tableau = to_tableau([40, 30], [[1, 1, 12], [2, 1, 16]])
+
+        result = solve_with_budget(tableau, time_limit=60)
+        assert result.status == Status.OPTIMAL
+        assert (result.solution, result.objective) == ([4, 8], 400)
+        assert (result.bound, result.gap) == (400, 0)
+
+
+    def test_solve_with_budget_does_not_print(self, capsys):
+        tableau = to_tableau([40, 30], [[1, 1, 12], [2, 1, 16]])
+
+        assert solve_with_budget(tableau, time_limit=60).status == Status.OPTIMAL
+        assert capsys.readouterr().out == ""
+
+
+    def test_solve_result_extracts_values_lazily(self, monkeypatch):
+        tableau = to_tableau([40, 30], [[1, 1, 12], [2, 1, 16], [0, 1, 10]])
+        run_simplex(tableau)
+
+        def get_basis(*args):
+            raise AssertionError("the basis was extracted eagerly")
+        monkeypatch.setattr("simplex.get_basis", get_basis)
+        result = SolveResult(Status.OPTIMAL, tableau)
+        assert result.objective == 400
+
+        monkeypatch.undo()
+        assert result.basis == [1, 0, 4]
+        assert result.solution == [4, 8]
+        assert result.slacks == [0, 0, 2]
+        assert result.duals == [20, 10, 0]
+        assert result.reduced_costs == [0, 0]
+
+
+    def test_solve_result_when_minimization(self):
+        tableau = to_tableau([12, 16], [[-1, -2, -40], [-1, -1, -30]], Mode.MINIMIZATION)
+        run_simplex(tableau)
+
+        result = SolveResult(Status.OPTIMAL, tableau, Mode.MINIMIZATION)
+        assert (result.solution, result.objective) == ([20, 10], 400)
+        # Raising the demand of a `>=` constraint, i.e. lowering its free
+        # term in the `<=` form, raises the cost.
+        assert result.duals == [-4, -8]
+
+
+    def test_solve_result_when_unbounded_minimization(self):
+        tableau = to_tableau([-1, 0], [[1, -1, 1]], Mode.MINIMIZATION)
+        status = run_simplex(tableau, trace=False)
+
+        result = SolveResult(status, tableau, Mode.MINIMIZATION)
+        assert result.status == Status.UNBOUNDED
+        assert (result.objective, result.bound) == (float('-inf'), float('-inf'))
+
+
+    def test_get_solution_does_not_print(self, capsys):
+        tableau = to_tableau([40, 30], [[1, 1, 12], [2, 1, 16]])
+        run_simplex(tableau)
+        capsys.readouterr()
+
+        assert get_solution(tableau) == ([4, 8], 400)
+        assert capsys.readouterr().out == ""
+
+
+    def test_solve_with_budget_if_not_feasible_yet_then_reports_bound_only(self):
+        tableau = to_tableau([12, 16], [[-1, -2, -40], [-1, -1, -30]], Mode.MINIMIZATION)
+
+        result = solve_with_budget(tableau, Mode.MINIMIZATION, iteration_limit=1)
+        assert result.status == Status.ITERATION_LIMIT
+        assert result.solution == None
+        assert result.bound <= 400
+        assert result.gap == float('inf')
+
+
+    def test_run_simplex_when_cancelled_then_stops_after_first_pivot(self):
+        tableau = [
+            [1, 1, 1, 0, 0, 12],
+            [2, 1, 0, 1, 0, 16],
+            [-40, -30, 0, 0, 1, 0],
+        ]
+        cancel = threading.Event()
+        cancel.set()
+
+        assert run_simplex(tableau, cancel=cancel) == Status.CANCELLED
+        assert tableau[-1][-1] == 320
+
+
+    def test_run_simplex_when_crash_then_takes_fewer_pivots(self):
+        goal_function = [10, 7, 8, 14]
+        constraints = [
+            [6, 3, 0, 9, 98],
+            [2, 1, 0, 8, 59],
+            [0, 3, 2, 2, 23],
+        ]
+        tableau = to_tableau(goal_function, constraints)
+        stats = SolveStats()
+
+        assert run_simplex(tableau, stats=stats) == Status.OPTIMAL
+        expected = get_solution(tableau)
+        assert stats.pivots == 4
+
+        for crash in (Crash.LTSF, Crash.BIXBY):
+            tableau = to_tableau(goal_function, constraints)
+            stats = SolveStats()
+
+            assert run_simplex(tableau, crash=crash, stats=stats) == Status.OPTIMAL
+            assert get_solution(tableau)[1] == pytest.approx(expected[1])
+            assert stats.crash_pivots == 2
+            assert stats.pivots == 2
+
+
+    def test_get_crash_pivots_when_ltsf_then_prefers_sparse_columns(self):
+        tableau = [
+            [1, 1, 1, 0, 0, 10],
+            [1, 0, 0, 1, 0, 4],
+            [-2, -1, 0, 0, 1, 0],
+        ]
+
+        assert get_crash_pivots(tableau, Crash.LTSF) == [(0, 1)]
+        assert get_crash_pivots(tableau, Crash.BIXBY) == [(1, 0), (0, 1)]
+
+
+    def test_get_crash_pivots_then_selects_triangular_basis(self):
+        tableau = [
+            [1, 1, 1, 0, 0, 12],
+            [2, 1, 0, 1, 0, 16],
+            [-40, -30, 0, 0, 1, 0],
+        ]
+
+        # Both columns are nonzero in both rows, so only one can be taken.
+        assert get_crash_pivots(tableau, Crash.LTSF) == [(1, 0)]
+        assert get_crash_pivots(tableau, Crash.NONE) == []
+
+
+    def test_perform_simplex_when_log_then_records_pivots(self):
+        tableau = [
+            [1, 1, 1, 0, 0, 12],
+            [2, 1, 0, 1, 0, 16],
+            [-40, -30, 0, 0, 1, 0],
+        ]
+        log = PivotLog(snapshot_interval=1)
+
+        perform_simplex(tableau, log=log)
+        assert len(log) == 2
+        assert log[0] == (1, 0, 0, 3)
+        assert log[-1] == (0, 1, 1, 2)
+
+
+    def test_pivot_log_tableau_at_replays_pivots_from_snapshot(self):
+        initial = [
+            [1, 1, 1, 0, 0, 12],
+            [2, 1, 0, 1, 0, 16],
+            [-40, -30, 0, 0, 1, 0],
+        ]
+        tableau = copy.deepcopy(initial)
+        log = PivotLog()
+
+        perform_simplex(tableau, log=log)
+        assert list(log.snapshots) == [0]
+        assert log.tableau_at(0) == initial
+        assert log.tableau_at(1) == [
+            [0, 0.5, 1, -0.5, 0, 4],
+            [1, 0.5, 0, 0.5, 0, 8],
+            [0, -10, 0, 20, 1, 320],
+        ]
+        assert log.tableau_at(2) == tableau
+
+        with pytest.raises(IndexError):
+            log.tableau_at(3)
+
+
     def test_to_tableau_if_var_count_equals_constraint_count(self):
         goal_function = [40.0, 30.0] # Z = 40x1 + 30x2
         constraints = [
@@ -249,63 +892,34 @@ class TestSimplex:
         ]
 
         expected = [
-            [ 2, -1, 3, -1, 1, 0, 0, 6],
-            [ 1,  2, 1,  2, 0, 1, 0, 4],
-            [-3,  2, 0, -1, 0, 0, 1, 0],
+            [-2, -1, 1, 0, 0, 0, 0, -3],
+            [ 1, -2, 0, 1, 0, 0, 0,  2],
+            [-3, -1, 0, 0, 1, 0, 0,  0],
+            [ 1, -2, 0, 0, 0, 1, 0, -1],
+            [ 6,  4, 0, 0, 0, 0, 1,  0],
         ]
 
         assert to_tableau(goal_function, constraints, Mode.MINIMIZATION) == expected
+        assert constraints[0] == [-2, -1, -3]
 
 
-    def test_to_basic_matrix(self):
-        goal_function = [40.0, 30.0]
-        constraints = [
-            [1, 1, 12],
-            [2, 1, 16],
-            [0, 2, 11],
-        ]
-
-        expected = [
-            [ 1,  1, 12],
-            [ 2,  1, 16],
-            [ 0,  2, 11],
-            [40, 30,  0],
-        ]
+    def test_solve_problem_when_minimization(self):
+        constraints = [[1, 2, 40], [1, 1, 30]]
 
-        assert to_basic_matrix(goal_function, constraints) == expected
+        assert solve_problem(
+            [12, 16], constraints, [">=", ">="], Mode.MINIMIZATION,
+        ) == ([20, 10], 400)
 
 
-    def test_transpose_basic_matrix(self):
-        matrix = [
-            [ 1,  1, 12],
-            [ 2,  1, 16],
-            [ 0,  2, 11],
-            [40, 30,  0],
-        ]
-
-        expected = [
-            [ 1,  2,  0, 40],
-            [ 1,  1,  2, 30],
-            [12, 16, 11,  0],
-        ]
-
-        assert transpose_basic_matrix(matrix) == expected
+    def test_solve_problem_when_maximization(self):
+        assert solve_problem([40.0, 30.0], [[1, 1, 12], [2, 1, 16]]) == ([4, 8], 400)
 
 
-    def test_basic_matrix_to_tableau(self):
-        matrix = [
-            [ 1,  2,  0, 40],
-            [ 1,  1,  2, 30],
-            [12, 16, 11,  0],
-        ]
-
-        expected = [
-            [  1,   2,   0, 1, 0, 0, 40],
-            [  1,   1,   2, 0, 1, 0, 30],
-            [-12, -16, -11, 0, 0, 1,  0],
-        ]
+    def test_solve_problem_does_not_modify_constraints(self):
+        constraints = [[-1, -2, -40], [-1, -1, -30]]
 
-        assert basic_matrix_to_tableau(matrix) == expected
+        solve_problem([12, 16], constraints, mode=Mode.MINIMIZATION)
+        assert constraints == [[-1, -2, -40], [-1, -1, -30]]
 
 
     def test_calc_col_widths_if_empty_tableau_then_returns_single_0(self):
@@ -0,0 +1,134 @@
+from transport import *
+from simplex import apply_inequalities
+
+import math
+import pytest
+
+
+class TestTransport:
+
+    def test_get_assignment(self):
+        costs = [
+            [4, 1, 3],
+            [2, 0, 5],
+            [3, 2, 2],
+        ]
+
+        assert get_assignment(costs) == [1, 0, 2]
+
+
+    def test_get_assignment_when_more_columns_than_rows(self):
+        costs = [
+            [7, 3, 9, 1],
+            [8, 2, 9, 4],
+        ]
+
+        assert get_assignment(costs) == [3, 1]
+
+
+    def test_get_assignment_if_more_rows_than_columns_then_raises(self):
+        with pytest.raises(ValueError):
+            get_assignment([[1], [2]])
+
+
+    def test_solve_assignment_when_maximization(self):
+        costs = [
+            [4, 1, 3],
+            [2, 0, 5],
+            [3, 2, 2],
+        ]
+
+        assert solve_assignment(costs, Mode.MAXIMIZATION) == (
+            [1, 0, 0, 0, 0, 1, 0, 1, 0], 11,
+        )
+
+
+    def test_get_vogel_basis_forms_spanning_tree(self):
+        shipments, basis = get_vogel_basis([20, 30], [10, 25, 15], [
+            [8, 6, 10],
+            [9, 12, 13],
+        ])
+
+        assert len(basis) == 4
+        assert [sum(row) for row in shipments] == [20, 30]
+        assert [sum(col) for col in zip(*shipments)] == [10, 25, 15]
+
+
+    def test_solve_transportation(self):
+        costs = [
+            [8, 6, 10, 9],
+            [9, 12, 13, 7],
+            [14, 9, 16, 5],
+        ]
+
+        solution, value = solve_transportation([35, 50, 40], [45, 20, 30, 30], costs)
+        assert value == 1020
+        assert solution == [0, 10, 25, 0, 45, 0, 5, 0, 0, 10, 0, 30]
+
+
+    def test_solve_transportation_when_surplus_then_ships_demands(self):
+        solution, value = solve_transportation([20, 30], [10, 15], [
+            [2, 4],
+            [3, 1],
+        ])
+
+        assert (solution, value) == ([10, 0, 0, 15], 35)
+
+
+    def test_solve_transportation_if_demands_exceed_supplies(self):
+        assert solve_transportation([5], [3, 3], [[1, 1]]) == ([math.inf]*2, math.inf)
+
+
+    def test_get_transportation_detects_structure(self):
+        # x11 + x12 <= 20, x21 + x22 <= 30, x11 + x21 = 10, x12 + x22 = 15
+        constraints = apply_inequalities([
+            [1, 1, 0, 0, 20],
+            [0, 0, 1, 1, 30],
+            [1, 0, 1, 0, 10],
+            [1, 0, 1, 0, 10],
+            [0, 1, 0, 1, 15],
+            [0, 1, 0, 1, 15],
+        ], ["<=", "<=", "<=", ">=", "<=", ">="])
+
+        assert get_transportation([2, 4, 3, 1], constraints) == (
+            [20, 30], [10, 15], [[2, 4], [3, 1]], [(0, 0), (0, 1), (1, 0), (1, 1)],
+        )
+
+
+    def test_get_transportation_if_other_structure_then_returns_none(self):
+        assert get_transportation([40, 30], [[1, 1, 12], [2, 1, 16]]) == None
+
+
+    def test_solve_structured_problem_equals_solve_problem(self):
+        goal_function = [4, 1, 3, 2, 0, 5, 3, 2, 2]
+        constraints = []
+        for row in range(3):
+            constraints.append([1 if idx // 3 == row else 0 for idx in range(9)] + [1])
+        for col in range(3):
+            constraints.append([1 if idx % 3 == col else 0 for idx in range(9)] + [1])
+        inequalities = ["<="]*3 + [">="]*3
+
+        assert solve_structured_problem(
+            goal_function, constraints, inequalities, Mode.MINIMIZATION,
+        ) == solve_problem(goal_function, constraints, inequalities, Mode.MINIMIZATION)
+
+
+    def test_get_transportation_if_negative_supply_then_returns_none(self):
+        constraints = apply_inequalities([
+            [1, 0, 5],
+            [0, 1, -1],
+            [1, 1, 4],
+            [1, 1, 4],
+        ], ["<=", "<=", "<=", ">="])
+
+        assert get_transportation([6, -3], constraints, Mode.MINIMIZATION) == None
+
+
+    def test_solve_structured_problem_if_negative_free_terms_then_falls_back(self):
+        goal_function = [1, 1]
+        constraints = [[1, 0, 1], [0, 1, -1], [1, 1, -1]]
+        inequalities = ["<=", "<=", ">="]
+
+        assert solve_structured_problem(
+            goal_function, constraints, inequalities, Mode.MINIMIZATION,
+        ) == solve_problem(goal_function, constraints, inequalities, Mode.MINIMIZATION)
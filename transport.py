@@ -0,0 +1,424 @@
+"""
+This file contains fast paths for transportation problems, i.e. problems of
+shipping goods from sources with limited supplies to sinks with given demands
+at the minimum cost, and for assignment problems, in which every supply and
+demand is 1. Under the tableau method, these problems are highly degenerate,
+so most of its pivots do not change the vertex.
+"""
+
+import math
+
+from simplex import DEFAULT_TOLERANCES, Mode, apply_inequalities, solve_problem
+
+
+def get_assignment(costs: list[list[float]]) -> list[int]:
+    """
+    Returns the column assigned to every row of the given cost matrix in the
+    cheapest assignment of the rows to distinct columns. The matrix must not
+    have more rows than columns.
+
+    This is the Hungarian method in the shortest augmenting path form of
+    Jonker and Volgenant, which takes O(n^2 m) time for an n x m matrix.
+    """
+
+    row_count = len(costs)
+    col_count = len(costs[0]) if row_count > 0 else 0
+    if row_count > col_count:
+        raise ValueError("An assignment matrix must not have more rows than columns")
+
+    # The rows and columns are numbered from 1, column 0 being a virtual one,
+    # from which every augmenting path starts.
+    row_potentials = [0.0]*(row_count + 1)
+    col_potentials = [0.0]*(col_count + 1)
+    col_rows = [0]*(col_count + 1)
+    way = [0]*(col_count + 1)
+
+    for row in range(1, row_count + 1):
+        col_rows[0] = row
+        col = 0
+        min_slack = [math.inf]*(col_count + 1)
+        used = [False]*(col_count + 1)
+
+        # Grow the tree of the shortest paths until it reaches a free column.
+        while True:
+            used[col] = True
+            cur_row = col_rows[col]
+            row_costs = costs[cur_row - 1]
+            delta, next_col = math.inf, None
+            for j in range(1, col_count + 1):
+                if used[j]: continue
+                slack = row_costs[j - 1] - row_potentials[cur_row] - col_potentials[j]
+                if slack < min_slack[j]:
+                    min_slack[j] = slack
+                    way[j] = col
+                if min_slack[j] < delta:
+                    delta, next_col = min_slack[j], j
+
+            for j in range(col_count + 1):
+                if used[j]:
+                    row_potentials[col_rows[j]] += delta
+                    col_potentials[j] -= delta
+                else:
+                    min_slack[j] -= delta
+
+            col = next_col
+            if col_rows[col] == 0: break
+
+        # Augment along the path.
+        while col != 0:
+            prev_col = way[col]
+            col_rows[col] = col_rows[prev_col]
+            col = prev_col
+
+    assignment = [None]*row_count
+    for col in range(1, col_count + 1):
+        if col_rows[col] != 0:
+            assignment[col_rows[col] - 1] = col - 1
+
+    return assignment
+
+
+def solve_assignment(
+        costs: list[list[float]],
+        mode = Mode.MINIMIZATION,
+) -> tuple[list[float], float]:
+    """
+    Returns the solution of the assignment problem with the given cost
+    matrix in the same form as `perform_simplex`, i.e. the 0/1 values of the
+    variables x11, x12, ..., x1m, x21, ..., xnm of assigning row i to column
+    j, and the total cost. Every row is assigned to a distinct column.
+    """
+
+    sign = 1 if mode == Mode.MINIMIZATION else -1
+    assignment = get_assignment([[sign*c for c in row] for row in costs])
+
+    col_count = len(costs[0]) if len(costs) > 0 else 0
+    solution = [0.0]*(len(costs)*col_count)
+    for row, col in enumerate(assignment):
+        solution[row*col_count + col] = 1.0
+
+    return solution, sum(costs[row][col] for row, col in enumerate(assignment))
+
+
+def get_vogel_basis(
+        supplies: list[float],
+        demands: list[float],
+        costs: list[list[float]],
+        tol = DEFAULT_TOLERANCES,
+) -> tuple[list[list[float]], list[tuple[int, int]]]:
+    """
+    Returns the initial shipments of a balanced transportation problem found
+    by Vogel's approximation method, together with its m + n - 1 basic cells,
+    some of which may be empty.
+
+    Every step ships as much as possible through the cheapest cell of the row
+    or column with the largest penalty, i.e. the difference between its two
+    smallest costs, and crosses out exactly one line, so the basic cells form
+    a spanning tree of the rows and columns.
+    """
+
+    supplies = list(supplies)
+    demands = list(demands)
+    shipments = [[0.0 for _ in demands] for _ in supplies]
+    basis = []
+    rows = set(range(len(supplies)))
+    cols = set(range(len(demands)))
+
+    def penalty(line_costs):
+        first, second = math.inf, math.inf
+        for cost in line_costs:
+            if cost < first:
+                first, second = cost, first
+            elif cost < second:
+                second = cost
+        return 0 if second == math.inf else second - first
+
+    while len(rows) > 0 and len(cols) > 0:
+        best_penalty, cell = -1, None
+        for row in rows:
+            p = penalty(costs[row][col] for col in cols)
+            if p > best_penalty:
+                best_penalty = p
+                cell = (row, min(cols, key=lambda col: costs[row][col]))
+        for col in cols:
+            p = penalty(costs[row][col] for row in rows)
+            if p > best_penalty:
+                best_penalty = p
+                cell = (min(rows, key=lambda row: costs[row][col]), col)
+
+        row, col = cell
+        amount = min(supplies[row], demands[col])
+        shipments[row][col] = amount
+        supplies[row] -= amount
+        demands[col] -= amount
+        basis.append(cell)
+
+        if len(rows) == 1 and len(cols) == 1:
+            break
+        if supplies[row] <= tol.primal and (len(rows) > 1 or demands[col] > tol.primal):
+            rows.remove(row)
+        else:
+            cols.remove(col)
+
+    return shipments, basis
+
+
+def get_cycle(
+        basis: list[tuple[int, int]],
+        cell: tuple[int, int],
+) -> list[tuple[int, int]]:
+    """
+    Returns the cycle closed by adding the given cell to the basic cells, as
+    the list of its cells starting with the given one, which alternately gain
+    and lose shipments around the cycle.
+    """
+
+    # The basic cells are the edges of a spanning tree of the rows and the
+    # columns. Search it for the path from the column of the cell to its row.
+    row_cells = {}
+    col_cells = {}
+    for basic_cell in basis:
+        row_cells.setdefault(basic_cell[0], []).append(basic_cell)
+        col_cells.setdefault(basic_cell[1], []).append(basic_cell)
+
+    start, target = ('col', cell[1]), ('row', cell[0])
+    came_from = {start: None}
+    stack = [start]
+    while stack:
+        node = stack.pop()
+        if node == target: break
+        kind, idx = node
+        for basic_cell in (col_cells if kind == 'col' else row_cells).get(idx, []):
+            next_node = ('row', basic_cell[0]) if kind == 'col' else ('col', basic_cell[1])
+            if next_node in came_from: continue
+            came_from[next_node] = (node, basic_cell)
+            stack.append(next_node)
+
+    path = []
+    node = target
+    while came_from[node] != None:
+        node, basic_cell = came_from[node]
+        path.append(basic_cell)
+
+    return [cell] + path[::-1]
+
+
+def solve_transportation(
+        supplies: list[float],
+        demands: list[float],
+        costs: list[list[float]],
+        mode = Mode.MINIMIZATION,
+        tol = DEFAULT_TOLERANCES,
+) -> tuple[list[float], float]:
+    """
+    Returns the solution of the transportation problem in the same form as
+    `perform_simplex`, i.e. the amounts x11, x12, ..., x1n, x21, ..., xmn
+    shipped from every source i to every sink j, and the total cost. Every
+    source ships at most its supply and every sink receives exactly its
+    demand. If the demands exceed the supplies, the solution consists of
+    infinite values.
+
+    The initial shipments are found by Vogel's approximation method (see
+    `get_vogel_basis`) and improved with the MODI (modified distribution)
+    method, i.e. the simplex method with the basis stored as a spanning tree
+    of the sources and sinks.
+    """
+
+    row_count, col_count = len(supplies), len(demands)
+    surplus = sum(supplies) - sum(demands)
+    if surplus < -tol.primal:
+        return [math.inf]*(row_count*col_count), math.inf
+
+    # The surplus is shipped to a dummy sink for free.
+    sign = 1 if mode == Mode.MINIMIZATION else -1
+    work_costs = [[sign*c for c in row] + [0] for row in costs]
+    demands = list(demands) + [max(surplus, 0)]
+
+    shipments, basis = get_vogel_basis(supplies, demands, work_costs, tol)
+
+    while True:
+        # Find the potentials for which the reduced costs of the basic cells
+        # are zero.
+        row_potentials = [None]*row_count
+        col_potentials = [None]*(col_count + 1)
+        row_potentials[basis[0][0]] = 0
+        pending = list(basis)
+        while pending:
+            postponed = []
+            for row, col in pending:
+                if row_potentials[row] != None:
+                    col_potentials[col] = work_costs[row][col] - row_potentials[row]
+                elif col_potentials[col] != None:
+                    row_potentials[row] = work_costs[row][col] - col_potentials[col]
+                else:
+                    postponed.append((row, col))
+            pending = postponed
+
+        best_cost, entering = -tol.dual, None
+        for row in range(row_count):
+            for col in range(col_count + 1):
+                reduced_cost = work_costs[row][col] - row_potentials[row] - col_potentials[col]
+                if reduced_cost < best_cost:
+                    best_cost, entering = reduced_cost, (row, col)
+        if entering == None: break
+
+        cycle = get_cycle(basis, entering)
+        losing = cycle[1::2]
+        leaving = min(losing, key=lambda cell: shipments[cell[0]][cell[1]])
+        amount = shipments[leaving[0]][leaving[1]]
+        for row, col in cycle[0::2]:
+            shipments[row][col] += amount
+        for row, col in losing:
+            shipments[row][col] -= amount
+
+        basis.remove(leaving)
+        basis.append(entering)
+
+    solution = [shipments[row][col] for row in range(row_count) for col in range(col_count)]
+    value = sum(
+        costs[row][col]*shipments[row][col]
+            for row in range(row_count) for col in range(col_count)
+    )
+    return solution, value
+
+
+def get_transportation(
+        goal_function: list[float],
+        constraints: list[list[float]],
+        mode = Mode.MAXIMIZATION,
+) -> tuple[list[float], list[float], list[list[float]], list[tuple[int, int]]] | None:
+    """
+    Detects a transportation problem in the given problem in the form
+    expected by `to_tableau`. Returns its supplies, demands and costs and the
+    cell of every variable, or None if the problem does not have this
+    structure.
+
+    Every variable must appear in exactly one source constraint, i.e. either
+    `sum <= supply` or `sum == supply` (a pair of `<=` and `>=` constraints),
+    and one sink constraint, `sum == demand`, with all coefficients equal
+    to 1, and every source and sink must share exactly one variable. A sink
+    constraint may also be `sum >= demand` when minimizing non-negative
+    costs, which never ship more than the demand.
+    """
+
+    # Group the constraints by the variables they sum up. A `<=` constraint
+    # bounds the sum from above and a `>=` one, with negated coefficients,
+    # from below.
+    var_count = len(goal_function)
+    bounds = {}
+    for constraint in constraints:
+        coeffs = constraint[:-1]
+        support = frozenset(idx for idx, coeff in enumerate(coeffs) if coeff != 0)
+        if len(support) == 0: return None
+        signs = {coeffs[idx] for idx in support}
+        # Supplies and demands are non-negative. A negative upper bound makes
+        # the problem infeasible and a negative lower bound is not a demand.
+        if signs == {1} and constraint[-1] < 0: return None
+        if signs == {-1} and constraint[-1] > 0: return None
+        if signs == {1}:
+            lower, upper = bounds.get(support, (0, math.inf))
+            bounds[support] = (lower, min(upper, constraint[-1]))
+        elif signs == {-1}:
+            lower, upper = bounds.get(support, (0, math.inf))
+            bounds[support] = (max(lower, -constraint[-1]), upper)
+        else:
+            return None
+
+    groups = list(bounds)
+    var_groups = [[] for _ in range(var_count)]
+    for group_idx, group in enumerate(groups):
+        for idx in group:
+            var_groups[idx].append(group_idx)
+    if any(len(var_group) != 2 for var_group in var_groups): return None
+
+    def is_source(group_idx):
+        lower, upper = bounds[groups[group_idx]]
+        return upper != math.inf and (lower == 0 or lower == upper)
+
+    costs_fit_lower_bounds = mode == Mode.MINIMIZATION and min(goal_function, default=0) >= 0
+
+    def is_sink(group_idx):
+        lower, upper = bounds[groups[group_idx]]
+        return lower == upper or (upper == math.inf and costs_fit_lower_bounds)
+
+    # Tell the sources from the sinks by trying both sides of the first one.
+    for first_is_source in (True, False):
+        side = {0: first_is_source}
+        stack = [0]
+        consistent = True
+        while stack and consistent:
+            group_idx = stack.pop()
+            for idx in groups[group_idx]:
+                for other in var_groups[idx]:
+                    if other == group_idx: continue
+                    if other not in side:
+                        side[other] = not side[group_idx]
+                        stack.append(other)
+                    elif side[other] == side[group_idx]:
+                        consistent = False
+        if not consistent or len(side) != len(groups): return None
+        if all(is_source(g) if side[g] else is_sink(g) for g in side): break
+    else:
+        return None
+
+    sources = [g for g in range(len(groups)) if side[g]]
+    sinks = [g for g in range(len(groups)) if not side[g]]
+    if len(sources)*len(sinks) != var_count: return None
+    row_of = {g: row for row, g in enumerate(sources)}
+    col_of = {g: col for col, g in enumerate(sinks)}
+
+    costs = [[None for _ in sinks] for _ in sources]
+    cells = []
+    for idx, var_group in enumerate(var_groups):
+        source, sink = var_group if side[var_group[0]] else var_group[::-1]
+        row, col = row_of[source], col_of[sink]
+        if costs[row][col] != None: return None
+        costs[row][col] = goal_function[idx]
+        cells.append((row, col))
+
+    supplies = [bounds[groups[g]][1] for g in sources]
+    demands = [bounds[groups[g]][0] for g in sinks]
+
+    # Sources which have to ship all their supply make the problem balanced.
+    if any(bounds[groups[g]][0] > 0 for g in sources) and sum(supplies) != sum(demands):
+        return None
+
+    return supplies, demands, costs, cells
+
+
+def solve_structured_problem(
+        goal_function: list[float],
+        constraints: list[list[float]],
+        inequalities: list[str] | None = None,
+        mode = Mode.MAXIMIZATION,
+) -> tuple[list[float], float]:
+    """
+    Returns the solution of the given problem in the same form as
+    `solve_problem`. Transportation problems (see `get_transportation`) are
+    solved by `solve_transportation` and assignment problems, whose supplies
+    and demands are all 1, by `solve_assignment`. Other problems are solved by
+    `solve_problem`.
+    """
+
+    if inequalities is None:
+        inequalities = ["<="] * len(constraints)
+    leq_constraints = apply_inequalities(constraints, inequalities)
+
+    problem = get_transportation(goal_function, leq_constraints, mode)
+    if problem == None:
+        return solve_problem(goal_function, constraints, inequalities, mode)
+    supplies, demands, costs, cells = problem
+
+    if all(x == 1 for x in supplies + demands) and len(supplies) >= len(demands):
+        # Assign the sinks to distinct sources.
+        transposed = [list(col) for col in zip(*costs)]
+        assignment, value = solve_assignment(transposed, mode)
+        solution = [assignment[col*len(supplies) + row] for row, col in cells]
+        return solution, value
+
+    shipments, value = solve_transportation(supplies, demands, costs, mode)
+    if value == math.inf:
+        return [math.inf for _ in goal_function], math.inf
+
+    solution = [shipments[row*len(demands) + col] for row, col in cells]
+    return solution, value